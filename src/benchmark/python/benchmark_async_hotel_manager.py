@@ -0,0 +1,81 @@
+"""Benchmark of AsyncHotelManager: 10k concurrent reservation coroutines,
+coalesced into batches, against the same reservations made with a
+run_in_executor call each. It also measures the longest time the event loop
+was blocked, with a coroutine that wakes up every millisecond.
+Run with src/main/python in the PYTHONPATH"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+# pylint: disable=import-error
+from uc3m_travel import AsyncHotelManager, HotelManager
+from uc3m_travel.attributes.attribute_id_card import IdCard
+from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
+
+
+def reservation(number):
+    """arguments of a reservation for the id card of the number"""
+    return {"credit_card": "5105105105105100", "name_surname": "JOSE LOPEZ",
+            "id_card": f"{number:08d}{IdCard.DNI_LETTERS[number % 23]}",
+            "phone_number": "+341234567", "room_type": "SINGLE",
+            "arrival_date": "01/07/2024", "num_days": 1}
+
+
+async def loop_lag(stop):
+    """longest delay of a 1 ms sleep while the reservations run"""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        worst = max(worst, time.perf_counter() - start - 0.001)
+    return worst
+
+
+async def coalesced(coroutines):
+    """reservations awaited on AsyncHotelManager"""
+    stop = asyncio.Event()
+    lag = asyncio.create_task(loop_lag(stop))
+    async with AsyncHotelManager() as manager:
+        await asyncio.gather(*[manager.room_reservation(**reservation(number))
+                               for number in range(coroutines)])
+    stop.set()
+    return manager.batches, await lag
+
+
+async def one_by_one(coroutines):
+    """reservations made with an executor call each"""
+    stop = asyncio.Event()
+    lag = asyncio.create_task(loop_lag(stop))
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[loop.run_in_executor(
+        None, lambda number=number: HotelManager().room_reservation(
+            **reservation(number))) for number in range(coroutines)])
+    stop.set()
+    return coroutines, await lag
+
+
+def run(function, coroutines):
+    """reservations per second, store writes and loop lag of a run on an
+    empty store"""
+    with tempfile.TemporaryDirectory() as directory:
+        ReservationStoreJson._file_name = os.path.join(  # pylint: disable=protected-access
+            directory, "store_reservation.json")
+        start = time.perf_counter()
+        writes, lag = asyncio.run(function(coroutines))
+        elapsed = time.perf_counter() - start
+    return coroutines / elapsed, writes, lag
+
+
+def main(coroutines=10000, baseline=1000):
+    """prints the results of both ways of making the reservations"""
+    print(f"{'method':<28}{'coroutines':>11}{'reservations/s':>16}"
+          f"{'writes':>8}{'max loop lag (ms)':>19}")
+    for name, function, count in (("AsyncHotelManager", coalesced, coroutines),
+                                  ("run_in_executor per call", one_by_one, baseline)):
+        throughput, writes, lag = run(function, count)
+        print(f"{name:<28}{count:>11}{throughput:>16.0f}{writes:>8}{lag * 1000:>19.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
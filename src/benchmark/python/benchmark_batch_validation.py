@@ -0,0 +1,57 @@
+"""Benchmark of the column wise validation of credit cards and id cards:
+throughput of the NumPy batch validation against the class level
+validators called value by value.
+Run with src/main/python in the PYTHONPATH"""
+import random
+import sys
+import time
+# pylint: disable=import-error
+from uc3m_travel.attributes.attribute_credit_card import CreditCard
+from uc3m_travel.attributes.attribute_id_card import IdCard
+from uc3m_travel.attributes.batch_validation import (validate_credit_cards,
+                                                     validate_id_cards,
+                                                     numpy_available)
+
+
+def random_column(rows, seed=1):
+    """credit card numbers and dni, one in ten with a wrong check digit"""
+    generator = random.Random(seed)
+    cards = []
+    id_cards = []
+    for _ in range(rows):
+        cards.append(str(generator.randrange(10 ** 15, 10 ** 16)))
+        number = generator.randrange(10 ** 8)
+        letter = IdCard.DNI_LETTERS[number % 23]
+        if generator.random() < 0.1:
+            letter = IdCard.DNI_LETTERS[(number + 1) % 23]
+        id_cards.append(f"{number:08d}{letter}")
+    return cards, id_cards
+
+
+def best_time(function, values, repeat=3):
+    """best time of the function over the column in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(values)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(rows=1000000):
+    """prints the rows per second of both validations"""
+    if not numpy_available():
+        print("NumPy is not installed: the batch validation checks the values one by one")
+    cards, id_cards = random_column(rows)
+    print(f"{'column':<14}{'one by one (rows/s)':>22}{'batch (rows/s)':>18}{'speedup':>10}")
+    for name, attribute, batch, values in (
+            ("credit_card", CreditCard, validate_credit_cards, cards),
+            ("id_card", IdCard, validate_id_cards, id_cards)):
+        before = best_time(attribute.validate_many, values, repeat=1)
+        after = best_time(batch, values)
+        print(f"{name:<14}{rows / before:>22,.0f}{rows / after:>18,.0f}"
+              f"{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
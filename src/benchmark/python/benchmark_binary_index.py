@@ -0,0 +1,65 @@
+"""Benchmark of the room key lookup of guest_checkout: time per probe in
+the memory mapped binary index of the check in store against streaming the
+json store, and the cost of building the index.
+Run with src/main/python in the PYTHONPATH"""
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import iter_json_array
+from uc3m_travel.storage.binary_index import StayBinaryIndex
+
+
+def stay(number):
+    """a check in store item"""
+    return {"_HotelStay__algorithm": "SHA-256",
+            "_HotelStay__type": "SINGLE",
+            "_HotelStay__idcard": "12345678Z",
+            "_HotelStay__localizer": hashlib.md5(str(number).encode()).hexdigest(),
+            "_HotelStay__arrival": 1719838800.0,
+            "_HotelStay__departure": 1719925200.0,
+            "_HotelStay__room_key": hashlib.sha256(str(number).encode()).hexdigest()}
+
+
+def scan(store_file, room_key):
+    """the lookup streaming the json store"""
+    for item in iter_json_array(store_file):
+        if item["_HotelStay__room_key"] == room_key:
+            return item
+    return None
+
+
+def main(sizes=(1000, 10000, 100000), probes=200):
+    """prints build time and time per probe for each store size"""
+    print(f"{'stays':>8}{'build ms':>10}{'index us/probe':>16}{'scan us/probe':>15}")
+    generator = random.Random(1)
+    with tempfile.TemporaryDirectory() as directory:
+        store_file = os.path.join(directory, "store_check_in.json")
+        for size in sizes:
+            JsonStore.write_json(store_file, [stay(number) for number in range(size)])
+            room_keys = [stay(generator.randrange(size))["_HotelStay__room_key"]
+                         for _ in range(probes)]
+            start = time.perf_counter()
+            with StayBinaryIndex(store_file) as index:
+                index.rebuild()
+            build = time.perf_counter() - start
+            with StayBinaryIndex(store_file) as index:
+                index.load()
+                start = time.perf_counter()
+                for room_key in room_keys:
+                    index.find(room_key)
+                probe = (time.perf_counter() - start) / probes
+            start = time.perf_counter()
+            for room_key in room_keys[:5]:
+                scan(store_file, room_key)
+            scanned = (time.perf_counter() - start) / 5
+            print(f"{size:>8}{build * 1000:>10.1f}{probe * 1e6:>16.1f}"
+                  f"{scanned * 1e6:>15.0f}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(argument) for argument in sys.argv[1:]) or (1000, 10000, 100000))
@@ -0,0 +1,59 @@
+"""Benchmark of the schema versions of the reservation store: size of the
+file and time of writing it, loading it, streaming it and loading it as
+immutable records, for the legacy (indented, long keys) and the compact
+(short keys) schema.
+Run with src/main/python in the PYTHONPATH"""
+import os
+import sys
+import tempfile
+import time
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import iter_store_file
+from uc3m_travel.storage.schema import LEGACY_SCHEMA, COMPACT_SCHEMA
+from uc3m_travel.storage.records import ReservationRecord
+
+
+def reservations(records):
+    """the given number of reservation store items"""
+    return [{"_HotelReservation__localizer": f"{number:032x}",
+             "_HotelReservation__id_card": f"{number:08d}Z",
+             "_HotelReservation__credit_card_number": "5105105105105100",
+             "_HotelReservation__arrival": "01/07/2024",
+             "_HotelReservation__reservation_date": 1714579200.0 + number,
+             "_HotelReservation__name_surname": "JOSE LOPEZ",
+             "_HotelReservation__phone_number": "+341234567",
+             "_HotelReservation__room_type": "SINGLE",
+             "_HotelReservation__num_days": 1 + number % 10}
+            for number in range(records)]
+
+
+def timed(function, *args, **kwargs):
+    """seconds taken by the function"""
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(records=100000):
+    """writes, loads and streams a store of each schema version"""
+    store_list = reservations(records)
+    print(f"{records} reservations")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, version in (("legacy", LEGACY_SCHEMA), ("compact", COMPACT_SCHEMA)):
+            store_file = os.path.join(directory, f"store_reservation_{version}.json")
+            write = timed(JsonStore.write_json, store_file, store_list,
+                          schema_version=version)
+            JsonStore.clear_cache()
+            load = timed(JsonStore.load_json_store, store_file)
+            JsonStore.clear_cache()
+            stream = timed(lambda file: sum(1 for _ in iter_store_file(file)),
+                           store_file)
+            records = timed(JsonStore.load_records, store_file, ReservationRecord)
+            print(f"{name:>8}: {os.path.getsize(store_file) / 2 ** 20:7.1f} MB "
+                  f"write {write:6.2f} s load {load:6.2f} s stream {stream:6.2f} s "
+                  f"records {records:6.2f} s")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
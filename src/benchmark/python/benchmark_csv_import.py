@@ -0,0 +1,44 @@
+"""Benchmark of the bulk CSV import of reservations: rows per second with
+1, 2 and 4 worker processes, and the peak memory of the writer process.
+Run with src/main/python in the PYTHONPATH"""
+import os
+import resource
+import sys
+import tempfile
+import time
+# pylint: disable=import-error
+from uc3m_travel.attributes.attribute_id_card import IdCard
+from uc3m_travel.reservation_csv_importer import import_reservations_csv
+from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
+
+
+def write_csv(csv_file, rows):
+    """a CSV file of valid reservations, each one with its own id card"""
+    with open(csv_file, "w", encoding="utf-8", newline="") as file:
+        file.write("CREDIT_CARD_NUMBER,ID_CARD,NAME_SURNAME,PHONE_NUMBER,"
+                   "ROOM_TYPE,ARRIVAL,NUM_DAYS\n")
+        for number in range(rows):
+            file.write(f"5105105105105100,{number:08d}{IdCard.DNI_LETTERS[number % 23]},"
+                       f"JOSE LOPEZ,+341234567,SINGLE,01/07/2024,{number % 10 + 1}\n")
+
+
+def main(rows=20000, chunk_size=1000):
+    """prints the throughput of each number of processes"""
+    print(f"{os.cpu_count()} cpus, {rows} rows, chunks of {chunk_size}")
+    print(f"{'processes':>10}{'rows/s':>10}{'imported':>10}{'peak rss (MB)':>15}")
+    with tempfile.TemporaryDirectory() as directory:
+        csv_file = os.path.join(directory, "reservations.csv")
+        write_csv(csv_file, rows)
+        for processes in (1, 2, 4):
+            ReservationStoreJson._file_name = os.path.join(  # pylint: disable=protected-access
+                directory, f"store_reservation_{processes}.json")
+            start = time.perf_counter()
+            summary = import_reservations_csv(csv_file, chunk_size, processes)
+            elapsed = time.perf_counter() - start
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{processes:>10}{rows / elapsed:>10.0f}{summary['imported']:>10}"
+                  f"{peak:>15.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
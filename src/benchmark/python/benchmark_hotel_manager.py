@@ -0,0 +1,203 @@
+"""Benchmark suite of the HotelManager entry points (room_reservation,
+guest_arrival and guest_checkout) against the size of the stores. For each
+size and storage mode the reservation, check in and checkout stores are
+seeded in a temporary directory with the synthetic data generator and every
+operation is timed call by call: latency percentiles and throughput are
+printed and written as json, so the runs of two versions or two storage
+modes can be compared.
+Run with src/main/python in the PYTHONPATH:
+    python benchmark_hotel_manager.py --sizes 1000 10000 --output results.json"""
+import argparse
+import json
+import math
+import os
+import platform
+import tempfile
+import time
+from datetime import date, datetime
+# pylint: disable=import-error
+from uc3m_travel import HotelManager, FixedClock
+from uc3m_travel.attributes.attribute_id_card import IdCard
+from uc3m_travel.storage.json_store import JsonStore, JSON_FORMAT, JSONL_FORMAT
+from uc3m_travel.storage.schema import LEGACY_SCHEMA, COMPACT_SCHEMA
+from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
+from uc3m_travel.storage.stay_json_store import StayStoreJson
+from uc3m_travel.storage.checkout_json_store import CheckoutStoreJson
+from uc3m_travel.storage.sqlite_store import SqliteStore
+from uc3m_travel.storage.sqlite_migration import migrate_json_stores
+from uc3m_travel.synthetic_data import SyntheticData, write_stores
+
+SIZES = (1000, 10000, 100000, 1000000)
+# storage mode -> (backend, json storage mode, schema version)
+MODES = {"json": ("json", JSON_FORMAT, LEGACY_SCHEMA),
+         "jsonl": ("json", JSONL_FORMAT, LEGACY_SCHEMA),
+         "compact": ("json", JSON_FORMAT, COMPACT_SCHEMA),
+         "sqlite": ("sqlite", JSON_FORMAT, LEGACY_SCHEMA)}
+OPERATIONS = ("room_reservation", "guest_arrival", "guest_checkout")
+PERCENTILES = (50, 90, 99)
+
+RESERVATION_TIME = datetime(2024, 3, 22, 13, 0, 0)
+ARRIVAL_TIME = datetime(2024, 7, 1, 13, 0, 0)
+DEPARTURE_TIME = datetime(2024, 7, 2, 11, 0, 0)
+# the guests of the benchmark have id cards out of the range of the seeded ones
+FIRST_GUEST = 90000000
+
+
+def id_card(number):
+    """a valid id card for the number"""
+    return f"{number:08d}{IdCard.DNI_LETTERS[number % 23]}"
+
+
+def use_directory(directory):
+    """points the stores of every backend to the directory. Returns the
+    files they had, to restore them"""
+    # pylint: disable=protected-access
+    previous = (ReservationStoreJson._file_name, StayStoreJson._file_name,
+                CheckoutStoreJson._file_name, CheckoutStoreJson._stay_file_name,
+                SqliteStore._db_file)
+    ReservationStoreJson._file_name = os.path.join(directory, "store_reservation.json")
+    StayStoreJson._file_name = os.path.join(directory, "store_check_in.json")
+    CheckoutStoreJson._file_name = os.path.join(directory, "store_check_out.json")
+    CheckoutStoreJson._stay_file_name = StayStoreJson._file_name
+    SqliteStore._db_file = os.path.join(directory, "store_hotel.db")
+    return previous
+
+
+def restore_files(previous):
+    """points the stores back to the files of use_directory"""
+    # pylint: disable=protected-access
+    (ReservationStoreJson._file_name, StayStoreJson._file_name,
+     CheckoutStoreJson._file_name, CheckoutStoreJson._stay_file_name,
+     SqliteStore._db_file) = previous
+
+
+def seed_stores(directory, size, mode):
+    """writes the stores of size reservations (half of the guests arrived
+    and half of those left) in the directory for the mode"""
+    reservations, stays, checkouts, _ = SyntheticData(
+        first_arrival=date(2024, 1, 1)).store_records(size)
+    write_stores(directory, reservations, stays, checkouts)
+    if MODES[mode][0] == "sqlite":
+        migrate_json_stores(directory + os.sep)
+    JsonStore.clear_cache()
+
+
+def percentile(latencies, rank):
+    """nearest rank percentile of the sorted latencies"""
+    return latencies[max(math.ceil(rank / 100 * len(latencies)) - 1, 0)]
+
+
+def summary(operation, latencies):
+    """statistics in ms of the latencies in seconds of an operation"""
+    latencies = sorted(latencies)
+    result = {"operation": operation, "calls": len(latencies),
+              "mean_ms": sum(latencies) / len(latencies) * 1000,
+              "max_ms": latencies[-1] * 1000,
+              "throughput_per_s": len(latencies) / sum(latencies)}
+    for rank in PERCENTILES:
+        result[f"p{rank}_ms"] = percentile(latencies, rank) * 1000
+    return result
+
+
+def timed(calls):
+    """seconds taken by each of the calls"""
+    latencies = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_operations(directory, calls):
+    """latencies of the calls of each operation on the seeded stores: new
+    reservations, the arrival of those guests and their checkout"""
+    manager = HotelManager()
+    guests = range(FIRST_GUEST, FIRST_GUEST + calls)
+    manager.set_clock(FixedClock(RESERVATION_TIME))
+    localizers = []
+    latencies = {"room_reservation": timed(
+        lambda number=number: localizers.append(manager.room_reservation(
+            credit_card="5105105105105100", name_surname="JOSE LOPEZ",
+            id_card=id_card(number), phone_number="+341234567",
+            room_type="SINGLE", arrival_date="01/07/2024", num_days=1))
+        for number in guests)}
+
+    arrival_files = []
+    for number, localizer in zip(guests, localizers):
+        arrival_files.append(os.path.join(directory, f"arrival_{number}.json"))
+        with open(arrival_files[-1], "w", encoding="utf-8") as file:
+            json.dump({"Localizer": localizer, "IdCard": id_card(number)}, file)
+    manager.set_clock(FixedClock(ARRIVAL_TIME))
+    room_keys = []
+    latencies["guest_arrival"] = timed(
+        lambda file_name=file_name: room_keys.append(manager.guest_arrival(file_name))
+        for file_name in arrival_files)
+
+    manager.set_clock(FixedClock(DEPARTURE_TIME))
+    latencies["guest_checkout"] = timed(
+        lambda room_key=room_key: manager.guest_checkout(room_key)
+        for room_key in room_keys)
+    return latencies
+
+
+def run_benchmark(size, mode, calls):
+    """results of every operation on stores of the size in the mode"""
+    backend, storage_mode, schema_version = MODES[mode]
+    with tempfile.TemporaryDirectory() as directory:
+        previous = use_directory(directory)
+        JsonStore.storage_mode = storage_mode
+        JsonStore.schema_version = schema_version
+        HotelManager().set_storage_backend(backend)
+        try:
+            start = time.perf_counter()
+            seed_stores(directory, size, mode)
+            seed_seconds = time.perf_counter() - start
+            latencies = run_operations(directory, calls)
+        finally:
+            HotelManager().set_storage_backend("json")
+            HotelManager().set_clock(None)
+            JsonStore.storage_mode = JSON_FORMAT
+            JsonStore.schema_version = LEGACY_SCHEMA
+            JsonStore.clear_cache()
+            restore_files(previous)
+    return [dict(summary(operation, latencies[operation]), mode=mode,
+                 store_size=size, seed_s=seed_seconds) for operation in OPERATIONS]
+
+
+def main(argv=None):
+    """runs the suite, prints the results and writes them as json"""
+    parser = argparse.ArgumentParser(
+        description="Latency and throughput of the HotelManager operations "
+                    "against the size of the stores")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES),
+                        help="records of the seeded stores")
+    parser.add_argument("--modes", nargs="+", choices=sorted(MODES),
+                        default=["json", "jsonl"], help="storage modes compared")
+    parser.add_argument("--calls", type=int, default=50,
+                        help="calls of each operation")
+    parser.add_argument("--output", help="json file of the results")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'mode':>8}{'size':>9}{'operation':>18}{'p50 ms':>9}{'p90 ms':>9}"
+          f"{'p99 ms':>9}{'max ms':>9}{'ops/s':>9}")
+    for mode in args.modes:
+        for size in args.sizes:
+            for result in run_benchmark(size, mode, args.calls):
+                results.append(result)
+                print(f"{mode:>8}{size:>9}{result['operation']:>18}"
+                      f"{result['p50_ms']:>9.2f}{result['p90_ms']:>9.2f}"
+                      f"{result['p99_ms']:>9.2f}{result['max_ms']:>9.2f}"
+                      f"{result['throughput_per_s']:>9.1f}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"python": platform.python_version(),
+                       "platform": platform.platform(),
+                       "date": datetime.now().isoformat(timespec="seconds"),
+                       "calls": args.calls,
+                       "results": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark of the memory taken by the reservations loaded from the store:
+peak memory and time of json.load (a dict per reservation) against the
+streaming reader decoding each reservation into a ReservationRecord.
+Run with src/main/python in the PYTHONPATH"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.records import ReservationRecord
+
+
+def write_store(store_file, records):
+    """a reservation store of the given number of records"""
+    with open(store_file, "w", encoding="utf-8", newline="") as file:
+        json.dump([{"_HotelReservation__localizer": f"{number:032x}",
+                    "_HotelReservation__id_card": f"{number:08d}Z",
+                    "_HotelReservation__credit_card_number": "5105105105105100",
+                    "_HotelReservation__arrival": "01/07/2024",
+                    "_HotelReservation__reservation_date": 1714579200.0 + number,
+                    "_HotelReservation__name_surname": "JOSE LOPEZ",
+                    "_HotelReservation__phone_number": "+341234567",
+                    "_HotelReservation__room_type": "SINGLE",
+                    "_HotelReservation__num_days": 1 + number % 10}
+                   for number in range(records)], file)
+
+
+def load_dicts(store_file):
+    """the reservations as json.load returns them"""
+    with open(store_file, "r", encoding="utf-8", newline="") as file:
+        return json.load(file)
+
+
+def load_records(store_file):
+    """the reservations as records"""
+    return JsonStore.load_records(store_file, ReservationRecord)
+
+
+def measure(function, store_file):
+    """seconds and peak MB of loading the store"""
+    start = time.perf_counter()
+    loaded = function(store_file)
+    seconds = time.perf_counter() - start
+    del loaded
+    tracemalloc.start()
+    loaded = function(store_file)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return seconds, peak / 2 ** 20
+
+
+def main(records=1000000):
+    """loads a store of the given number of reservations both ways"""
+    with tempfile.TemporaryDirectory() as directory:
+        store_file = os.path.join(directory, "store_reservation.json")
+        write_store(store_file, records)
+        print(f"{records} reservations, "
+              f"{os.path.getsize(store_file) / 2 ** 20:.1f} MB store")
+        for name, function in (("json.load", load_dicts),
+                               ("records", load_records)):
+            seconds, peak = measure(function, store_file)
+            print(f"{name:>10}: {seconds:7.2f} s {peak:9.1f} MB peak")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,85 @@
+"""Benchmark of the capacity check of a reservation and of the availability
+of the next 90 days as the reservation store grows, with the per night
+occupancy index against counting the reservations of the store that
+overlap each night. Run with src/main/python in the PYTHONPATH"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+# pylint: disable=import-error
+from uc3m_travel.room_inventory import RoomInventory, ROOM_TYPES
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import iter_store_file
+from uc3m_travel.storage.occupancy_index import OccupancyIndex, reservation_nights
+
+FIRST_DAY = date(2024, 1, 1)
+
+
+def reservation(number):
+    """a reservation store item"""
+    arrival = FIRST_DAY + timedelta(days=number % 365)
+    return {"_HotelReservation__localizer": hashlib.md5(str(number).encode()).hexdigest(),
+            "_HotelReservation__id_card": "12345678Z",
+            "_HotelReservation__room_type": ROOM_TYPES[number % 3],
+            "_HotelReservation__arrival": arrival.strftime("%d/%m/%Y"),
+            "_HotelReservation__num_days": 1 + number % 10}
+
+
+def scan_occupied(file_store, room_type, nights):
+    """rooms of the type reserved for each night, scanning the store"""
+    occupied = dict.fromkeys(nights, 0)
+    for item in iter_store_file(file_store):
+        if item["_HotelReservation__room_type"] != room_type:
+            continue
+        for night in reservation_nights(item["_HotelReservation__arrival"],
+                                        item["_HotelReservation__num_days"]):
+            if night in occupied:
+                occupied[night] += 1
+    return occupied
+
+
+def main(sizes=(1000, 10000, 100000), repeats=20):
+    """prints the time of a capacity check and of the 90 days availability"""
+    inventory = RoomInventory({room_type: 10 ** 6 for room_type in ROOM_TYPES})
+    start = FIRST_DAY + timedelta(days=180)
+    print(f"{'size':>8}{'scan ms':>10}{'book ms':>10}{'load ms':>10}{'90 days ms':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        file_store = os.path.join(directory, "store_reservation.json")
+        for size in sizes:
+            JsonStore.write_json(file_store, [reservation(number)
+                                              for number in range(size)])
+            index = OccupancyIndex(lambda: [file_store],
+                                   OccupancyIndex.index_file_of(file_store),
+                                   inventory).load()
+
+            begin = time.perf_counter()
+            scan_occupied(file_store, "SINGLE", reservation_nights(
+                start.strftime("%d/%m/%Y"), 10))
+            scan = time.perf_counter() - begin
+
+            begin = time.perf_counter()
+            for _ in range(repeats):
+                index.book("SINGLE", start.strftime("%d/%m/%Y"), 10)
+            book = (time.perf_counter() - begin) / repeats
+
+            JsonStore.clear_cache()
+            begin = time.perf_counter()
+            index = OccupancyIndex(lambda: [file_store],
+                                   OccupancyIndex.index_file_of(file_store),
+                                   inventory).load()
+            load = time.perf_counter() - begin
+
+            begin = time.perf_counter()
+            for _ in range(repeats):
+                index.availability(start, 90)
+            availability = (time.perf_counter() - begin) / repeats
+            print(f"{size:>8}{scan * 1000:>10.2f}{book * 1000:>10.3f}"
+                  f"{load * 1000:>10.2f}{availability * 1000:>12.2f}")
+            for file_name in os.listdir(directory):
+                os.remove(os.path.join(directory, file_name))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""Benchmark of guest_checkout as the history of stays grows, with all the
+old stays in the check in store or moved to the archives. Each checkout
+follows the arrival of its stay, as in the hotel, that merges the stay
+into the binary indexes of the check in store. In json mode every checkout
+also writes the whole checkout store again, that grows in both cases.
+Run with src/main/python in the PYTHONPATH"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+# pylint: disable=import-error
+from uc3m_travel.clock import FixedClock
+from uc3m_travel.storage.json_store import JsonStore, JSON_FORMAT, JSONL_FORMAT
+from uc3m_travel.storage.checkout_json_store import CheckoutStoreJson
+from uc3m_travel.storage.stay_json_store import StayStoreJson
+from uc3m_travel.hotel_stay import HotelStay
+from uc3m_travel.storage.binary_index import CheckoutBinaryIndex
+from uc3m_travel.storage.stay_archive import archive_stays
+
+DEPARTURE = 1719925200.0
+
+
+def stay(number):
+    """a check in store item"""
+    return {"_HotelStay__algorithm": "SHA-256",
+            "_HotelStay__type": "SINGLE",
+            "_HotelStay__idcard": "12345678Z",
+            "_HotelStay__localizer": hashlib.md5(str(number).encode()).hexdigest(),
+            "_HotelStay__arrival": DEPARTURE - 86400,
+            "_HotelStay__departure": DEPARTURE,
+            "_HotelStay__room_key": hashlib.sha256(str(number).encode()).hexdigest()}
+
+
+def checkout_latency(directory, history, archived, checkouts):
+    """mean seconds of a checkout after its arrival with the given number
+    of stays already checked out"""
+    checkout_store = CheckoutStoreJson(
+        clock=FixedClock(datetime.fromtimestamp(DEPARTURE)),
+        file_name=os.path.join(directory, "store_check_out.json"),
+        stay_file_name=os.path.join(directory, "store_check_in.json"))
+    stay_file = checkout_store.store_file(os.path.join(directory, "store_check_in.json"))
+    checkout_file = checkout_store.store_file()
+    old_stays = [stay(number) for number in range(history)]
+    JsonStore.write_json(stay_file, old_stays)
+    JsonStore.write_json(checkout_file, [
+        {"room_key": item["_HotelStay__room_key"], "checkout_time": DEPARTURE}
+        for item in old_stays])
+    if archived:
+        archive_stays(stay_file, checkout_file)
+    # the index of the checkouts is kept up to date by each checkout, it is
+    # only built once
+    with CheckoutBinaryIndex(checkout_file) as index:
+        index.load()
+    elapsed = 0.0
+    stay_store = StayStoreJson(clock=FixedClock(datetime.fromtimestamp(DEPARTURE - 86400)),
+                               file_name=os.path.join(directory, "store_check_in.json"))
+    for number in range(history, history + checkouts):
+        new_stay = HotelStay(idcard="12345678Z", numdays=1, roomtype="SINGLE",
+                             localizer=stay(number)["_HotelStay__localizer"],
+                             clock=stay_store.clock)
+        stay_store.add_checkins([new_stay], [None])
+        start = time.perf_counter()
+        checkout_store.save_checkout(new_stay.room_key)
+        elapsed += time.perf_counter() - start
+    for file_name in os.listdir(directory):
+        os.remove(os.path.join(directory, file_name))
+    return elapsed / checkouts
+
+
+def main(sizes=(1000, 10000, 100000), checkouts=20):
+    """prints the checkout latency for each history size"""
+    print(f"{'mode':>6}{'history':>9}{'hot ms':>10}{'archived ms':>13}")
+    with tempfile.TemporaryDirectory() as directory:
+        for storage_mode in (JSON_FORMAT, JSONL_FORMAT):
+            JsonStore.storage_mode = storage_mode
+            for size in sizes:
+                hot = checkout_latency(directory, size, False, checkouts)
+                archived = checkout_latency(directory, size, True, checkouts)
+                print(f"{storage_mode:>6}{size:>9}{hot * 1000:>10.2f}"
+                      f"{archived * 1000:>13.2f}")
+    JsonStore.storage_mode = JSON_FORMAT
+
+
+if __name__ == "__main__":
+    main(tuple(int(argument) for argument in sys.argv[1:]) or (1000, 10000, 100000))
@@ -0,0 +1,67 @@
+"""Benchmark of the lock contention of the json stores: reservations per
+second when 1, 2, 4 and 8 worker processes make reservations at the same
+time in the same store, in json (the whole store is rewritten) and jsonl
+(the new record is appended) mode. The same number of reservations is
+split among the processes, so every run ends with a store of the same
+size. It also checks that no reservation is lost.
+Run with src/main/python in the PYTHONPATH"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+# pylint: disable=import-error
+from uc3m_travel import HotelManager
+from uc3m_travel.attributes.attribute_id_card import IdCard
+from uc3m_travel.storage.json_store import JsonStore, JSON_FORMAT
+from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
+
+
+def make_reservations(store_file, storage_mode, worker, count):
+    """the reservations of a worker process, each one with its own id card"""
+    ReservationStoreJson._file_name = store_file  # pylint: disable=protected-access
+    JsonStore.storage_mode = storage_mode
+    for number in range(worker * count, (worker + 1) * count):
+        HotelManager().room_reservation(
+            credit_card="5105105105105100", name_surname="JOSE LOPEZ",
+            id_card=f"{number:08d}{IdCard.DNI_LETTERS[number % 23]}",
+            phone_number="+341234567", room_type="SINGLE",
+            arrival_date="01/07/2024", num_days=1)
+
+
+def run(storage_mode, processes, count):
+    """reservations per second of the given number of processes and the
+    number of reservations saved"""
+    context = multiprocessing.get_context("fork")
+    with tempfile.TemporaryDirectory() as directory:
+        store_file = os.path.join(directory, "store_reservation.json")
+        workers = [context.Process(target=make_reservations,
+                                   args=(store_file, storage_mode, worker, count))
+                   for worker in range(processes)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        JsonStore.storage_mode = storage_mode
+        saved = len(JsonStore.load_json_store(
+            ReservationStoreJson().store_file(store_file)))
+        JsonStore.storage_mode = JSON_FORMAT
+    return processes * count / elapsed, saved
+
+
+def main(total=800):
+    """prints the throughput of each mode and number of processes"""
+    print(f"{os.cpu_count()} cpus")
+    print(f"{'mode':<7}{'processes':>10}{'reservations/s':>16}{'saved':>8}{'lost':>6}")
+    for storage_mode in ("json", "jsonl"):
+        for processes in (1, 2, 4, 8):
+            count = total // processes
+            throughput, saved = run(storage_mode, processes, count)
+            print(f"{storage_mode:<7}{processes:>10}{throughput:>16.0f}"
+                  f"{saved:>8}{processes * count - saved:>6}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 800)
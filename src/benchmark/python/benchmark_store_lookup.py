@@ -0,0 +1,72 @@
+"""Benchmark of the lookup of a reservation in the json array store: peak
+memory and time of json.load and a scan against the streaming reader, for
+the first and the last reservation of stores of growing size.
+Run with src/main/python in the PYTHONPATH"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+# pylint: disable=import-error
+from uc3m_travel.storage.json_stream import iter_json_array
+
+
+def write_store(store_file, records):
+    """a reservation store of the given number of records"""
+    with open(store_file, "w", encoding="utf-8", newline="") as file:
+        json.dump([{"_HotelReservation__localizer": f"{number:032x}",
+                    "_HotelReservation__id_card": f"{number:08d}Z",
+                    "_HotelReservation__name_surname": "JOSE LOPEZ",
+                    "_HotelReservation__arrival": "01/07/2024"}
+                   for number in range(records)], file, indent=2)
+
+
+def load_and_scan(store_file, localizer):
+    """the lookup as it was: json.load of the whole store and a scan"""
+    with open(store_file, "r", encoding="utf-8", newline="") as file:
+        for item in json.load(file):
+            if item["_HotelReservation__localizer"] == localizer:
+                return item
+    return None
+
+
+def stream(store_file, localizer):
+    """the lookup with the streaming reader"""
+    for item in iter_json_array(store_file):
+        if item["_HotelReservation__localizer"] == localizer:
+            return item
+    return None
+
+
+def measure(function, store_file, localizer):
+    """peak traced memory in MB and time in ms (without tracing) of a
+    lookup"""
+    tracemalloc.start()
+    function(store_file, localizer)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    function(store_file, localizer)
+    elapsed = time.perf_counter() - start
+    return peak / 2 ** 20, elapsed * 1000
+
+
+def main(sizes=(1000, 10000, 100000)):
+    """prints memory and time of both lookups"""
+    print(f"{'records':>8}{'target':>8}{'load MB':>10}{'load ms':>10}"
+          f"{'stream MB':>11}{'stream ms':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        store_file = os.path.join(directory, "store_reservation.json")
+        for records in sizes:
+            write_store(store_file, records)
+            for target, number in (("first", 0), ("last", records - 1)):
+                localizer = f"{number:032x}"
+                load_mb, load_ms = measure(load_and_scan, store_file, localizer)
+                stream_mb, stream_ms = measure(stream, store_file, localizer)
+                print(f"{records:>8}{target:>8}{load_mb:>10.1f}{load_ms:>10.1f}"
+                      f"{stream_mb:>11.2f}{stream_ms:>11.1f}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(argument) for argument in sys.argv[1:]) or (1000, 10000, 100000))
@@ -0,0 +1,35 @@
+"""Benchmark of the synthetic data generator: time to generate the
+reservation requests and the reservation, check in and checkout stores of
+growing size, with NumPy and with the random module.
+Run with src/main/python in the PYTHONPATH"""
+import sys
+import time
+from unittest.mock import patch
+# pylint: disable=import-error
+from uc3m_travel import synthetic_data
+from uc3m_travel.synthetic_data import SyntheticData
+
+
+def seconds(function, *args):
+    """seconds taken by a call"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(sizes=(10000, 100000, 1000000)):
+    """prints the generation times of each size"""
+    print(f"{'records':>9}{'generator':>11}{'requests s':>12}{'stores s':>10}")
+    for size in sizes:
+        for name, numpy_module in (("numpy", synthetic_data.np), ("random", None)):
+            if name == "numpy" and numpy_module is None:
+                continue
+            with patch.object(synthetic_data, "np", numpy_module):
+                generator = SyntheticData(seed=1, invalid_fraction=0.01)
+                requests = seconds(generator.reservation_requests, size)
+                stores = seconds(generator.store_records, size)
+            print(f"{size:>9}{name:>11}{requests:>12.2f}{stores:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
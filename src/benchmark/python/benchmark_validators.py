@@ -0,0 +1,99 @@
+"""Benchmark of the attribute validators: cost per call of the previous
+validation (the validators dict, an attribute object and re.compile on
+every call) against the compiled, class level validators.
+Run with src/main/python in the PYTHONPATH"""
+import re
+import timeit
+# pylint: disable=import-error
+from uc3m_travel.hotel_manager import VALIDATORS
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+SAMPLES = {"credit_card": "5105105105105100",
+           "arrival_date": "01/07/2024",
+           "phone_number": "+341234567",
+           "num_days": 3,
+           "localizer": "450a53be9b39944e62e7164ca5f5aadf",
+           "room_key": "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859",
+           "name_surname": "JOSE LOPEZ",
+           "id_card": "12345678Z"}
+
+
+# pylint: disable=too-few-public-methods
+class PreviousAttribute():
+    """attribute validation as it was before the validator engine"""
+    def __init__(self, pattern, error_message, attr_value):
+        self._validation_pattern = pattern
+        self._error_message = error_message
+        self._attr_value = self._validate(attr_value)
+
+    def _validate(self, attr_value):
+        myregex = re.compile(self._validation_pattern)
+        if not myregex.fullmatch(attr_value):
+            raise HotelManagementException(self._error_message)
+        return attr_value
+
+
+def previous_luhn(card_number):
+    """luhn checksum as it was computed before"""
+    def digits_of(card_number_string):
+        return [int(digit) for digit in str(card_number_string)]
+    digits = digits_of(card_number)
+    checksum = sum(digits[-1::-2])
+    for digit in digits[-2::-2]:
+        checksum += sum(digits_of(digit * 2))
+    return checksum % 10 == 0
+
+
+def previous_dni(dni):
+    """dni letter check as it was computed before"""
+    dni_lettter_mapping = {"0": "T", "1": "R", "2": "W", "3": "A",
+                           "4": "G", "5": "M",
+                           "6": "Y", "7": "F", "8": "P", "9": "D",
+                           "10": "X", "11": "B",
+                           "12": "N", "13": "J", "14": "Z", "15": "S",
+                           "16": "Q", "17": "V",
+                           "18": "H", "19": "L", "20": "C", "21": "K",
+                           "22": "E"}
+    return dni[8] == dni_lettter_mapping[str(int(dni[0:8]) % 23)]
+
+
+def previous_validate(attribute, value):
+    """HotelManager.validate as it was before the validator engine"""
+    validators = dict(VALIDATORS)
+    validator = validators.get(attribute)
+    if attribute == "num_days":
+        return value if 1 <= int(value) <= 10 else None
+    # pylint: disable=protected-access
+    result = PreviousAttribute(validator._validation_pattern,
+                               validator._error_message, value)
+    if attribute == "credit_card":
+        previous_luhn(value)
+    if attribute == "id_card":
+        previous_dni(value)
+    return result._attr_value
+
+
+def per_call_ns(statement, number):
+    """best time per call in nanoseconds"""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def main(number=20000):
+    """prints the cost per call of each validator before and after"""
+    print(f"{'attribute':<14}{'before (ns)':>14}{'after (ns)':>14}{'speedup':>10}")
+    for attribute, value in SAMPLES.items():
+        validator = VALIDATORS[attribute]
+        before = per_call_ns(lambda a=attribute, v=value: previous_validate(a, v),
+                             number)
+        after = per_call_ns(lambda c=validator, v=value: c.validate(v), number)
+        print(f"{attribute:<14}{before:>14.0f}{after:>14.0f}{before / after:>9.1f}x")
+    for attribute in ("credit_card", "id_card"):
+        values = [SAMPLES[attribute]] * number
+        many = min(timeit.repeat(lambda a=attribute, v=values:
+                                 VALIDATORS[a].validate_many(v),
+                                 number=1, repeat=5)) / number * 1e9
+        print(f"{attribute + ' many':<14}{'':>14}{many:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 """init file for importing module contents easily from the outside"""
 from .hotel_reservation import HotelReservation
 from .hotel_manager import HotelManager
+from .async_hotel_manager import AsyncHotelManager
 from .hotel_management_exception import HotelManagementException
 from .hotel_management_config import JSON_FILES_PATH, JSON_FILES_GUEST_ARRIVAL
+from .clock import SystemClock, FixedClock, AcceleratedClock
+from .room_inventory import RoomInventory
@@ -0,0 +1,121 @@
+"""Module for the asyncio facade of the hotel manager"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from uc3m_travel.hotel_manager import HotelManager
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+
+class AsyncHotelManager:
+    """Awaitable reservations, arrivals and checkouts. The calls made at
+    the same time are coalesced into calls of the bulk method of
+    HotelManager, up to max_workers of them at once in a bounded thread
+    pool, so the event loop never waits for the stores"""
+    def __init__(self, max_workers=4, max_batch_size=256):
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers,
+                                             thread_name_prefix="hotel-manager")
+        self.__max_workers = max_workers
+        self.__max_batch_size = max_batch_size
+        # pending (item, future) of each bulk method and the tasks that run
+        # its batches
+        self.__pending = {}
+        self.__batches = {}
+        self.__closed = False
+        self.batches = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Rejects new calls, awaits the batches of the pending ones and
+        stops the thread pool, without blocking the event loop"""
+        self.__closed = True
+        await asyncio.gather(*[task for tasks in self.__batches.values()
+                               for task in tasks])
+        self.__executor.shutdown(wait=False)
+
+    def close(self):
+        """Rejects new calls, waits for the running batches and stops the
+        thread pool. It blocks, so in the event loop use aclose"""
+        self.__closed = True
+        self.__executor.shutdown(wait=True)
+
+    # pylint: disable=too-many-arguments
+    async def room_reservation(self, *,
+                               credit_card:str,
+                               name_surname:str,
+                               id_card:str,
+                               phone_number:str,
+                               room_type:str,
+                               arrival_date: str,
+                               num_days:int)->str:
+        """awaitable HotelManager.room_reservation"""
+        result = await self.__coalesce("room_reservations", {
+            "credit_card": credit_card, "name_surname": name_surname,
+            "id_card": id_card, "phone_number": phone_number,
+            "room_type": room_type, "arrival_date": arrival_date,
+            "num_days": num_days})
+        return result["localizer"]
+
+    async def guest_arrival(self, file_input:str)->str:
+        """awaitable HotelManager.guest_arrival"""
+        result = await self.__coalesce("guest_arrival_files", file_input)
+        return result["room_key"]
+
+    async def guest_checkout(self, room_key:str)->bool:
+        """awaitable HotelManager.guest_checkout"""
+        await self.__coalesce("guest_checkouts", room_key)
+        return True
+
+    async def __coalesce(self, bulk_method, item):
+        """adds the item to the next batch of the bulk method and waits for
+        its result"""
+        if self.__closed:
+            raise HotelManagementException("Error: the hotel manager is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.__pending.setdefault(bulk_method, []).append((item, future))
+        tasks = self.__batches.setdefault(bulk_method, set())
+        if len(tasks) < self.__max_workers:
+            task = loop.create_task(self.__run_batches(bulk_method))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        result = await future
+        if "error" in result:
+            raise HotelManagementException(result["error"])
+        return result
+
+    async def __run_batches(self, bulk_method):
+        """runs the pending items of the bulk method, max_batch_size at a
+        time, until there are no more. Up to max_workers of these tasks run
+        at once for each bulk method"""
+        pending = self.__pending[bulk_method]
+        # the calls started with the first one join its batch
+        await asyncio.sleep(0)
+        while pending:
+            batch = pending[:self.__max_batch_size]
+            del pending[:self.__max_batch_size]
+            await self.__run_batch(bulk_method, batch)
+
+    async def __run_batch(self, bulk_method, batch):
+        """runs a batch in the thread pool and hands each result to its
+        caller. If the bulk method fails, each item is run on its own so
+        only the caller of the malformed item gets the exception"""
+        loop = asyncio.get_running_loop()
+        self.batches += 1
+        try:
+            results = await loop.run_in_executor(
+                self.__executor, getattr(HotelManager(), bulk_method),
+                [item for item, _ in batch])
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            if len(batch) > 1:
+                await asyncio.gather(*[self.__run_batch(bulk_method, [entry])
+                                       for entry in batch])
+            elif not batch[0][1].done():
+                batch[0][1].set_exception(exception)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
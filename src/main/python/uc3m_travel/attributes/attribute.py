@@ -4,19 +4,44 @@ from uc3m_travel.hotel_management_exception import HotelManagementException
 
 # pylint: disable=too-few-public-methods
 class Attribute():
-    """Attribute class definition"""
-    def __init__(self):
-        self._validation_pattern = r""
-        self._error_message = ""
-        self._attr_value = ""
+    """Attribute class definition. Each subclass defines its validation
+    pattern and error message as class attributes; the pattern is compiled
+    once, when the subclass is created"""
+    _validation_pattern = r""
+    _error_message = ""
+    _regex = re.compile(_validation_pattern)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._regex = re.compile(cls._validation_pattern)
+
+    def __init__(self, attr_value):
+        self._attr_value = self.validate(attr_value)
+
+    @classmethod
+    def validate(cls, attr_value):
+        """Validates the value without creating an attribute object"""
+        if cls._regex.fullmatch(attr_value) is None:
+            raise HotelManagementException(cls._error_message)
+        return attr_value
+
+    @classmethod
+    def validate_many(cls, attr_values):
+        """Validates many values. Returns, for each value, None if it is
+        valid or the error message"""
+        errors = []
+        for attr_value in attr_values:
+            try:
+                cls.validate(attr_value)
+            except HotelManagementException as exception:
+                errors.append(exception.message)
+            else:
+                errors.append(None)
+        return errors
 
     def _validate(self, attr_value):
         """Attribute validation definition"""
-        myregex = re.compile(self._validation_pattern)
-        regex_matches = myregex.fullmatch(attr_value)
-        if not regex_matches:
-            raise HotelManagementException(self._error_message)
-        return attr_value
+        return self.validate(attr_value)
 
     @property
     def value(self):
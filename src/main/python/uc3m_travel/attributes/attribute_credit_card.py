@@ -2,25 +2,22 @@
 from uc3m_travel.attributes.attribute import Attribute
 from uc3m_travel.hotel_management_exception import HotelManagementException
 
+#pylint: disable=too-few-public-methods
 class CreditCard(Attribute):
     """Definition of attribute CreditCard"""
+    _validation_pattern = r"^[0-9]{16}"
+    _error_message = "Invalid credit card format"
+    # value of each digit in the luhn checksum: as it is, or doubled (and
+    # adding the digits of the double) for every second digit from the right
+    LUHN_DIGITS = {str(digit): digit for digit in range(10)}
+    LUHN_DOUBLES = {str(digit): sum(divmod(digit * 2, 10))
+                    for digit in range(10)}
 
-    #pylint: disable=super-init-not-called, too-few-public-methods
-    def __init__(self, attr_value):
-        """Definition of attribute CreditCard init"""
-        self._validation_pattern = r"^[0-9]{16}"
-        self._error_message = "Invalid credit card format"
-        self._attr_value = self._validate(attr_value)
-
-    def _validate(self, attr_value):
-        super()._validate(attr_value)
-        digits = self.digits_of(attr_value)
-        odd_digits = digits[-1::-2]
-        even_digits = digits[-2::-2]
-        checksum = 0
-        checksum += sum(odd_digits)
-        for digit in even_digits:
-            checksum += sum(self.digits_of(digit * 2))
+    @classmethod
+    def validate(cls, attr_value):
+        super().validate(attr_value)
+        checksum = sum(map(cls.LUHN_DIGITS.__getitem__, attr_value[-1::-2])) + \
+            sum(map(cls.LUHN_DOUBLES.__getitem__, attr_value[-2::-2]))
         if not checksum % 10 == 0:
             raise HotelManagementException(
                 "Invalid credit card number (not luhn)")
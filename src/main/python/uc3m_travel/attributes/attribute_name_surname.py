@@ -2,13 +2,9 @@
 from uc3m_travel.attributes.attribute import Attribute
 
 
+# pylint: disable=too-few-public-methods
 class NameSurname(Attribute):
     """Definition of attribute NameSurname"""
-
-    # pylint: disable=super-init-not-called, too-few-public-methods
-    def __init__(self, attr_value):
-        """Definition of attribute NameSurname init"""
-        self._validation_pattern = r"^(?=^.{10,50}$)([a-zA-Z]+(\s[" \
-                                    r"a-zA-Z]+)+)$"
-        self._error_message = "Invalid name format"
-        self._attr_value = self._validate(attr_value)
+    _validation_pattern = r"^(?=^.{10,50}$)([a-zA-Z]+(\s[" \
+                          r"a-zA-Z]+)+)$"
+    _error_message = "Invalid name format"
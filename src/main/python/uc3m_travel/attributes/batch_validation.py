@@ -0,0 +1,95 @@
+"""Column wise validation of credit cards and id cards. With NumPy the
+luhn checksum and the dni letter of a whole column are computed with array
+arithmetic; without it the values are checked one by one"""
+from uc3m_travel.attributes.attribute_credit_card import CreditCard
+from uc3m_travel.attributes.attribute_id_card import IdCard
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# error codes of the batch validation and the message of the
+# HotelManagementException raised for each of them by the attributes
+VALID = 0
+INVALID_FORMAT = 1
+INVALID_CHECK = 2
+CREDIT_CARD_MESSAGES = (None, CreditCard._error_message,  # pylint: disable=protected-access
+                        "Invalid credit card number (not luhn)")
+ID_CARD_MESSAGES = (None, IdCard._error_message,  # pylint: disable=protected-access
+                    "Invalid IdCard letter")
+
+CREDIT_CARD_LENGTH = 16
+DNI_LENGTH = 9
+
+
+def numpy_available():
+    """True if the batch validation uses NumPy"""
+    return np is not None
+
+
+def error_messages(error_codes, messages):
+    """Returns the message of each error code (None for the valid ones)"""
+    return [messages[code] for code in error_codes]
+
+
+def validate_credit_cards(card_numbers):
+    """Validates a column of credit card numbers. Returns a boolean mask of
+    the valid ones and the error code of each one (VALID, INVALID_FORMAT or
+    INVALID_CHECK for the luhn checksum)"""
+    if np is None:
+        return _validate_one_by_one(CreditCard, card_numbers, CREDIT_CARD_MESSAGES)
+    codes, well_formed = _digit_columns(card_numbers, CREDIT_CARD_LENGTH)
+    digits = codes[:, :CREDIT_CARD_LENGTH].astype(np.int32) - 48
+    # every second digit from the right is doubled, adding the digits of
+    # the double: 2 * digit, minus 9 if it is greater than 9
+    doubled = digits[:, 0::2]
+    checksum = digits[:, 1::2].sum(axis=1) + \
+        (2 * doubled - 9 * (doubled > 4)).sum(axis=1)
+    return _result(well_formed, checksum % 10 == 0)
+
+
+def validate_id_cards(id_cards):
+    """Validates a column of dni. Returns a boolean mask of the valid ones
+    and the error code of each one (VALID, INVALID_FORMAT or INVALID_CHECK
+    for the control letter)"""
+    if np is None:
+        return _validate_one_by_one(IdCard, id_cards, ID_CARD_MESSAGES)
+    codes, well_formed = _digit_columns(id_cards, DNI_LENGTH, ends_with_letter=True)
+    numbers = np.zeros(len(codes), dtype=np.int64)
+    for column in range(DNI_LENGTH - 1):
+        numbers = numbers * 10 + codes[:, column] - 48
+    letters = np.frombuffer(IdCard.DNI_LETTERS.encode("ascii"), dtype=np.uint8)
+    return _result(well_formed, codes[:, DNI_LENGTH - 1] == letters[numbers % 23])
+
+
+def _digit_columns(values, length, ends_with_letter=False):
+    """Returns the unicode code points of the values as an array of one row
+    per value, and the mask of the ones that have the right format: length
+    characters, all digits but the last one if ends_with_letter"""
+    strings = np.asarray(values, dtype=str).reshape(-1)
+    if strings.dtype.itemsize // 4 < length:
+        strings = strings.astype(f"<U{length}")
+    codes = strings.view(np.uint32).reshape(len(strings),
+                                            strings.dtype.itemsize // 4)
+    digits_end = length - 1 if ends_with_letter else length
+    numeric = codes[:, :digits_end]
+    well_formed = (np.char.str_len(strings) == length) & \
+        ((numeric >= 48) & (numeric <= 57)).all(axis=1)
+    if ends_with_letter:
+        well_formed &= (codes[:, digits_end] >= 65) & (codes[:, digits_end] <= 90)
+    return codes, well_formed
+
+
+def _result(well_formed, checked):
+    """Returns the mask of valid values and their error codes"""
+    error_codes = np.where(well_formed,
+                           np.where(checked, VALID, INVALID_CHECK),
+                           INVALID_FORMAT).astype(np.int8)
+    return error_codes == VALID, error_codes
+
+
+def _validate_one_by_one(attribute, values, messages):
+    """Batch validation without NumPy: lists instead of arrays"""
+    error_codes = [messages.index(message)
+                   for message in attribute.validate_many(values)]
+    return [code == VALID for code in error_codes], error_codes
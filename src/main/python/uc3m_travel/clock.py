@@ -0,0 +1,64 @@
+"""Clocks that give the current time to reservations, stays and stores"""
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+
+
+class Clock(ABC):
+    """Base class of the clocks. Like datetime.utcnow, utcnow returns a
+    naive datetime"""
+    @abstractmethod
+    def utcnow(self):
+        """Returns the current time"""
+
+    def timestamp(self):
+        """Returns the current time as a timestamp, as it is stored"""
+        return datetime.timestamp(self.utcnow())
+
+    def today(self):
+        """Returns the current date"""
+        return self.utcnow().date()
+
+
+class SystemClock(Clock):
+    """The time of the system (or the one frozen by freezegun in the tests)"""
+    def utcnow(self):
+        return datetime.utcnow()
+
+
+class FixedClock(Clock):
+    """A clock that only moves when it is set or advanced"""
+    def __init__(self, moment):
+        self.__moment = moment
+
+    def utcnow(self):
+        return self.__moment
+
+    def set(self, moment):
+        """Sets the current time"""
+        self.__moment = moment
+
+    def advance(self, **kwargs):
+        """Moves the clock forward, kwargs are the ones of timedelta"""
+        self.__moment += timedelta(**kwargs)
+
+
+class AcceleratedClock(Clock):
+    """A clock that starts at the given time and runs speed times faster
+    than the system clock"""
+    def __init__(self, start=None, speed=1.0):
+        self.__start = datetime.utcnow() if start is None else start
+        self.__speed = speed
+        self.__started = time.monotonic()
+
+    def utcnow(self):
+        elapsed = (time.monotonic() - self.__started) * self.__speed
+        return self.__start + timedelta(seconds=elapsed)
+
+    @property
+    def speed(self):
+        """Returns how many times faster than the system clock it runs"""
+        return self.__speed
+
+
+SYSTEM_CLOCK = SystemClock()
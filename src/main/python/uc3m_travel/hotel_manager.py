@@ -1,5 +1,6 @@
 """Module for the hotel manager"""
 from uc3m_travel.hotel_reservation import HotelReservation
+from uc3m_travel.hotel_management_exception import HotelManagementException
 from uc3m_travel.attributes.attribute_phone_number import PhoneNumber
 from uc3m_travel.attributes.attribute_arrival_date import ArrivalDate
 from uc3m_travel.attributes.attribute_localizer import Localizer
@@ -11,6 +12,34 @@ from uc3m_travel.attributes.attribute_numdays import NumDays
 from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
 from uc3m_travel.storage.stay_json_store import StayStoreJson
 from uc3m_travel.storage.checkout_json_store import CheckoutStoreJson
+from uc3m_travel.storage.reservation_sqlite_store import ReservationStoreSqlite
+from uc3m_travel.storage.stay_sqlite_store import StayStoreSqlite
+from uc3m_travel.storage.checkout_sqlite_store import CheckoutStoreSqlite
+from uc3m_travel.storage.reservation_sharded_store import ReservationStoreSharded
+from uc3m_travel.storage.stay_sharded_store import StayStoreSharded
+from uc3m_travel.storage.checkout_sharded_store import CheckoutStoreSharded
+from uc3m_travel.storage.sharding import ShardedStore, MonthShardRouter
+from uc3m_travel.storage.group_commit import GroupCommitWriter
+from uc3m_travel.clock import SystemClock
+from uc3m_travel.room_inventory import RoomInventory
+
+# attribute class that validates each reservation field
+VALIDATORS = {
+    "credit_card": CreditCard,
+    "arrival_date": ArrivalDate,
+    "phone_number": PhoneNumber,
+    "num_days": NumDays,
+    "localizer": Localizer,
+    "room_key": RoomKey,
+    "name_surname": NameSurname,
+    "id_card": IdCard
+}
+
+# store classes for reservations, stays and checkouts of each backend
+STORAGE_BACKENDS = {
+    "json": (ReservationStoreJson, StayStoreJson, CheckoutStoreJson),
+    "sqlite": (ReservationStoreSqlite, StayStoreSqlite, CheckoutStoreSqlite),
+    "sharded": (ReservationStoreSharded, StayStoreSharded, CheckoutStoreSharded)}
 
 
 #pylint: disable=too-few-public-methods
@@ -21,29 +50,77 @@ class HotelManager:
     class __HotelManager:
         """Class with all the methods for managing reservations and stays"""
         def __init__(self):
-            pass
+            self.__reservation_store, self.__stay_store, \
+                self.__checkout_store = STORAGE_BACKENDS["json"]
+            self.__clock = SystemClock()
+            self.__writer = None
+            self.__inventory = None
+
+        @property
+        def clock(self):
+            """Returns the clock of reservations, arrivals and checkouts"""
+            return self.__clock
+
+        def set_clock(self, clock=None):
+            """Sets the clock that gives the current time to reservations,
+            arrivals and checkouts (by default, the system clock)"""
+            self.__clock = SystemClock() if clock is None else clock
+
+        def set_storage_backend(self, backend):
+            """Selects where reservations, stays and checkouts are stored:
+            "json", "sqlite" or "sharded" (json stores split by the router
+            of enable_sharding)"""
+            if backend not in STORAGE_BACKENDS:
+                raise ValueError("Invalid storage backend")
+            self.__reservation_store, self.__stay_store, \
+                self.__checkout_store = STORAGE_BACKENDS[backend]
+
+        @property
+        def room_inventory(self):
+            """Returns the rooms of the hotel (None if they are not limited)"""
+            return self.__inventory
+
+        def set_room_inventory(self, inventory=None):
+            """Sets the number of rooms of each type (a RoomInventory or a
+            dict like {"SINGLE": 10}): the reservations that do not have a
+            room free every night are rejected. By default the rooms are
+            not limited"""
+            if inventory is not None and not isinstance(inventory, RoomInventory):
+                inventory = RoomInventory(inventory)
+            self.__inventory = inventory
+
+        def enable_sharding(self, router=None):
+            """Splits the reservation and check in stores in shards decided
+            by the router (by default, by arrival month) and uses them"""
+            ShardedStore.router = MonthShardRouter() if router is None else router
+            self.set_storage_backend("sharded")
+
+        def enable_group_commit(self, max_batch_size=64, max_wait=0.005):
+            """Saves the reservations, arrivals and checkouts made at the
+            same time with a single write of each store: each call waits up
+            to max_wait seconds for others (at most max_batch_size) and
+            returns once its record is saved"""
+            self.disable_group_commit()
+            self.__writer = GroupCommitWriter(max_batch_size, max_wait)
+            return self.__writer
+
+        def disable_group_commit(self):
+            """Goes back to a write of the store for each call"""
+            if self.__writer is not None:
+                self.__writer.close()
+                self.__writer = None
 
         def validate(self, attribute, value):
             """Generic validation method"""
-            validators = {
-                "credit_card": CreditCard,
-                "arrival_date": ArrivalDate,
-                "phone_number": PhoneNumber,
-                "num_days": NumDays,
-                "localizer": Localizer,
-                "room_key": RoomKey,
-                "name_surname": NameSurname,
-                "id_card": IdCard
-            }
-            validator = validators.get(attribute)
+            validator = VALIDATORS.get(attribute)
             if validator:
-                return validator(value).value
+                return validator.validate(value)
             raise ValueError("Invalid attribute")
 
 
         ### MAIN METHODS ###
         # pylint: disable=too-many-arguments
-        def room_reservation(self,
+        def room_reservation(self, *,
                              credit_card:str,
                              name_surname:str,
                              id_card:str,
@@ -54,6 +131,78 @@ class HotelManager:
             """manages the hotel reservation: creates a reservation and
             saves it into a json file"""
 
+            my_reservation = self.create_reservation(
+                credit_card=credit_card, name_surname=name_surname,
+                id_card=id_card, phone_number=phone_number,
+                room_type=room_type, arrival_date=arrival_date,
+                num_days=num_days)
+
+            reservation_store = self.__reservation_store(clock=self.__clock,
+                                                         inventory=self.__inventory)
+            if self.__writer is not None:
+                return self.__writer.submit(reservation_store, "save_reservations",
+                                            my_reservation)
+            return reservation_store.save_reservation(my_reservation)
+
+        def room_reservations(self, reservation_requests)->list:
+            """manages many hotel reservations with a single load and a
+            single write of the store. Each request is a dict with the
+            arguments of room_reservation. Returns, for each request, a dict
+            with its "localizer" or with the "error" message"""
+            results = []
+            reservations = []
+            for request in reservation_requests:
+                try:
+                    my_reservation = self.create_reservation(**request)
+                except HotelManagementException as exception:
+                    results.append({"error": exception.message})
+                    continue
+                except (TypeError, ValueError) as exception:
+                    # peticion mal formada: argumentos que faltan, sobran o no son texto
+                    results.append({"error": str(exception)})
+                    continue
+                results.append(None)
+                reservations.append(my_reservation)
+
+            saved = iter(self.save_reservations(reservations))
+            return [next(saved) if result is None else result
+                    for result in results]
+
+        def save_reservations(self, reservations)->list:
+            """saves already created reservations with a single write of the
+            store. Returns, for each reservation, a dict with its
+            "localizer" or with the "error" message"""
+            reservation_store = self.__reservation_store(clock=self.__clock,
+                                                         inventory=self.__inventory)
+            return [{"error": localizer.message}
+                    if isinstance(localizer, HotelManagementException)
+                    else {"localizer": localizer}
+                    for localizer in reservation_store.save_reservations(
+                        reservations)]
+
+        def room_availability(self, start=None, days:int=90)->dict:
+            """Returns, for each of the days from start (a date, by default
+            today), the free rooms of each type: {"2024-07-01": {"SINGLE":
+            3, ...}}, None for the types that are not limited"""
+            if start is None:
+                start = self.__clock.today()
+            reservation_store = self.__reservation_store(
+                clock=self.__clock,
+                inventory=RoomInventory() if self.__inventory is None
+                else self.__inventory)
+            return reservation_store.availability(start, days)
+
+        def create_reservation(self, *,
+                               credit_card:str,
+                               name_surname:str,
+                               id_card:str,
+                               phone_number:str,
+                               room_type:str,
+                               arrival_date: str,
+                               num_days:int,
+                               reservation_date:float=None)->HotelReservation:
+            """validates the reservation data and creates the reservation,
+            made now or at the given reservation date"""
             self.validate("id_card", id_card)
             self.validate("name_surname", name_surname)
             credit_card = self.validate("credit_card", credit_card)
@@ -61,28 +210,66 @@ class HotelManager:
             num_days = self.validate("num_days", num_days)
             phone_number = self.validate("phone_number", phone_number)
 
-            my_reservation = HotelReservation(id_card=id_card,
-                                              credit_card_number=credit_card,
-                                              name_surname=name_surname,
-                                              phone_number=phone_number,
-                                              room_type=room_type,
-                                              arrival=arrival_date,
-                                              num_days=num_days)
-
-            reservation_store = ReservationStoreJson()
-            return reservation_store.save_reservation(my_reservation)
-
+            return HotelReservation(id_card=id_card,
+                                    credit_card_number=credit_card,
+                                    name_surname=name_surname,
+                                    phone_number=phone_number,
+                                    room_type=room_type,
+                                    arrival=arrival_date,
+                                    num_days=num_days,
+                                    reservation_date=reservation_date,
+                                    clock=self.__clock)
 
         def guest_arrival(self, file_input:str)->str:
             """Manages the arrival of a guest with a reservation"""
-            checkin = StayStoreJson()
+            checkin = self.__stay_store(clock=self.__clock)
+            if self.__writer is not None:
+                return self.__writer.submit(checkin, "save_checkins", file_input)
             return checkin.save_checkin(file_input)
 
+        def guest_arrivals(self, directory:str, results_file:str=None)->dict:
+            """Manages the arrival of the guests of all the json files in the
+            directory. Returns, and writes in results_file if it is given,
+            for each file a dict with its "room_key" or with the "error"
+            message"""
+            checkin = self.__stay_store(clock=self.__clock)
+            return checkin.save_checkin_directory(directory, results_file)
+
+        def guest_arrival_files(self, input_files)->list:
+            """Manages the arrival of the guests of the given json files at
+            once. Returns, for each file, a dict with its "room_key" or with
+            the "error" message"""
+            checkin = self.__stay_store(clock=self.__clock)
+            return [{"error": result.message}
+                    if isinstance(result, HotelManagementException)
+                    else {"room_key": result}
+                    for result in checkin.save_checkins(list(input_files))]
+
         def guest_checkout(self, room_key:str)->bool:
             """Manages the checkout of a guest"""
-            checkout = CheckoutStoreJson()
+            checkout = self.__checkout_store(clock=self.__clock)
+            if self.__writer is not None:
+                return self.__writer.submit(checkout, "save_checkouts", room_key)
             return checkout.save_checkout(room_key)
 
+        def guest_checkouts(self, room_keys)->list:
+            """Manages the checkout of many guests at once. Returns, for each
+            room key, a dict with the "room_key" or with the "error" message"""
+            room_keys = list(room_keys)
+            checkout = self.__checkout_store(clock=self.__clock)
+            return [{"error": result.message}
+                    if isinstance(result, HotelManagementException)
+                    else {"room_key": room_key}
+                    for room_key, result in zip(
+                        room_keys, checkout.save_checkouts(room_keys))]
+
+        def guests_due_out(self, departure_day=None)->list:
+            """Returns the guests that leave on the day (a date, by default
+            today) and have not checked out yet: a dict with the room_key,
+            localizer, arrival, departure and room_type of each stay"""
+            checkout = self.__checkout_store(clock=self.__clock)
+            return [stay._asdict() for stay in checkout.guests_due_out(departure_day)]
+
         ### MAIN METHODS ###
 
 
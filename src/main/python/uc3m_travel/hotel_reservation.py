@@ -1,8 +1,5 @@
 """Hotel reservation class"""
 import hashlib
-from datetime import datetime
-# pylint: disable=import-error
-from freezegun import freeze_time
 from uc3m_travel.attributes.attribute_phone_number import PhoneNumber
 from uc3m_travel.attributes.attribute_arrival_date import ArrivalDate
 from uc3m_travel.attributes.attribute_name_surname import NameSurname
@@ -10,14 +7,38 @@ from uc3m_travel.attributes.attribute_credit_card import CreditCard
 from uc3m_travel.attributes.attribute_id_card import IdCard
 from uc3m_travel.attributes.attribute_numdays import NumDays
 from uc3m_travel.attributes.attribute_room_type import RoomType
-from uc3m_travel.hotel_management_config import JSON_FILES_PATH
 from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
+from uc3m_travel.clock import SYSTEM_CLOCK
 from .hotel_management_exception import HotelManagementException
 
 
+#pylint: disable=too-many-arguments
+def localizer_info(*, id_card, name_surname, credit_card, phone_number,
+                   reservation_date, arrival, num_days, room_type):
+    """returns the string the localizer is the md5 of"""
+    #VERY IMPORTANT: JSON KEYS CANNOT BE RENAMED
+    json_info = {"id_card": id_card,
+                 "name_surname": name_surname,
+                 "credit_card": credit_card,
+                 "phone_number:": phone_number,
+                 "reservation_date": reservation_date,
+                 "arrival_date": arrival,
+                 "num_days": num_days,
+                 "room_type": room_type,
+                 }
+    return "HotelReservation:" + str(json_info)
+
+
+def compute_localizer(**fields):
+    """returns the localizer of a reservation from the fields of
+    localizer_info and the timestamp of the reservation, without reading
+    the clock"""
+    return hashlib.md5(localizer_info(**fields).encode()).hexdigest()
+
+
 class HotelReservation:
     """Class for representing hotel reservations"""
-    #pylint: disable=too-many-arguments, too-many-instance-attributes
+    #pylint: disable=too-many-instance-attributes,too-many-positional-arguments
     def __init__(self,
                  id_card:str,
                  credit_card_number:str,
@@ -25,67 +46,73 @@ class HotelReservation:
                  phone_number:str,
                  room_type:str,
                  arrival:str,
-                 num_days:int):
-        """constructor of reservation objects"""
-        self.__credit_card_number = CreditCard(credit_card_number).value
-        self.__id_card = IdCard(id_card).value
-        justnow = datetime.utcnow()
-        self.__arrival = ArrivalDate(arrival).value
-        self.__reservation_date = datetime.timestamp(justnow)
-        self.__name_surname = NameSurname(name_surname).value
-        self.__phone_number = PhoneNumber(phone_number).value
-        self.__room_type = RoomType(room_type).value
-        self.__num_days = NumDays(num_days).value
-        self.__localizer =  hashlib.md5(str(self).encode()).hexdigest()
+                 num_days:int,
+                 *,
+                 reservation_date:float=None,
+                 clock=None):
+        """constructor of reservation objects. The reservation date is the
+        current time of the clock unless the timestamp of a stored
+        reservation is given"""
+        self.__credit_card_number = CreditCard.validate(credit_card_number)
+        self.__id_card = IdCard.validate(id_card)
+        if reservation_date is None:
+            reservation_date = (SYSTEM_CLOCK if clock is None else clock).timestamp()
+        self.__arrival = ArrivalDate.validate(arrival)
+        self.__reservation_date = reservation_date
+        self.__name_surname = NameSurname.validate(name_surname)
+        self.__phone_number = PhoneNumber.validate(phone_number)
+        self.__room_type = RoomType.validate(room_type)
+        self.__num_days = NumDays.validate(num_days)
+        self.__localizer = hashlib.md5(str(self).encode()).hexdigest()
 
     def __str__(self):
         """return a json string with the elements required to calculate the localizer"""
-        #VERY IMPORTANT: JSON KEYS CANNOT BE RENAMED
-        json_info = {"id_card": self.__id_card,
-                     "name_surname": self.__name_surname,
-                     "credit_card": self.__credit_card_number,
-                     "phone_number:": self.__phone_number,
-                     "reservation_date": self.__reservation_date,
-                     "arrival_date": self.__arrival,
-                     "num_days": self.__num_days,
-                     "room_type": self.__room_type,
-                     }
-        return "HotelReservation:" + json_info.__str__()
+        return localizer_info(id_card=self.__id_card,
+                              name_surname=self.__name_surname,
+                              credit_card=self.__credit_card_number,
+                              phone_number=self.__phone_number,
+                              reservation_date=self.__reservation_date,
+                              arrival=self.__arrival,
+                              num_days=self.__num_days,
+                              room_type=self.__room_type)
 
     ### CLASSMETHODS ###
     @classmethod
-    def create_reservation_from_arrival(cls, my_id_card, my_localizer):
-        """creates a reservation from the arrival data"""
-        reservation_store = ReservationStoreJson()
+    def create_reservation_from_arrival(cls, my_id_card, my_localizer,
+                                        store_list=None, reservation_store=None):
+        """creates a reservation from the arrival data. The reservations
+        store is read unless its content is given in store_list"""
+        if reservation_store is None:
+            reservation_store = ReservationStoreJson()
         reservation_store.validate_id_card(my_id_card)
         reservation_store.validate_localizer(my_localizer)
 
         # self.validate_localizer() hay que validar
         # buscar en almacen
-        file_store = JSON_FILES_PATH + "store_reservation.json"
-        # leo los datos del fichero , si no existe deber dar error porque el almacen de reserva
+        # leo los datos del almacen , si no existe deber dar error porque el almacen de reserva
         # debe existir para hacer el checkin
-        store_list = reservation_store.read_json_not_empty(file_store, "guest_arrival")
         # compruebo si esa reserva esta en el almacen
-        reservation = HotelReservation.find_reservation(my_localizer, store_list)
+        if store_list is None:
+            reservation = reservation_store.read_reservation(my_localizer)
+        else:
+            reservation = reservation_store.find_reservation(my_localizer, store_list)
         if my_id_card != reservation["_HotelReservation__id_card"]:
             raise HotelManagementException(
                 "Error: Localizer is not correct for this IdCard")
-        # regenerar clave y ver si coincide
-        reservation_date = datetime.fromtimestamp(
-            reservation["_HotelReservation__reservation_date"])
-        with freeze_time(reservation_date):
-            new_reservation = HotelReservation(
-                credit_card_number=reservation[
-                    "_HotelReservation__credit_card_number"],
-                id_card=reservation["_HotelReservation__id_card"],
-                num_days=reservation["_HotelReservation__num_days"],
-                room_type=reservation["_HotelReservation__room_type"],
-                arrival=reservation["_HotelReservation__arrival"],
-                name_surname=reservation[
-                    "_HotelReservation__name_surname"],
-                phone_number=reservation[
-                    "_HotelReservation__phone_number"])
+        # regenerar clave con la fecha de la reserva y ver si coincide
+        new_reservation = HotelReservation(
+            credit_card_number=reservation[
+                "_HotelReservation__credit_card_number"],
+            id_card=reservation["_HotelReservation__id_card"],
+            num_days=reservation["_HotelReservation__num_days"],
+            room_type=reservation["_HotelReservation__room_type"],
+            arrival=reservation["_HotelReservation__arrival"],
+            name_surname=reservation[
+                "_HotelReservation__name_surname"],
+            phone_number=reservation[
+                "_HotelReservation__phone_number"],
+            reservation_date=reservation[
+                "_HotelReservation__reservation_date"])
         if new_reservation.localizer != my_localizer:
             raise HotelManagementException(
                 "Error: reservation has been manipulated")
@@ -94,10 +121,7 @@ class HotelReservation:
     @classmethod
     def find_reservation(cls, my_localizer, store_list):
         """finds a reservation in the store"""
-        for item in store_list:
-            if my_localizer == item["_HotelReservation__localizer"]:
-                return item
-        raise HotelManagementException("Error: localizer not found")
+        return ReservationStoreJson().find_reservation(my_localizer, store_list)
 
     ### CLASSMETHODS ###
     @property
@@ -1,32 +1,39 @@
 ''' Class HotelStay (GE2.2) '''
-from datetime import datetime
 import hashlib
+from uc3m_travel.clock import SYSTEM_CLOCK
+
+
+def compute_room_key(algorithm, room_type, localizer, arrival, departure):
+    """returns the room key of a stay from its fields, without reading the
+    clock"""
+    return hashlib.sha256(("{alg:" + algorithm + ",typ:" + room_type +
+                           ",localizer:" + localizer + ",arrival:" + str(arrival) +
+                           ",departure:" + str(departure) + "}").encode()).hexdigest()
+
 
 class HotelStay():
     """Class for representing hotel stays"""
+    #pylint: disable=too-many-arguments
     def __init__(self,
                  idcard:str,
                  localizer:str,
                  numdays:int,
-                 roomtype:str):
-        """constructor for HotelStay objects"""
+                 roomtype:str,
+                 clock=None):
+        """constructor for HotelStay objects, the arrival is the current
+        time of the clock"""
         self.__algorithm = "SHA-256"
         self.__type = roomtype
         self.__idcard = idcard
         self.__localizer = localizer
-        justnow = datetime.utcnow()
-        self.__arrival = datetime.timestamp(justnow)
+        clock = SYSTEM_CLOCK if clock is None else clock
+        self.__arrival = clock.timestamp()
         #timestamp is represented in seconds.miliseconds
         #to add the number of days we must express num_days in seconds
         self.__departure = self.__arrival + (numdays * 24 * 60 * 60)
-        self.__room_key = hashlib.sha256(self.__signature_string().encode()).hexdigest()
-
-    def __signature_string(self):
-        """Composes the string to be used for generating the key for the room"""
-        return "{alg:" + self.__algorithm + ",typ:" + self.__type + \
-               ",localizer:" + \
-            self.__localizer + ",arrival:" + str(self.__arrival) + \
-            ",departure:" + str(self.__departure) + "}"
+        self.__room_key = compute_room_key(self.__algorithm, self.__type,
+                                           self.__localizer, self.__arrival,
+                                           self.__departure)
 
     @property
     def id_card(self):
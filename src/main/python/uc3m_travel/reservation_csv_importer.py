@@ -0,0 +1,138 @@
+"""Bulk import of reservations from a CSV file"""
+import csv
+import itertools
+import json
+import os
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from uc3m_travel.hotel_manager import HotelManager
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+# column of the CSV file -> argument of HotelManager.room_reservation
+CSV_COLUMNS = {"CREDIT_CARD_NUMBER": "credit_card",
+               "NAME_SURNAME": "name_surname",
+               "ID_CARD": "id_card",
+               "PHONE_NUMBER": "phone_number",
+               "ROOM_TYPE": "room_type",
+               "ARRIVAL": "arrival_date",
+               "NUM_DAYS": "num_days"}
+ROW_FIELDS_ERROR = "CSV row with a wrong number of fields"
+
+
+def read_csv_requests(csv_file, chunk_size=1000):
+    """Yields the reservation requests of the CSV file in chunks of
+    (row number, request) pairs, without loading the whole file. The request
+    of a row with a wrong number of fields is its error message"""
+    try:
+        with open(csv_file, "r", encoding="utf-8", newline="") as file:
+            rows = csv.DictReader(file, delimiter=",")
+            missing = set(CSV_COLUMNS) - set(rows.fieldnames or [])
+            if missing:
+                raise HotelManagementException(
+                    "CSV file without column " + ", ".join(sorted(missing)))
+            numbered = enumerate(rows, start=2)
+            while True:
+                chunk = [(row_number, csv_request(row))
+                         for row_number, row in itertools.islice(numbered,
+                                                                 chunk_size)]
+                if not chunk:
+                    return
+                yield chunk
+    except FileNotFoundError as file_not_found_error:
+        raise HotelManagementException("Wrong file or file path") \
+            from file_not_found_error
+
+
+def csv_request(row):
+    """Returns the room_reservation arguments of a CSV row, or the error
+    message of a row with fields missing or left over"""
+    # DictReader deja a None los campos de una fila corta y guarda los que
+    # sobran con la clave None
+    if None in row or None in row.values():
+        return ROW_FIELDS_ERROR
+    request = {argument: row[column] for column, argument in CSV_COLUMNS.items()}
+    # como en los casos de prueba, los dias son un entero si lo parecen
+    try:
+        request["num_days"] = int(request["num_days"])
+    except ValueError:
+        pass
+    return request
+
+
+def create_reservations(chunk, reservation_date):
+    """Validates and creates the reservations of a chunk of requests (it runs
+    in the worker processes). Returns, for each request, its row number and
+    the reservation or the error message"""
+    # HotelManager() devuelve la instancia unica, que pylint no conoce
+    # pylint: disable=no-member
+    hotel_manager = HotelManager()
+    results = []
+    for row_number, request in chunk:
+        if isinstance(request, str):
+            results.append((row_number, request))
+            continue
+        try:
+            results.append((row_number, hotel_manager.create_reservation(
+                reservation_date=reservation_date, **request)))
+        except HotelManagementException as exception:
+            results.append((row_number, exception.message))
+        except (TypeError, ValueError) as exception:
+            # un campo que no es texto no debe hacer fallar todo el bloque
+            results.append((row_number, str(exception)))
+    return results
+
+
+def iter_csv_import(csv_file, chunk_size=1000, max_workers=None):
+    """Imports the reservations of the CSV file. The chunks of rows are
+    validated and turned into reservations by a pool of processes and a
+    single writer (this process) saves each chunk in the store, in the
+    order of the file, with its duplicate checks. At most two chunks per
+    process are in memory at once. All the rows of a chunk get the same
+    reservation date, the time of the clock when the chunk is read, as the
+    reservations of a single room_reservations call. Yields, for each row,
+    its number and a dict with its "localizer" or with the "error" message"""
+    # pylint: disable=no-member
+    hotel_manager = HotelManager()
+    max_workers = max_workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        running = deque()
+        for chunk in read_csv_requests(csv_file, chunk_size):
+            if len(running) >= 2 * max_workers:
+                # el proceso principal es el unico que escribe en el almacen
+                yield from save_chunk(hotel_manager, running.popleft().result())
+            running.append(executor.submit(create_reservations, chunk,
+                                           hotel_manager.clock.timestamp()))
+        while running:
+            yield from save_chunk(hotel_manager, running.popleft().result())
+
+
+def save_chunk(hotel_manager, created):
+    """Saves the reservations of a created chunk. Yields the result of
+    each row"""
+    saved = iter(hotel_manager.save_reservations(
+        [result for _, result in created if not isinstance(result, str)]))
+    for row_number, result in created:
+        yield row_number, {"error": result} if isinstance(result, str) \
+            else next(saved, None)
+
+
+def import_reservations_csv(csv_file, chunk_size=1000, max_workers=None,
+                            errors_file=None):
+    """Imports the reservations of the CSV file and returns the number of
+    rows, imported and rejected. If errors_file is given the rejected rows
+    are written in it as json lines with their row number and error"""
+    summary = {"rows": 0, "imported": 0, "rejected": 0}
+    with nullcontext() if errors_file is None else \
+            open(errors_file, "w", encoding="utf-8", newline="") as errors:
+        for row_number, result in iter_csv_import(csv_file, chunk_size,
+                                                  max_workers):
+            summary["rows"] += 1
+            if "localizer" in result:
+                summary["imported"] += 1
+                continue
+            summary["rejected"] += 1
+            if errors is not None:
+                errors.write(json.dumps({"row": row_number,
+                                         "error": result["error"]}) + "\n")
+    return summary
@@ -0,0 +1,28 @@
+"""Rooms of the hotel"""
+from uc3m_travel.attributes.attribute_room_type import RoomType
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+ROOM_TYPES = ("SINGLE", "DOUBLE", "SUITE")
+
+
+class RoomInventory():
+    """Number of rooms of each type of the hotel. A type without a number
+    of rooms is not limited"""
+    def __init__(self, rooms=None):
+        rooms = {} if rooms is None else dict(rooms)
+        for room_type, count in rooms.items():
+            try:
+                RoomType.validate(room_type)
+            except HotelManagementException as exception:
+                raise ValueError("Invalid room inventory") from exception
+            if not isinstance(count, int) or count < 0:
+                raise ValueError("Invalid room inventory")
+        self.__rooms = rooms
+
+    def capacity(self, room_type):
+        """Returns the number of rooms of the type, or None if it is not
+        limited"""
+        return self.__rooms.get(room_type)
+
+    def __repr__(self):
+        return "RoomInventory(" + repr(self.__rooms) + ")"
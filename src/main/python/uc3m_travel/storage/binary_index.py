@@ -0,0 +1,329 @@
+"""Fixed width binary indexes of the check in and checkout stores"""
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from datetime import date, datetime
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import iter_store_file
+from uc3m_travel.storage.records import CheckoutRecord
+
+# header: magic, version, number of sorted records, number of records of
+# the unsorted tail and the (mtime, size, inode) stamp of the json store the
+# index was built from
+HEADER = struct.Struct("<8sIII3q")
+VERSION = 2
+ROOM_TYPE_CODES = {"SINGLE": 1, "DOUBLE": 2, "SUITE": 3}
+ROOM_TYPES = {code: room_type for room_type, code in ROOM_TYPE_CODES.items()}
+
+# the part of a stay kept in the index
+StayIndexEntry = namedtuple("StayIndexEntry", ["room_key", "localizer", "arrival",
+                                               "departure", "room_type"])
+
+
+def fixed_bytes(hex_value, size):
+    """returns the bytes of a hex string of exactly size bytes. A value of
+    another size is malformed (struct would pad or truncate it)"""
+    value = bytes.fromhex(hex_value)
+    if len(value) != size:
+        raise ValueError("Wrong size of hex value")
+    return value
+
+
+class BinaryIndex(ABC):
+    """Index of a json store kept in a file of fixed width records sorted
+    by their binary key, next to the store. The file is memory mapped and
+    a key is found with a binary search that reads the records in place.
+    The records added later are appended unsorted after the sorted ones,
+    and are merged with them when there are MAX_TAIL of them, so an add
+    does not rewrite the whole file. The index is rebuilt from the store
+    whenever it is missing or stale"""
+    MAGIC = b""
+    RECORD = struct.Struct("")
+    KEY_SIZE = 32
+    EXTENSION = ""
+    MAX_TAIL = 256
+
+    def __init__(self, store_file, index_file=None):
+        self._store_file = store_file
+        if index_file is None:
+            index_file = os.path.splitext(store_file)[0] + self.EXTENSION
+        self._index_file = index_file
+        self._map = None
+        self._count = 0
+        self._tail = 0
+        self._loaded = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count + self._tail
+
+    def close(self):
+        """unmaps the index file"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._count = 0
+        self._tail = 0
+        self._loaded = False
+
+    def load(self):
+        """maps the index file, rebuilding it if it is stale. A missing
+        store gives an empty index"""
+        self.close()
+        store_stamp = JsonStore.file_stamp(self._store_file)
+        if store_stamp is not None and not self._map_file(store_stamp):
+            self.rebuild()
+        self._loaded = True
+        return self
+
+    def rebuild(self):
+        """rebuilds the index streaming the records of the store"""
+        self.close()
+        store_stamp = JsonStore.file_stamp(self._store_file)
+        records = [] if store_stamp is None else \
+            self.pack_items(iter_store_file(self._store_file))
+        self._write(records, store_stamp)
+        self._loaded = True
+        return self
+
+    def add(self, items):
+        """adds the records of the given store items once they have been
+        written in the store, and stamps the index with the store. The
+        index must have been loaded before writing them"""
+        if not self._loaded:
+            return self.rebuild()
+        new_records = self.pack_items(items)
+        if self._map is not None and self._tail + len(new_records) <= self.MAX_TAIL:
+            self._append(new_records, JsonStore.file_stamp(self._store_file))
+            self._loaded = True
+            return self
+        # the tail and the new records are merged into the sorted records of
+        # the file, that are copied in blocks without unpacking them
+        sorted_end = HEADER.size + self._count * self.RECORD.size
+        body = self._map[HEADER.size:sorted_end] if self._map else b""
+        new_records = sorted(self._tail_records() + new_records)
+        pieces = []
+        start = 0
+        for record in new_records:
+            offset = self._lower_bound(record[:self.KEY_SIZE]) * self.RECORD.size
+            pieces.append(body[start:offset])
+            pieces.append(record)
+            start = offset
+        pieces.append(body[start:])
+        self._write_body(b"".join(pieces), self._count + len(new_records),
+                         JsonStore.file_stamp(self._store_file))
+        self._loaded = True
+        return self
+
+    def find(self, key):
+        """returns the record of the key (hex string) or None"""
+        if self._map is None:
+            return None
+        try:
+            binary_key = bytes.fromhex(key)
+        except (TypeError, ValueError):
+            return None
+        position = self._lower_bound(binary_key)
+        offset = HEADER.size + position * self.RECORD.size
+        if position < self._count and \
+                self._map[offset:offset + self.KEY_SIZE] == binary_key:
+            return self.unpack(self.RECORD.unpack_from(self._map, offset))
+        for record in self._tail_records():
+            if record[:self.KEY_SIZE] == binary_key:
+                return self.unpack(self.RECORD.unpack(record))
+        return None
+
+    def _tail_records(self):
+        """returns the binary records of the unsorted tail"""
+        start = HEADER.size + self._count * self.RECORD.size
+        return [self._map[offset:offset + self.RECORD.size]
+                for offset in range(start, start + self._tail * self.RECORD.size,
+                                    self.RECORD.size)]
+
+    def _lower_bound(self, binary_key):
+        """returns the position of the first record whose key is not less
+        than the binary key (binary search in the mapped file)"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            offset = HEADER.size + middle * self.RECORD.size
+            if self._map[offset:offset + self.KEY_SIZE] < binary_key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __contains__(self, key):
+        return self.find(key) is not None
+
+    def pack_items(self, items):
+        """returns the binary records of the store items, skipping the
+        malformed ones (without a field or with a key that is not hex), as
+        the scan of the store did"""
+        records = []
+        for item in items:
+            try:
+                records.append(self.pack(item))
+            except (KeyError, TypeError, ValueError, struct.error):
+                continue
+        return records
+
+    @abstractmethod
+    def pack(self, item):
+        """returns the binary record of a store item"""
+
+    @abstractmethod
+    def unpack(self, fields):
+        """returns the record of the unpacked fields"""
+
+    def _map_file(self, store_stamp):
+        """maps the index file if it describes the store as it is now"""
+        try:
+            with open(self._index_file, "rb") as index_file:
+                index_map = mmap.mmap(index_file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return False
+        if len(index_map) < HEADER.size:
+            index_map.close()
+            return False
+        magic, version, count, tail, *stamp = HEADER.unpack_from(index_map, 0)
+        if magic != self.MAGIC or version != VERSION or stamp != store_stamp or \
+                len(index_map) != HEADER.size + (count + tail) * self.RECORD.size:
+            index_map.close()
+            return False
+        self._map = index_map
+        self._count = count
+        self._tail = tail
+        return True
+
+    def _write(self, records, store_stamp):
+        """writes the sorted records in a temporary file that replaces the
+        index, and maps it"""
+        # las claves van al principio de cada registro, asi que ordenar los
+        # registros es ordenar las claves
+        records.sort()
+        self._write_body(b"".join(records), len(records), store_stamp)
+
+    def _write_body(self, body, count, store_stamp):
+        """writes the header and the sorted records in a temporary file that
+        replaces the index, and maps it"""
+        self.close()
+        stamp = store_stamp if store_stamp is not None else [0, 0, 0]
+        file_descriptor, temp_file = tempfile.mkstemp(
+            dir=os.path.dirname(self._index_file) or ".",
+            prefix=os.path.basename(self._index_file) + ".", suffix=".tmp")
+        try:
+            with open(file_descriptor, "wb") as index_file:
+                index_file.write(HEADER.pack(self.MAGIC, VERSION, count, 0, *stamp))
+                index_file.write(body)
+            os.replace(temp_file, self._index_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        if store_stamp is not None:
+            self._map_file(store_stamp)
+
+    def _append(self, records, store_stamp):
+        """appends the records to the unsorted tail of the index file, stamps
+        it with the store and maps it again. If it stops halfway the size of
+        the file does not match its header and the index is rebuilt"""
+        count, tail = self._count, self._tail
+        self.close()
+        with open(self._index_file, "r+b") as index_file:
+            index_file.seek(HEADER.size + (count + tail) * self.RECORD.size)
+            index_file.write(b"".join(records))
+            index_file.seek(0)
+            index_file.write(HEADER.pack(self.MAGIC, VERSION, count,
+                                         tail + len(records), *store_stamp))
+        self._map_file(store_stamp)
+
+
+class StayBinaryIndex(BinaryIndex):
+    """Index of the check in store by room key: binary room key and
+    localizer, arrival and departure timestamps and room type code"""
+    MAGIC = b"UC3MSTAY"
+    RECORD = struct.Struct("<32s16sddB7x")
+    EXTENSION = ".stays.bin"
+
+    def pack(self, item):
+        return self.RECORD.pack(fixed_bytes(item["_HotelStay__room_key"], 32),
+                                fixed_bytes(item["_HotelStay__localizer"], 16),
+                                item["_HotelStay__arrival"],
+                                item["_HotelStay__departure"],
+                                ROOM_TYPE_CODES.get(item["_HotelStay__type"], 0))
+
+    def unpack(self, fields):
+        room_key, localizer, arrival, departure, room_type = fields
+        return StayIndexEntry(room_key.hex(), localizer.hex(), arrival, departure,
+                              ROOM_TYPES.get(room_type))
+
+
+class CheckoutBinaryIndex(BinaryIndex):
+    """Index of the checkout store by room key: binary room key and
+    checkout timestamp"""
+    MAGIC = b"UC3MOUT "
+    RECORD = struct.Struct("<32sd")
+    EXTENSION = ".checkouts.bin"
+
+    def pack(self, item):
+        return self.RECORD.pack(fixed_bytes(item["room_key"], 32),
+                                item["checkout_time"])
+
+    def unpack(self, fields):
+        room_key, checkout_time = fields
+        return CheckoutRecord(room_key.hex(), checkout_time)
+
+
+class DepartureBinaryIndex(BinaryIndex):
+    """Index of the check in store by departure day: day (big endian
+    ordinal, so the bytes sort as the days) and binary room key, with the
+    rest of the stay as StayBinaryIndex. The stays of a day are together"""
+    MAGIC = b"UC3MDEPT"
+    RECORD = struct.Struct(">I32s16sddB7x")
+    KEY_SIZE = 36
+    EXTENSION = ".departures.bin"
+    DAY = struct.Struct(">I")
+
+    def pack(self, item):
+        departure_day = datetime.fromtimestamp(item["_HotelStay__departure"]).date()
+        return self.RECORD.pack(departure_day.toordinal(),
+                                fixed_bytes(item["_HotelStay__room_key"], 32),
+                                fixed_bytes(item["_HotelStay__localizer"], 16),
+                                item["_HotelStay__arrival"],
+                                item["_HotelStay__departure"],
+                                ROOM_TYPE_CODES.get(item["_HotelStay__type"], 0))
+
+    def unpack(self, fields):
+        _, room_key, localizer, arrival, departure, room_type = fields
+        return StayIndexEntry(room_key.hex(), localizer.hex(), arrival, departure,
+                              ROOM_TYPES.get(room_type))
+
+    def due_on(self, departure_day: date):
+        """yields the stays that leave on the day (local time, as the
+        checkout checks it), reading only their records"""
+        if self._map is None:
+            return
+        day_key = self.DAY.pack(departure_day.toordinal())
+        for record in heapq.merge(self._sorted_due_on(day_key), sorted(
+                record for record in self._tail_records()
+                if record[:self.DAY.size] == day_key)):
+            yield self.unpack(self.RECORD.unpack(record))
+
+    def _sorted_due_on(self, day_key):
+        """yields the binary records of the day in the sorted records"""
+        offset = HEADER.size + self._lower_bound(day_key) * self.RECORD.size
+        end = HEADER.size + self._count * self.RECORD.size
+        while offset < end and self._map[offset:offset + self.DAY.size] == day_key:
+            yield self._map[offset:offset + self.RECORD.size]
+            offset += self.RECORD.size
@@ -1,48 +1,161 @@
 """Methods for checkout json management"""
 from datetime import datetime
 from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import store_lock
+from uc3m_travel.storage.binary_index import (StayBinaryIndex, CheckoutBinaryIndex,
+                                              DepartureBinaryIndex)
+from uc3m_travel.clock import SYSTEM_CLOCK
 from uc3m_travel.hotel_management_config import JSON_FILES_PATH
 from uc3m_travel.hotel_management_exception import HotelManagementException
 
 class CheckoutStoreJson(JsonStore):
     """This module implements the JSON store for the checkout of a guest"""
+    _file_name = JSON_FILES_PATH + "store_check_out.json"
+    _stay_file_name = JSON_FILES_PATH + "store_check_in.json"
+
+    def __init__(self, clock=None, file_name=None, stay_file_name=None):
+        super().__init__(clock=clock, file_name=file_name)
+        if stay_file_name is not None:
+            # the check in store where the stays are found
+            self._stay_file_name = stay_file_name
+
     def save_checkout(self, checkout_data):
         """manages the checkout of a guest"""
         self.validate_roomkey(checkout_data)
+        try:
+            stay = self.find_stay(checkout_data)
+        except HotelManagementException as exception:
+            # the stays already checked out may have been archived
+            if exception.message == "Error: room key not found" and \
+                    self.is_checked_out(checkout_data):
+                raise HotelManagementException("Guest is already out") \
+                    from exception
+            raise
+
+        self.check_departure_day(stay.departure, self.clock)
+
+        file_store_checkout = self.store_file()
+
+        with store_lock(file_store_checkout), \
+                CheckoutBinaryIndex(file_store_checkout) as checkouts:
+            if checkout_data in checkouts.load():
+                raise HotelManagementException("Guest is already out")
+
+            room_checkout = {"room_key": checkout_data,
+                             "checkout_time": self.clock.timestamp()}
+
+            self.add_records(file_store_checkout, [room_checkout])
+            checkouts.add([room_checkout])
+
+        return True
+
+    def find_stay(self, room_key):
+        """returns the stay of the room key from the binary index of the
+        check in store"""
         # check thawt the roomkey is stored in the checkins file
-        file_store = JSON_FILES_PATH + "store_check_in.json"
-
-        room_key_list = self.read_json_not_empty(file_store,
-                                                 "guest_checkout")
-
-        # comprobar que esa room_key es la que me han dado
-        found = False
-        for item in room_key_list:
-            if checkout_data == item["_HotelStay__room_key"]:
-                departure_date_timestamp = item["_HotelStay__departure"]
-                found = True
-        if not found:
+        file_store = self.store_file(self._stay_file_name)
+        if self.file_stamp(file_store) is None:
+            raise HotelManagementException("Error: store checkin not found")
+
+        # comprobar que esa room_key es la que me han dado, en el indice
+        # binario de las estancias
+        with StayBinaryIndex(file_store) as stays:
+            stay = stays.load().find(room_key)
+        if stay is None:
             raise HotelManagementException("Error: room key not found")
+        return stay
 
-        today = datetime.utcnow().date()
-        if datetime.fromtimestamp(departure_date_timestamp).date() != today:
-            raise HotelManagementException(
-                "Error: today is not the departure day")
+    def is_checked_out(self, room_key):
+        """checks the room key in the binary index of the checkout store"""
+        with CheckoutBinaryIndex(self.store_file()) as checkouts:
+            return room_key in checkouts.load()
 
-        file_store_checkout = JSON_FILES_PATH + "store_check_out.json"
+    def guests_due_out(self, departure_day=None):
+        """returns the stays that leave on the day (by default, today for
+        the clock) and have not checked out, from the departure index of
+        the check in store and the index of the checkouts"""
+        if departure_day is None:
+            departure_day = self.clock.today()
+        file_store = self.store_file(self._stay_file_name)
+        if self.file_stamp(file_store) is None:
+            raise HotelManagementException("Error: store checkin not found")
+        with DepartureBinaryIndex(file_store) as departures, \
+                CheckoutBinaryIndex(self.store_file()) as checkouts:
+            checkouts.load()
+            return [stay for stay in departures.load().due_on(departure_day)
+                    if stay.room_key not in checkouts]
 
-        room_key_list = self.load_json_store(file_store_checkout)
+    def stay_departures(self, room_keys):
+        """returns the departure timestamp of the stays of the given room
+        keys found in the binary index of the check in store"""
+        file_store = self.store_file(self._stay_file_name)
+        if self.file_stamp(file_store) is None:
+            raise HotelManagementException("Error: store checkin not found")
+        departures = {}
+        with StayBinaryIndex(file_store) as stays:
+            stays.load()
+            for room_key in room_keys:
+                try:
+                    stay = stays.find(self.validate_roomkey(room_key))
+                except HotelManagementException:
+                    continue
+                if stay is not None:
+                    departures[room_key] = stay.departure
+        return departures
 
-        for checkout in room_key_list:
-            if checkout["room_key"] == checkout_data:
-                raise HotelManagementException("Guest is already out")
+    def save_checkouts(self, room_keys):
+        """manages the checkout of many guests: the room keys are matched
+        against the binary indexes of the check in and checkout stores and
+        all the checkouts are saved with a single write. Returns, for each
+        room key, True or the exception that prevents the checkout"""
+        room_keys = list(room_keys)
+        try:
+            departures = self.stay_departures(room_keys)
+            store_error = None
+        except HotelManagementException as exception:
+            departures = {}
+            store_error = exception
 
-        room_checkout = {"room_key": checkout_data,
-                         "checkout_time": datetime.timestamp(
-                             datetime.utcnow())}
+        file_store_checkout = self.store_file()
+        with store_lock(file_store_checkout), \
+                CheckoutBinaryIndex(file_store_checkout) as checkouts:
+            # the index is loaded before the store is written and the new
+            # checkouts are added to it, as in save_checkout
+            checkouts.load()
+            checked_out = set()
 
-        room_key_list.append(room_checkout)
+            results = []
+            new_checkouts = []
+            for room_key in room_keys:
+                try:
+                    self.validate_roomkey(room_key)
+                    if store_error is not None:
+                        raise store_error
+                    is_out = room_key in checked_out or room_key in checkouts
+                    if room_key not in departures:
+                        raise HotelManagementException(
+                            "Guest is already out" if is_out
+                            else "Error: room key not found")
+                    self.check_departure_day(departures[room_key], self.clock)
+                    if is_out:
+                        raise HotelManagementException("Guest is already out")
+                except HotelManagementException as exception:
+                    results.append(exception)
+                    continue
+                checked_out.add(room_key)
+                new_checkouts.append({"room_key": room_key,
+                                      "checkout_time": self.clock.timestamp()})
+                results.append(True)
 
-        self.write_json(file_store_checkout, room_key_list)
+            if new_checkouts:
+                self.add_records(file_store_checkout, new_checkouts)
+                checkouts.add(new_checkouts)
+        return results
 
-        return True
+    @staticmethod
+    def check_departure_day(departure_date_timestamp, clock=None):
+        """checks that today (for the clock) is the departure day of the stay"""
+        today = (SYSTEM_CLOCK if clock is None else clock).today()
+        if datetime.fromtimestamp(departure_date_timestamp).date() != today:
+            raise HotelManagementException(
+                "Error: today is not the departure day")
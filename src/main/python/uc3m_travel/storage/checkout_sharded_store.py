@@ -0,0 +1,72 @@
+"""Methods for checkout json management over a sharded check in store"""
+from uc3m_travel.storage.checkout_json_store import CheckoutStoreJson
+from uc3m_travel.storage.binary_index import (StayBinaryIndex, CheckoutBinaryIndex,
+                                              DepartureBinaryIndex)
+from uc3m_travel.storage.sharding import ShardedStore
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+class CheckoutStoreSharded(ShardedStore, CheckoutStoreJson):
+    """This module implements the JSON store for the checkout of a guest,
+    finding the stays in the shards of the check in store"""
+
+    def stay_shard_files(self):
+        """returns the files of the shards of the check in store in the
+        order the router searches them for a stay leaving today"""
+        shard_files = self.router.shard_files(self.store_file(self._stay_file_name))
+        return [shard_files[shard_key] for shard_key in
+                self.router.checkout_keys(list(shard_files), self.clock.today())]
+
+    def find_stay(self, room_key):
+        """returns the stay of the room key from the binary indexes of the
+        shards of the check in store, stopping at the first one that has it"""
+        shard_files = self.stay_shard_files()
+        if not shard_files:
+            raise HotelManagementException("Error: store checkin not found")
+        for shard_file in shard_files:
+            with StayBinaryIndex(shard_file) as stays:
+                stay = stays.load().find(room_key)
+            if stay is not None:
+                return stay
+        raise HotelManagementException("Error: room key not found")
+
+    def guests_due_out(self, departure_day=None):
+        """returns the stays of all the shards of the check in store that
+        leave on the day (by default, today) and have not checked out"""
+        if departure_day is None:
+            departure_day = self.clock.today()
+        shard_files = self.stay_shard_files()
+        if not shard_files:
+            raise HotelManagementException("Error: store checkin not found")
+        due_out = []
+        with CheckoutBinaryIndex(self.store_file()) as checkouts:
+            checkouts.load()
+            for shard_file in shard_files:
+                with DepartureBinaryIndex(shard_file) as departures:
+                    due_out.extend(stay for stay in departures.load().due_on(departure_day)
+                                   if stay.room_key not in checkouts)
+        return due_out
+
+    def stay_departures(self, room_keys):
+        """returns the departure timestamp of the stays of the given room
+        keys found in the shards of the check in store"""
+        shard_files = self.stay_shard_files()
+        if not shard_files:
+            raise HotelManagementException("Error: store checkin not found")
+        departures = {}
+        pending = set()
+        for room_key in room_keys:
+            try:
+                pending.add(self.validate_roomkey(room_key))
+            except HotelManagementException:
+                continue
+        for shard_file in shard_files:
+            if not pending:
+                break
+            with StayBinaryIndex(shard_file) as stays:
+                stays.load()
+                for room_key in list(pending):
+                    stay = stays.find(room_key)
+                    if stay is not None:
+                        departures[room_key] = stay.departure
+                        pending.discard(room_key)
+        return departures
@@ -0,0 +1,85 @@
+"""Methods for checkout SQLite management"""
+import sqlite3
+from datetime import datetime, timedelta
+from uc3m_travel.storage.sqlite_store import (SqliteStore, STAY_COLUMNS,
+                                              CHECKOUT_COLUMNS)
+from uc3m_travel.storage.checkout_json_store import CheckoutStoreJson
+from uc3m_travel.storage.binary_index import StayIndexEntry
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+class CheckoutStoreSqlite(SqliteStore, CheckoutStoreJson):
+    """This module implements the SQLite store for the checkout of a guest"""
+    def save_checkout(self, checkout_data):
+        """manages the checkout of a guest"""
+        result = self.save_checkouts([checkout_data])[0]
+        if isinstance(result, HotelManagementException):
+            raise result
+        return result
+
+    def guests_due_out(self, departure_day=None):
+        """returns the stays that leave on the day (by default, today) and
+        have not checked out, with the index of the departures"""
+        if departure_day is None:
+            departure_day = self.clock.today()
+        if not self.db_exists():
+            raise HotelManagementException("Error: store checkin not found")
+        # el dia en hora local, como lo comprueba la salida
+        start = datetime.combine(departure_day, datetime.min.time())
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT room_key, localizer, arrival, departure, room_type "
+                "FROM stays WHERE departure >= ? AND departure < ? AND "
+                "room_key NOT IN (SELECT room_key FROM checkouts) "
+                "ORDER BY room_key",
+                (start.timestamp(), (start + timedelta(days=1)).timestamp())).fetchall()
+        return [StayIndexEntry(*row) for row in rows]
+
+    def save_checkouts(self, room_keys):
+        """manages the checkout of many guests in a single transaction.
+        Returns, for each room key, True or the exception that prevents the
+        checkout"""
+        try:
+            return self._save_checkouts(room_keys)
+        except sqlite3.IntegrityError:
+            # otro proceso guardo la salida entre la comprobacion y la
+            # insercion: al repetirlo la comprobacion la encuentra
+            pass
+        try:
+            return self._save_checkouts(room_keys)
+        except sqlite3.IntegrityError as integrity_error:
+            raise HotelManagementException("Guest is already out") \
+                from integrity_error
+
+    def _save_checkouts(self, room_keys):
+        """checks and saves the checkouts in a write transaction"""
+        store_exists = self.db_exists()
+        results = []
+        new_checkouts = []
+        batch_room_keys = set()
+        with self.connect(immediate=True) as connection:
+            for room_key in room_keys:
+                try:
+                    self.validate_roomkey(room_key)
+                    if not store_exists:
+                        raise HotelManagementException(
+                            "Error: store checkin not found")
+                    stay = self.select_record(connection, "stays", STAY_COLUMNS,
+                                              "room_key", room_key)
+                    if stay is None:
+                        raise HotelManagementException("Error: room key not found")
+                    self.check_departure_day(stay["_HotelStay__departure"],
+                                             self.clock)
+                    if room_key in batch_room_keys or self.select_record(
+                            connection, "checkouts", CHECKOUT_COLUMNS,
+                            "room_key", room_key):
+                        raise HotelManagementException("Guest is already out")
+                except HotelManagementException as exception:
+                    results.append(exception)
+                    continue
+                batch_room_keys.add(room_key)
+                new_checkouts.append({"room_key": room_key,
+                                      "checkout_time": self.clock.timestamp()})
+                results.append(True)
+            self.insert_records(connection, "checkouts", CHECKOUT_COLUMNS,
+                                new_checkouts)
+        return results
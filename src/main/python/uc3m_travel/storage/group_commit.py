@@ -0,0 +1,129 @@
+"""Group commit of the writes of the stores"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+
+def store_config(store):
+    """Returns the key of the stores of the same class with the same clock,
+    inventory and files: the mutations of those stores can be saved with a
+    single call of one of them"""
+    config = []
+    for name, value in sorted(vars(store).items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = id(value)
+        config.append((name, value))
+    return type(store), tuple(config)
+
+
+class GroupCommitWriter():
+    """Background writer that saves together the mutations enqueued by
+    several callers. Each mutation is an item for one of the bulk methods
+    of a store (save_reservations, save_checkins, save_checkouts); the
+    pending items of the same store and method are saved with a single
+    call, so with a single write of the store. If that call fails, each
+    item is saved on its own so only its caller gets the error"""
+    def __init__(self, max_batch_size=64, max_wait=0.005):
+        self.__max_batch_size = max_batch_size
+        self.__max_wait = max_wait
+        self.__queue = queue.Queue()
+        # no mutation is enqueued after the end mark of close
+        self.__lock = threading.Lock()
+        self.__closed = False
+        self.flushes = 0
+        self.__thread = threading.Thread(target=self.__run,
+                                         name="group-commit", daemon=True)
+        self.__thread.start()
+
+    @property
+    def max_batch_size(self):
+        """Returns the maximum number of mutations saved together"""
+        return self.__max_batch_size
+
+    @property
+    def max_wait(self):
+        """Returns the seconds a mutation waits for others to join it"""
+        return self.__max_wait
+
+    def submit(self, store, method_name, item):
+        """Enqueues an item for the bulk method of the store and waits until
+        it is saved. Returns its result or raises its exception, as the
+        single item methods do. Once the writer is closed the item is
+        saved on its own"""
+        future = Future()
+        with self.__lock:
+            closed = self.__closed
+            if not closed:
+                self.__queue.put((store, method_name, item, future))
+        if closed:
+            self.__flush_one((store, method_name, item, future))
+        result = future.result()
+        if isinstance(result, HotelManagementException):
+            raise result
+        return result
+
+    def close(self):
+        """Saves the pending mutations and stops the writer"""
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__queue.put(None)
+        self.__thread.join()
+
+    def __run(self):
+        """Waits for a mutation and for the ones that arrive in the next
+        max_wait seconds (up to max_batch_size) and saves them"""
+        running = True
+        while running:
+            mutation = self.__queue.get()
+            if mutation is None:
+                return
+            pending = [mutation]
+            deadline = time.monotonic() + self.__max_wait
+            while len(pending) < self.__max_batch_size:
+                try:
+                    mutation = self.__queue.get(
+                        timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if mutation is None:
+                    running = False
+                    break
+                pending.append(mutation)
+            self.__flush(pending)
+
+    def __flush(self, pending):
+        """Saves the pending mutations with a call of the bulk method of
+        each store configuration and hands each result to its caller"""
+        groups = {}
+        for mutation in pending:
+            groups.setdefault((store_config(mutation[0]), mutation[1]),
+                              []).append(mutation)
+        for group in groups.values():
+            store, method_name = group[0][0], group[0][1]
+            self.flushes += 1
+            try:
+                results = getattr(store, method_name)(
+                    [mutation[2] for mutation in group])
+            except Exception:  # pylint: disable=broad-exception-caught
+                # se repite cada mutacion por separado para que el error
+                # solo llegue a quien la envio
+                for mutation in group:
+                    self.__flush_one(mutation)
+                continue
+            for mutation, result in zip(group, results):
+                mutation[3].set_result(result)
+
+    def __flush_one(self, mutation):
+        """Saves a single mutation and hands its result to its caller"""
+        store, method_name, item, future = mutation
+        self.flushes += 1
+        try:
+            future.set_result(getattr(store, method_name)([item])[0])
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            future.set_exception(exception)
@@ -1,17 +1,63 @@
 """JsonStore module"""
+import copy
 import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from uc3m_travel.hotel_management_exception import HotelManagementException
 from uc3m_travel.attributes.attribute_localizer import Localizer
 from uc3m_travel.attributes.attribute_id_card import IdCard
 from uc3m_travel.attributes.attribute_roomkey import RoomKey
+from uc3m_travel.clock import SYSTEM_CLOCK
+from uc3m_travel.storage.schema import (LEGACY_SCHEMA, COMPACT_SCHEMA, encode_records,
+                                        iter_decoded, iter_records, decode_store)
+from uc3m_travel.storage.json_stream import (JSONL_EXTENSION, encode_json_lines,
+                                             iter_json_lines, iter_store_items,
+                                             iter_store_file, store_schema_version)
+
+JSON_FORMAT = "json"
+JSONL_FORMAT = "jsonl"
 
 class JsonStore():
     """JsonStore class"""
     _data_list = []
     _file_name = ""
+    # "json" keeps the whole store as a json array, "jsonl" keeps one record
+    # per line and only appends new records
+    storage_mode = JSON_FORMAT
+    # version of the format the stores are written with (see schema). The
+    # stores of any version are read
+    schema_version = LEGACY_SCHEMA
+    # parsed content of the stores read or written by this process, by path,
+    # together with the (mtime, size, inode) stamp of the file at that moment
+    _cache = {}
+    cache_hits = 0
+    cache_misses = 0
+
+    def __init__(self, clock=None, file_name=None):
+        self._clock = SYSTEM_CLOCK if clock is None else clock
+        if file_name is not None:
+            # another file for this kind of store (a shard of it)
+            self._file_name = file_name
+
+    @property
+    def clock(self):
+        """Returns the clock that gives the current time to the store"""
+        return self._clock
 
-    def __init__(self):
-        pass
+    def store_file(self, file_name=None):
+        """Returns the path of the given store (by default, this store)
+        for the current storage mode"""
+        if file_name is None:
+            file_name = self._file_name
+        if self.storage_mode == JSONL_FORMAT:
+            return os.path.splitext(file_name)[0] + JSONL_EXTENSION
+        return file_name
+
+    def is_append_only(self):
+        """True if new records are appended instead of rewriting the store"""
+        return self.storage_mode == JSONL_FORMAT
 
     @staticmethod
     def load_json_store(file_store):
@@ -19,48 +65,202 @@ class JsonStore():
         # leo los datos del fichero si existe , y si no existe creo una
         # lista vacía
         try:
-            with open(file_store, "r", encoding="utf-8",
-                      newline="") as file:
-                json_list = json.load(file)
-        # pylint: disable=unused-variable
-        except FileNotFoundError as file_not_found_error:
+            json_list = JsonStore.read_cached(file_store)
+        except FileNotFoundError:
             json_list = []
-        except json.JSONDecodeError as json_decode_error:
-            raise HotelManagementException("JSON Decode Error - Wrong "
-                                           "JSON Format") from json_decode_error
         return json_list
 
     @staticmethod
-    def write_json(file, json_list):
-        """"Method for writing the data from the given list in the given file"""
-        # Method for writing the data from the given
-        # list in the given file
+    def read_cached(file_store):
+        """Returns the parsed content of the given file. If the file has not
+        changed since it was parsed the content is taken from the cache,
+        without reading the file. The list returned is a copy, but its
+        records are the ones of the cache: they are read only"""
+        stamp = JsonStore.file_stamp(file_store)
+        cached = JsonStore._cache.get(file_store)
+        if cached is not None and stamp is not None and cached[0] == stamp:
+            JsonStore.cache_hits += 1
+            return copy.copy(cached[1])
+        JsonStore.cache_misses += 1
+        JsonStore._cache.pop(file_store, None)
+        json_data = JsonStore.read_json(file_store)
+        # the stamp was taken before reading, so a change made meanwhile
+        # is detected in the next read
+        if stamp is not None:
+            JsonStore._cache[file_store] = (stamp, copy.copy(json_data))
+        return json_data
+
+    @staticmethod
+    def read_json(file_store):
+        """Returns the parsed content of the given file, without the cache"""
+        if file_store.endswith(JSONL_EXTENSION):
+            return list(iter_decoded(iter_json_lines(file_store)))
+        try:
+            with open(file_store, "r", encoding="utf-8", newline="") as file:
+                return decode_store(json.load(file))
+        except json.JSONDecodeError as json_decode_error:
+            raise HotelManagementException(
+                "JSON Decode Error - Wrong JSON Format") from json_decode_error
+
+    @staticmethod
+    def file_stamp(file_name):
+        """returns the (mtime, size, inode) stamp of a file or None if
+        the file does not exist"""
+        try:
+            file_stat = os.stat(file_name)
+        except FileNotFoundError:
+            return None
+        return [file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino]
+
+    @staticmethod
+    def clear_cache():
+        """Empties the cache of parsed stores and its counters"""
+        JsonStore._cache.clear()
+        JsonStore.cache_hits = 0
+        JsonStore.cache_misses = 0
+
+    @staticmethod
+    def write_json(file, json_list, indent=2, schema_version=None):
+        """"Method for writing the data from the given list in the given file.
+        The records written are kept in the cache, they are read only"""
+        # a list of records is a store, written in the given schema version
+        # (by default, the one of the stores)
+        content = json_list
+        if isinstance(json_list, list):
+            if schema_version is None:
+                schema_version = JsonStore.schema_version
+            content = encode_records(json_list, schema_version)
+            if schema_version == COMPACT_SCHEMA:
+                indent = None
+        # the data is written in a temporary file that replaces the store,
+        # so readers see the old content or the new one, never half of it
         try:
-            with open(file, "w", encoding="utf-8",
+            file_descriptor, temp_file = tempfile.mkstemp(
+                dir=os.path.dirname(file) or ".",
+                prefix=os.path.basename(file) + ".", suffix=".tmp")
+        except FileNotFoundError as file_not_found_error:
+            raise HotelManagementException("Wrong file  or file path") \
+                from file_not_found_error
+        try:
+            with open(file_descriptor, "w", encoding="utf-8",
                       newline="") as json_file:
-                json.dump(json_list, json_file, indent=2)
+                if file.endswith(JSONL_EXTENSION):
+                    json_file.write(encode_json_lines(content))
+                elif indent is None:
+                    json.dump(content, json_file, separators=(",", ":"))
+                else:
+                    json.dump(content, json_file, indent=indent)
+                json_file.flush()
+                os.fsync(json_file.fileno())
+            if os.path.exists(file):
+                shutil.copymode(file, temp_file)
+            else:
+                os.chmod(temp_file, 0o644)
+            os.replace(temp_file, file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        JsonStore._cache[file] = (JsonStore.file_stamp(file),
+                                  copy.copy(json_list))
+
+    @staticmethod
+    def append_json(file, new_records):
+        """Appends the given records at the end of a jsonl store"""
+        cached = JsonStore._cache.pop(file, None)
+        stamp = JsonStore.file_stamp(file)
+        # the records are appended in the version of the store, a new
+        # store starts with the header of the current version
+        schema_version = JsonStore.schema_version if stamp is None \
+            else store_schema_version(file)
+        try:
+            with open(file, "a", encoding="utf-8", newline="") as json_file:
+                json_file.write(encode_json_lines(encode_records(
+                    new_records, schema_version, header=stamp is None)))
+                json_file.flush()
+                os.fsync(json_file.fileno())
         except FileNotFoundError as file_not_found_error:
             raise HotelManagementException("Wrong file  or file path") \
                 from file_not_found_error
+        # the cached content is still valid if nobody changed the file
+        # before this append (a new file only has the appended records)
+        if stamp is None:
+            cached = (None, [])
+        if cached is not None and cached[0] == stamp:
+            cached[1].extend(copy.copy(record) for record in new_records)
+            JsonStore._cache[file] = (JsonStore.file_stamp(file), cached[1])
+
+    def add_records(self, file_store, new_records, data_list=None):
+        """Saves the new records in the store. In append only mode they
+        are appended to the file, otherwise they are added to the (already
+        loaded) data list and the whole store is written again"""
+        if file_store.endswith(JSONL_EXTENSION):
+            self.append_json(file_store, new_records)
+            return
+        if data_list is None:
+            data_list = self.load_json_store(file_store)
+        data_list.extend(copy.copy(record) for record in new_records)
+        self.write_json(file_store, data_list)
+
+    @staticmethod
+    def load_records(file_store, record_class):
+        """Returns the items of a store file as immutable records of the
+        given class (ReservationRecord, StayRecord or CheckoutRecord),
+        streaming the file so its dicts are never all in memory. The items
+        of a compact store are read with their short keys"""
+        try:
+            return list(iter_records(iter_store_items(file_store), record_class))
+        except FileNotFoundError:
+            return []
+
+    def iter_json_store(self, file_store, prev_function=None):
+        """Yields the records of the given store, from the cache if it is
+        up to date or streaming the file. If prev_function is given a
+        missing store raises the same errors as read_json_not_empty"""
+        cached = self._cache.get(file_store)
+        if cached is not None and cached[0] == self.file_stamp(file_store):
+            JsonStore.cache_hits += 1
+            yield from cached[1]
+            return
+        try:
+            yield from iter_store_file(file_store)
+        except FileNotFoundError as file_not_found_error:
+            if prev_function is not None:
+                self.read_json_raising_errors(file_not_found_error,
+                                              prev_function)
+
+    @staticmethod
+    def convert_to_jsonl(json_file, jsonl_file=None):
+        """Converts a store saved as a json array into a jsonl store"""
+        if jsonl_file is None:
+            jsonl_file = os.path.splitext(json_file)[0] + JSONL_EXTENSION
+        json_list = JsonStore.load_json_store(json_file)
+        JsonStore.write_json(jsonl_file, json_list)
+        return jsonl_file
 
     def read_json_not_empty(self, file, prev_function):
-        """Method for reading the data from the given file, assuming the file is not empty"""
+        """Method for reading the data from the given file, assuming the file is not empty.
+        Only the store of the class is cached, not the input files"""
         try:
-            if prev_function == "read_data_from_json":
-                with open(file, encoding='utf-8') as json_file:
-                    json_list = json.load(json_file)
-            else:
-                with open(file, "r", encoding="utf-8",
-                          newline="") as json_file:
-                    json_list = json.load(json_file)
+            json_list = self.read_cached(file) if file == self.store_file() \
+                else self.read_json(file)
         except FileNotFoundError as file_not_found_error:
             self.read_json_raising_errors(file_not_found_error,
                                           prev_function)
-        except json.JSONDecodeError as json_decode_error:
-            raise HotelManagementException("JSON Decode Error - Wrong "
-                                           "JSON Format") from json_decode_error
         return json_list
 
+    def read_input_files(self, input_files, max_workers=8):
+        """Reads many input files concurrently. Returns, for each file, its
+        content or the exception raised when reading it"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._read_input_file, input_files))
+
+    def _read_input_file(self, input_file):
+        try:
+            return self.read_json_not_empty(input_file, "guest_arrival")
+        except HotelManagementException as exception:
+            return exception
+
     def read_json_raising_errors(self, file_not_found_error,
                                  prev_function):
         """Method for raising errors when reading the data from the given file"""
@@ -81,17 +281,14 @@ class JsonStore():
     @staticmethod
     def validate_id_card(my_id_card):
         """validates the id card format using a regex"""
-        id_card = IdCard(my_id_card)
-        return id_card.value
+        return IdCard.validate(my_id_card)
 
     @staticmethod
     def validate_localizer(localizer_value):
         """validates the localizer format using a regex"""
-        localizer = Localizer(localizer_value)
-        return localizer.value
+        return Localizer.validate(localizer_value)
 
     @staticmethod
     def validate_roomkey(roomkey_value):
         """validates the roomkey format using a regex"""
-        room_key = RoomKey(roomkey_value)
-        return room_key.value
+        return RoomKey.validate(roomkey_value)
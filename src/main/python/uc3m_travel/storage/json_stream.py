@@ -0,0 +1,144 @@
+"""Streaming and locking of the json and jsonl store files"""
+import json
+import re
+from contextlib import contextmanager
+from uc3m_travel.hotel_management_exception import HotelManagementException
+from uc3m_travel.storage.schema import iter_decoded, store_version
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # without fcntl (Windows) the stores are not locked
+    fcntl = None
+
+JSONL_EXTENSION = ".jsonl"
+LOCK_EXTENSION = ".lock"
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# structural characters of a json array: (expected state, character) -> state
+ARRAY_STATES = {("[", "["): "first", ("first", "]"): "end",
+                (",", ","): "record", (",", "]"): "end"}
+
+
+@contextmanager
+def store_lock(file_store):
+    """Holds an exclusive advisory lock on the store (on a .lock file
+    next to it) while the block runs, so that the read-modify-write
+    cycles of several processes or threads on a store do not overlap"""
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    try:
+        # pylint: disable=consider-using-with
+        lock_file = open(file_store + LOCK_EXTENSION, "a", encoding="utf-8")
+    except FileNotFoundError as file_not_found_error:
+        raise HotelManagementException("Wrong file  or file path") \
+            from file_not_found_error
+    with lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def encode_json_lines(records):
+    """Returns the records as json lines"""
+    return "".join(json.dumps(record, separators=(",", ":")) + "\n"
+                   for record in records)
+
+
+def iter_json_lines(file_store):
+    """Yields the records of a jsonl store one at a time, without
+    loading the whole file in memory"""
+    with open(file_store, "r", encoding="utf-8", newline="") as json_file:
+        for line in json_file:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as json_decode_error:
+                raise HotelManagementException(
+                    "JSON Decode Error - Wrong JSON Format") \
+                    from json_decode_error
+
+
+def _next_state(expected, char):
+    """Returns the state of the array after the character and whether the
+    character is consumed. The state is None if the character is wrong"""
+    # "first" is followed by a record unless the array is empty
+    if expected == "first" and char != "]":
+        return "record", 0
+    return ARRAY_STATES.get((expected, char)), 1
+
+
+def _decode_record(decoder, buffer, position):
+    """Returns the record at the position of the buffer and its end, or
+    None and None if the buffer has no whole record there"""
+    try:
+        return decoder.raw_decode(buffer, position)
+    except json.JSONDecodeError:
+        return None, None
+
+
+def iter_json_array(file_store, block_size=65536):
+    """Yields the records of a store saved as a json array one at a
+    time, reading the file in blocks, so the array is never loaded
+    whole. If the caller stops early the rest of the file is not read"""
+    decoder = json.JSONDecoder()
+    with open(file_store, "r", encoding="utf-8", newline="") as json_file:
+        buffer = json_file.read(block_size)
+        position = 0
+        eof = not buffer
+        # "[" at the start, then "first" (a record or "]"), "record"
+        # and "," (a "," or "]") until "end"
+        expected = "["
+        while expected is not None:
+            position = WHITESPACE.match(buffer, position).end()
+            record, end = None, None
+            if expected == "record" and position < len(buffer):
+                record, end = _decode_record(decoder, buffer, position)
+            # a record cut at the end of the block is read again with the
+            # next block
+            if not eof and (position == len(buffer) or expected == "record"
+                            and end in (None, len(buffer))):
+                block = json_file.read(block_size)
+                buffer = buffer[position:] + block
+                position = 0
+                eof = not block
+                continue
+            if position == len(buffer) or expected == "record" and end is None:
+                break
+            if expected == "record":
+                yield record
+                position, expected = end, ","
+                continue
+            expected, consumed = _next_state(expected, buffer[position])
+            position += consumed
+    if expected != "end" or position != len(buffer):
+        raise HotelManagementException(
+            "JSON Decode Error - Wrong JSON Format")
+
+
+def iter_store_items(file_store):
+    """Yields the items of a json or jsonl store file as they are saved,
+    streaming it"""
+    if file_store.endswith(JSONL_EXTENSION):
+        return iter_json_lines(file_store)
+    return iter_json_array(file_store)
+
+
+def iter_store_file(file_store):
+    """Yields the records of a json or jsonl store file, streaming it"""
+    return iter_decoded(iter_store_items(file_store))
+
+
+def store_schema_version(file_store):
+    """Returns the schema version of a store file, reading only its
+    first record, or None if the file does not exist"""
+    items = iter_store_items(file_store)
+    try:
+        first = next(items, None)
+    except FileNotFoundError:
+        return None
+    finally:
+        items.close()
+    return store_version([first])
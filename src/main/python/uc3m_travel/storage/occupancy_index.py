@@ -0,0 +1,109 @@
+"""Per night occupancy of the rooms, kept next to the reservation store"""
+import os
+from datetime import date, datetime
+from uc3m_travel.hotel_management_exception import HotelManagementException
+from uc3m_travel.room_inventory import ROOM_TYPES
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import iter_store_file
+
+
+def reservation_nights(arrival, num_days):
+    """Returns the nights (date ordinals) of a reservation arriving on the
+    date ("dd/mm/yyyy") for num_days"""
+    first_night = datetime.strptime(arrival, "%d/%m/%Y").toordinal()
+    return range(first_night, first_night + int(num_days))
+
+
+def availability_table(inventory, occupied, start, days):
+    """Returns, for each of the days from start, the free rooms of each type
+    (None if the type is not limited). occupied(room_type, night) gives
+    the rooms reserved"""
+    table = {}
+    for night in range(start.toordinal(), start.toordinal() + days):
+        free = {}
+        for room_type in ROOM_TYPES:
+            capacity = inventory.capacity(room_type)
+            free[room_type] = None if capacity is None else \
+                max(capacity - occupied(room_type, night), 0)
+        table[date.fromordinal(night).isoformat()] = free
+    return table
+
+
+class OccupancyIndex():
+    """Number of rooms of each type reserved for each night, so a
+    reservation is checked against the inventory in O(num_days). It is
+    kept in a json file next to the store and is rebuilt from the store
+    files (several for a sharded store) whenever it is missing or stale"""
+    def __init__(self, store_files, index_file, inventory):
+        # store_files returns the files the index describes when called
+        self._store_files = store_files
+        self._index_file = index_file
+        self._inventory = inventory
+        self._nights = {}
+
+    @staticmethod
+    def index_file_of(file_store):
+        """returns the index file of a reservation store"""
+        return os.path.splitext(file_store)[0] + "_occupancy_index.json"
+
+    def _stamp(self):
+        return [JsonStore.file_stamp(file_store) for file_store in self._store_files()]
+
+    def load(self):
+        """loads the index from disk, rebuilding it if it is stale"""
+        try:
+            index_data = JsonStore.read_cached(self._index_file)
+        except (FileNotFoundError, HotelManagementException):
+            index_data = {}
+        if index_data.get("store_stamp") != self._stamp():
+            return self.rebuild()
+        self._nights = {room_type: {date.fromisoformat(night).toordinal(): rooms
+                                    for night, rooms in nights.items()}
+                        for room_type, nights in index_data["nights"].items()}
+        return self
+
+    def rebuild(self):
+        """rebuilds the index streaming the reservations of the store files"""
+        self._nights = {}
+        for file_store in self._store_files():
+            if JsonStore.file_stamp(file_store) is None:
+                continue
+            for item in iter_store_file(file_store):
+                self.add(item["_HotelReservation__room_type"],
+                         item["_HotelReservation__arrival"],
+                         item["_HotelReservation__num_days"])
+        self.save()
+        return self
+
+    def save(self):
+        """writes the index to disk stamped with the current store files"""
+        index_data = {"store_stamp": self._stamp(),
+                      "nights": {room_type: {date.fromordinal(night).isoformat(): rooms
+                                             for night, rooms in nights.items()}
+                                 for room_type, nights in self._nights.items()}}
+        JsonStore.write_json(self._index_file, index_data, indent=None)
+
+    def add(self, room_type, arrival, num_days):
+        """adds the nights of a reservation"""
+        nights = self._nights.setdefault(room_type, {})
+        for night in reservation_nights(arrival, num_days):
+            nights[night] = nights.get(night, 0) + 1
+
+    def occupied(self, room_type, night):
+        """returns the rooms of the type reserved for the night (ordinal)"""
+        return self._nights.get(room_type, {}).get(night, 0)
+
+    def book(self, room_type, arrival, num_days):
+        """adds the nights of a reservation if there is a room of its type
+        free every night. Returns False if there is not"""
+        capacity = self._inventory.capacity(room_type)
+        if capacity is not None and any(
+                self.occupied(room_type, night) >= capacity
+                for night in reservation_nights(arrival, num_days)):
+            return False
+        self.add(room_type, arrival, num_days)
+        return True
+
+    def availability(self, start, days):
+        """returns the free rooms of each type for the days from start"""
+        return availability_table(self._inventory, self.occupied, start, days)
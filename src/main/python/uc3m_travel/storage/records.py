@@ -0,0 +1,83 @@
+"""Immutable records of the reservations, stays and checkouts loaded from
+the stores"""
+from collections import namedtuple
+from operator import itemgetter
+
+# field of each record -> key of the json stores (the name mangled
+# attributes of HotelReservation and HotelStay)
+RESERVATION_KEYS = {
+    "localizer": "_HotelReservation__localizer",
+    "id_card": "_HotelReservation__id_card",
+    "credit_card_number": "_HotelReservation__credit_card_number",
+    "arrival": "_HotelReservation__arrival",
+    "reservation_date": "_HotelReservation__reservation_date",
+    "name_surname": "_HotelReservation__name_surname",
+    "phone_number": "_HotelReservation__phone_number",
+    "room_type": "_HotelReservation__room_type",
+    "num_days": "_HotelReservation__num_days"}
+STAY_KEYS = {
+    "room_key": "_HotelStay__room_key",
+    "algorithm": "_HotelStay__algorithm",
+    "room_type": "_HotelStay__type",
+    "id_card": "_HotelStay__idcard",
+    "localizer": "_HotelStay__localizer",
+    "arrival": "_HotelStay__arrival",
+    "departure": "_HotelStay__departure"}
+CHECKOUT_KEYS = {
+    "room_key": "room_key",
+    "checkout_time": "checkout_time"}
+
+
+# pylint: disable=too-few-public-methods
+class JsonRecord():
+    """Decoding from and encoding to the json store items. The records are
+    named tuples with no __dict__: their fields are slots and they cannot
+    be changed"""
+    __slots__ = ()
+    JSON_KEYS = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._decode = staticmethod(itemgetter(*cls.JSON_KEYS.values()))
+
+    @staticmethod
+    def _decode(item):
+        """Returns the values of the fields of a json store item, in order.
+        The base record has no fields, each subclass gets an itemgetter of
+        its JSON_KEYS"""
+        # pylint: disable=unused-argument
+        return ()
+
+    @classmethod
+    def from_json(cls, item):
+        """Returns the record of a json store item"""
+        return tuple.__new__(cls, cls._decode(item))
+
+    @classmethod
+    def decoder(cls, short_keys):
+        """Returns the function that makes the record of an item of a
+        compact store, read with the short keys of its json keys"""
+        decode = itemgetter(*(short_keys.get(key, key) for key in cls.JSON_KEYS.values()))
+        return lambda item: tuple.__new__(cls, decode(item))
+
+    def to_json(self):
+        """Returns the json store item of the record"""
+        return dict(zip(self.JSON_KEYS.values(), self))
+
+
+class ReservationRecord(JsonRecord, namedtuple("ReservationFields", RESERVATION_KEYS)):
+    """Reservation loaded from the store"""
+    __slots__ = ()
+    JSON_KEYS = RESERVATION_KEYS
+
+
+class StayRecord(JsonRecord, namedtuple("StayFields", STAY_KEYS)):
+    """Stay loaded from the check in store"""
+    __slots__ = ()
+    JSON_KEYS = STAY_KEYS
+
+
+class CheckoutRecord(JsonRecord, namedtuple("CheckoutFields", CHECKOUT_KEYS)):
+    """Checkout loaded from the checkout store"""
+    __slots__ = ()
+    JSON_KEYS = CHECKOUT_KEYS
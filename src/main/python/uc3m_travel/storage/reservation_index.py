@@ -0,0 +1,145 @@
+"""Persistent hash index for the reservation store"""
+import json
+import os
+from uc3m_travel.hotel_management_exception import HotelManagementException
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import iter_store_file
+
+# the log is compacted in the snapshot when it has more entries than this
+# and than half the index
+COMPACT_ENTRIES = 1000
+
+
+class ReservationIndex():
+    """Index of the reservation store keyed by localizer and by id_card.
+    It is kept next to the store as a json snapshot and a jsonl log of the
+    reservations added since, one line per save. It is rebuilt from the
+    store whenever it is missing or stale and the log is compacted in the
+    snapshot when it grows"""
+    def __init__(self, store_file, index_file=None):
+        self._store_file = store_file
+        if index_file is None:
+            index_file = os.path.splitext(store_file)[0] + "_index.json"
+        self._index_file = index_file
+        self._log_file = os.path.splitext(index_file)[0] + ".jsonl"
+        self._localizers = {}
+        self._id_cards = {}
+        # (localizer, id_card, position) not saved yet and entries in the
+        # log, None until the snapshot of the store is loaded or written:
+        # the log can only be appended to a snapshot of the same store
+        self._added = []
+        self._logged = None
+
+    def load(self, store_list=None):
+        """loads the index from disk, rebuilding it if it is stale.
+        If the store list is already in memory it is used for the rebuild
+        and for a cheap consistency check"""
+        store_stamp = JsonStore.file_stamp(self._store_file)
+        self._added = []
+        self._logged = None
+        if store_stamp is None:
+            self._localizers = {}
+            self._id_cards = {}
+            return self
+        try:
+            index_data = JsonStore.read_cached(self._index_file)
+            log = self._read_log()
+        except (FileNotFoundError, HotelManagementException):
+            index_data, log = {}, []
+        # the last line of the log is stamped with the store it describes
+        last_stamp = log[-1]["store_stamp"] if log else index_data.get("store_stamp")
+        if last_stamp != store_stamp:
+            return self.rebuild(store_list)
+        # the snapshot is in the cache of the stores, it is copied to add
+        self._localizers = dict(index_data["localizers"])
+        self._id_cards = dict(index_data["id_cards"])
+        self._logged = 0
+        for line in log:
+            for localizer, id_card, position in line["added"]:
+                self._localizers[localizer] = position
+                self._id_cards[id_card] = localizer
+            self._logged += len(line["added"])
+        if store_list is not None and not self._matches(store_list):
+            return self.rebuild(store_list)
+        return self
+
+    def rebuild(self, store_list=None):
+        """rebuilds the index from the content of the store"""
+        if store_list is None:
+            store_list = iter_store_file(self._store_file)
+        self._localizers = {}
+        self._id_cards = {}
+        for position, item in enumerate(store_list):
+            self.add(item["_HotelReservation__localizer"],
+                     item["_HotelReservation__id_card"], position)
+        self.compact()
+        return self
+
+    def save(self):
+        """appends the reservations added since the last save to the log,
+        stamped with the current store file. The index of a new store is
+        written as a snapshot"""
+        if self._logged is None or \
+                self._logged + len(self._added) > max(COMPACT_ENTRIES, len(self) // 2):
+            self.compact()
+            return
+        line = {"store_stamp": JsonStore.file_stamp(self._store_file),
+                "added": self._added}
+        with open(self._log_file, "a", encoding="utf-8", newline="") as log_file:
+            log_file.write(json.dumps(line, separators=(",", ":")) + "\n")
+            log_file.flush()
+            os.fsync(log_file.fileno())
+        self._logged += len(self._added)
+        self._added = []
+
+    def compact(self):
+        """writes the whole index in the snapshot, stamped with the current
+        store file, and empties the log"""
+        # sin log, una caida antes de escribir la foto deja un indice viejo
+        # que se reconstruye en la siguiente carga
+        if os.path.isfile(self._log_file):
+            os.remove(self._log_file)
+        index_data = {"store_stamp": JsonStore.file_stamp(self._store_file),
+                      "localizers": dict(self._localizers),
+                      "id_cards": dict(self._id_cards)}
+        JsonStore.write_json(self._index_file, index_data, indent=None)
+        self._added = []
+        self._logged = 0
+
+    def add(self, localizer, id_card, position):
+        """adds a reservation stored at the given position"""
+        self._localizers[localizer] = position
+        self._id_cards[id_card] = localizer
+        self._added.append((localizer, id_card, position))
+
+    def position_of(self, localizer):
+        """returns the position of the localizer in the store or None"""
+        return self._localizers.get(localizer)
+
+    def localizer_of(self, id_card):
+        """returns the localizer reserved by the id_card or None"""
+        return self._id_cards.get(id_card)
+
+    def __len__(self):
+        return len(self._localizers)
+
+    def _read_log(self):
+        """returns the lines of the log, none if there is no log"""
+        try:
+            with open(self._log_file, "r", encoding="utf-8", newline="") as log_file:
+                return [json.loads(line) for line in log_file if line.strip()]
+        except FileNotFoundError:
+            return []
+        except json.JSONDecodeError as json_decode_error:
+            # una linea a medio escribir: el indice se reconstruye
+            raise HotelManagementException(
+                "JSON Decode Error - Wrong JSON Format") from json_decode_error
+
+    def _matches(self, store_list):
+        """checks that the index describes the given store list"""
+        if len(store_list) != len(self._localizers):
+            return False
+        if not store_list:
+            return True
+        last_localizer = store_list[-1]["_HotelReservation__localizer"]
+        return self._localizers.get(last_localizer) == len(store_list) - 1
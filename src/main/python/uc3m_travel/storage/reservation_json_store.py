@@ -1,28 +1,121 @@
 """Module to store reservations in json format"""
 from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import store_lock
+from uc3m_travel.storage.reservation_index import ReservationIndex
+from uc3m_travel.storage.occupancy_index import OccupancyIndex
 from uc3m_travel.hotel_management_config import JSON_FILES_PATH
 from uc3m_travel.hotel_management_exception import HotelManagementException
 
 class ReservationStoreJson(JsonStore):
     """This module implements the JSON store for the reservations"""
+    _file_name = JSON_FILES_PATH + "store_reservation.json"
+
+    def __init__(self, clock=None, file_name=None, inventory=None):
+        super().__init__(clock=clock, file_name=file_name)
+        # without inventory the rooms are not limited
+        self._inventory = inventory
+
+    @property
+    def inventory(self):
+        """Returns the rooms the reservations are checked against"""
+        return self._inventory
+
+    def occupancy_index(self, file_store):
+        """returns the occupancy index of the store"""
+        return OccupancyIndex(lambda: [file_store],
+                              OccupancyIndex.index_file_of(file_store),
+                              self._inventory)
+
+    def availability(self, start, days):
+        """returns the free rooms of each type for the days from start"""
+        return self.occupancy_index(self.store_file()).load().availability(start, days)
+
     def save_reservation(self, reservation_data):
         """manages the saving of a reservation of a guest in a json file"""
-        file_store = JSON_FILES_PATH + "store_reservation.json"
+        result = self.save_reservations([reservation_data])[0]
+        if isinstance(result, HotelManagementException):
+            raise result
+        return result
+
+    def save_reservations(self, reservations, occupancy=None):
+        """saves many reservations with a single load and a single write of
+        the store. Returns, for each reservation, its localizer or the
+        exception that prevents saving it. If there is an inventory (or the
+        occupancy of a sharded store is given) the rooms are booked too"""
+        file_store = self.store_file()
+
+        with store_lock(file_store):
+            # in append only mode the store is not loaded, the index is enough
+            data_list = None if self.is_append_only() else \
+                self.load_json_store(file_store)
+            index = ReservationIndex(file_store).load(data_list)
+            own_occupancy = occupancy is None and self._inventory is not None
+            if own_occupancy:
+                occupancy = self.occupancy_index(file_store).load()
+
+            results = []
+            new_records = []
+            batch_localizers = set()
+            batch_id_cards = set()
+            for reservation_data in reservations:
+                # compruebo que esta reserva no esta en el almacen ni en el lote
+                if reservation_data.localizer in batch_localizers or \
+                        index.position_of(reservation_data.localizer) is not None:
+                    results.append(HotelManagementException(
+                        "Reservation already exists"))
+                elif reservation_data.id_card in batch_id_cards or \
+                        index.localizer_of(reservation_data.id_card) is not None:
+                    results.append(HotelManagementException(
+                        "This ID card has another reservation"))
+                elif occupancy is not None and not occupancy.book(
+                        reservation_data.room_type, reservation_data.arrival,
+                        reservation_data.num_days):
+                    results.append(HotelManagementException(
+                        "No rooms available for the reservation dates"))
+                else:
+                    batch_localizers.add(reservation_data.localizer)
+                    batch_id_cards.add(reservation_data.id_card)
+                    new_records.append(reservation_data.__dict__)
+                    results.append(reservation_data.localizer)
+            if not new_records:
+                return results
+
+            # añado los datos de las reservas a lo que hubiera en el fichero
+            position = len(index)
+            self.add_records(file_store, new_records, data_list)
+
+            for record in new_records:
+                index.add(record["_HotelReservation__localizer"],
+                          record["_HotelReservation__id_card"], position)
+                position += 1
+            index.save()
+            if own_occupancy:
+                occupancy.save()
 
-        data_list = self.load_json_store(file_store)
+        return results
 
-        # compruebo que esta reserva no esta en la lista
-        for item in data_list:
-            if reservation_data.localizer == item[
-                "_HotelReservation__localizer"]:
-                raise HotelManagementException("Reservation already exists")
-            if reservation_data.id_card == item["_HotelReservation__id_card"]:
-                raise HotelManagementException(
-                    "This ID card has another reservation")
-        # añado los datos de mi reserva a la lista , a lo que hubiera
-        data_list.append(reservation_data.__dict__)
+    def read_reservation(self, my_localizer):
+        """returns the reservation of the localizer, streaming the store
+        until it is found"""
+        for item in self.iter_json_store(self.store_file(), "guest_arrival"):
+            if item["_HotelReservation__localizer"] == my_localizer:
+                return item
+        raise HotelManagementException("Error: localizer not found")
 
-        # escribo la lista en el fichero
-        self.write_json(file_store, data_list)
+    def find_reservation(self, my_localizer, store_list):
+        """finds a reservation in the store list using the localizer index"""
+        index = ReservationIndex(self.store_file()).load(store_list)
+        position = index.position_of(my_localizer)
+        if position is not None and not self._is_at(my_localizer, store_list,
+                                                    position):
+            # the index does not describe this list, so it is rebuilt
+            position = index.rebuild(store_list).position_of(my_localizer)
+        if position is None:
+            raise HotelManagementException("Error: localizer not found")
+        return store_list[position]
 
-        return reservation_data.localizer
+    @staticmethod
+    def _is_at(my_localizer, store_list, position):
+        """checks that the localizer is stored at the given position"""
+        return position < len(store_list) and \
+            store_list[position]["_HotelReservation__localizer"] == my_localizer
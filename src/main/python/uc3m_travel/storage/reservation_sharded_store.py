@@ -0,0 +1,86 @@
+"""Module to store reservations in json stores sharded by the router"""
+from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
+from uc3m_travel.storage.json_stream import store_lock
+from uc3m_travel.storage.reservation_index import ReservationIndex
+from uc3m_travel.storage.occupancy_index import OccupancyIndex
+from uc3m_travel.storage.sharding import ShardedStore
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+class ReservationStoreSharded(ShardedStore, ReservationStoreJson):
+    """This module implements the sharded json store for the reservations"""
+    SHARD_CLASS = ReservationStoreJson
+
+    def occupancy_index(self, file_store):
+        """returns the occupancy index of all the shards of the store (a
+        stay may be in several months)"""
+        return OccupancyIndex(lambda: list(self.router.shard_files(file_store).values()),
+                              OccupancyIndex.index_file_of(file_store),
+                              self._inventory)
+
+    def save_reservations(self, reservations, occupancy=None):
+        """saves each reservation in its shard, with a single write of each
+        shard. Returns, for each reservation, its localizer or the exception
+        that prevents saving it"""
+        results = [None] * len(reservations)
+        # an id card has one reservation in all the shards: the writers of
+        # every shard take the lock of the store while they check it
+        with store_lock(self.store_file()):
+            # the rooms are booked in the occupancy of all the shards
+            if occupancy is None and self._inventory is not None:
+                occupancy = self.occupancy_index(self.store_file()).load()
+            other_indexes = {}
+            batch_id_cards = {}
+            shard_positions = {}
+            for position, reservation_data in enumerate(reservations):
+                shard_key = self.router.reservation_key(reservation_data.__dict__)
+                if batch_id_cards.setdefault(reservation_data.id_card,
+                                             shard_key) != shard_key or \
+                        self._reserved_in_other_shard(reservation_data.id_card,
+                                                      shard_key, other_indexes):
+                    results[position] = HotelManagementException(
+                        "This ID card has another reservation")
+                    continue
+                shard_positions.setdefault(shard_key, []).append(position)
+
+            for shard_key, positions in shard_positions.items():
+                saved = self.shard(shard_key).save_reservations(
+                    [reservations[position] for position in positions], occupancy)
+                for position, result in zip(positions, saved):
+                    results[position] = result
+            if occupancy is not None:
+                occupancy.save()
+        return results
+
+    def _reserved_in_other_shard(self, id_card, shard_key, indexes):
+        """checks the id card in the indexes of the other shards (loaded
+        once in indexes), without reading their stores"""
+        for other_key, shard_file in self.router.shard_files(self.store_file()).items():
+            if other_key == shard_key:
+                continue
+            if other_key not in indexes:
+                indexes[other_key] = ReservationIndex(shard_file).load()
+            if indexes[other_key].localizer_of(id_card) is not None:
+                return True
+        return False
+
+    def read_reservation(self, my_localizer):
+        """returns the reservation of the localizer, from the shard of an
+        arrival today. The other shards are only read if it is not there,
+        to raise the right error"""
+        shards = self.shards(self.router.arrival_key(my_localizer,
+                                                     self.clock.today()))
+        if not shards:
+            raise HotelManagementException("Error: store reservation not found")
+        for shard in shards:
+            try:
+                return shard.read_reservation(my_localizer)
+            except HotelManagementException as exception:
+                # solo se sigue buscando si no esta en este fragmento
+                if exception.message != "Error: localizer not found":
+                    raise
+        raise HotelManagementException("Error: localizer not found")
+
+    def find_reservation(self, my_localizer, store_list=None):
+        """finds a reservation in its shard (store_list is ignored, the
+        stores are read shard by shard)"""
+        return self.read_reservation(my_localizer)
@@ -0,0 +1,121 @@
+"""Module to store reservations in a SQLite database"""
+import sqlite3
+from uc3m_travel.storage.sqlite_store import SqliteStore, RESERVATION_COLUMNS
+from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
+from uc3m_travel.storage.occupancy_index import reservation_nights, availability_table
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+class ReservationStoreSqlite(SqliteStore, ReservationStoreJson):
+    """This module implements the SQLite store for the reservations"""
+    def save_reservations(self, reservations, occupancy=None):
+        """saves many reservations in a single transaction, with the nights
+        they book in the occupancy table. Returns, for each reservation, its
+        localizer or the exception that prevents saving it (occupancy is
+        ignored, it is kept for compatibility with the json store)"""
+        try:
+            return self._save_reservations(reservations)
+        except sqlite3.IntegrityError:
+            # otro proceso guardo la reserva entre la comprobacion y la
+            # insercion: al repetirlo la comprobacion la encuentra
+            pass
+        try:
+            return self._save_reservations(reservations)
+        except sqlite3.IntegrityError as integrity_error:
+            raise HotelManagementException("Reservation already exists") \
+                from integrity_error
+
+    def _save_reservations(self, reservations):
+        """checks and saves the reservations in a write transaction"""
+        results = []
+        new_records = []
+        batch_localizers = set()
+        batch_id_cards = set()
+        with self.connect(immediate=True) as connection:
+            for reservation_data in reservations:
+                if reservation_data.localizer in batch_localizers or \
+                        self._exists(connection, "localizer",
+                                     reservation_data.localizer):
+                    results.append(HotelManagementException(
+                        "Reservation already exists"))
+                elif reservation_data.id_card in batch_id_cards or \
+                        self._exists(connection, "id_card",
+                                     reservation_data.id_card):
+                    results.append(HotelManagementException(
+                        "This ID card has another reservation"))
+                elif not self._book(connection, reservation_data.room_type,
+                                    reservation_data.arrival,
+                                    reservation_data.num_days):
+                    results.append(HotelManagementException(
+                        "No rooms available for the reservation dates"))
+                else:
+                    batch_localizers.add(reservation_data.localizer)
+                    batch_id_cards.add(reservation_data.id_card)
+                    new_records.append(reservation_data.__dict__)
+                    results.append(reservation_data.localizer)
+            self.insert_records(connection, "reservations",
+                                RESERVATION_COLUMNS, new_records)
+        return results
+
+    def read_reservation(self, my_localizer):
+        """returns the reservation of the localizer"""
+        if not self.db_exists():
+            raise HotelManagementException("Error: store reservation not found")
+        return self.find_reservation(my_localizer)
+
+    def find_reservation(self, my_localizer, store_list=None):
+        """finds a reservation in the database (store_list is ignored, it
+        is kept for compatibility with the json store)"""
+        with self.connect() as connection:
+            reservation = self.select_record(connection, "reservations",
+                                             RESERVATION_COLUMNS,
+                                             "localizer", my_localizer)
+        if reservation is None:
+            raise HotelManagementException("Error: localizer not found")
+        return reservation
+
+    def _book(self, connection, room_type, arrival, num_days):
+        """adds the nights of a reservation to the occupancy table if there
+        is a room of its type free every night. Returns False if there is not"""
+        nights = reservation_nights(arrival, num_days)
+        capacity = None if self._inventory is None else \
+            self._inventory.capacity(room_type)
+        if capacity is not None:
+            busiest = connection.execute(
+                "SELECT MAX(rooms) FROM occupancy WHERE room_type = ? AND "
+                "night BETWEEN ? AND ?", (room_type, nights[0], nights[-1])).fetchone()[0]
+            if busiest is not None and busiest >= capacity:
+                return False
+        self.add_occupancy(connection, [(room_type, arrival, num_days)])
+        return True
+
+    @staticmethod
+    def add_occupancy(connection, reservations):
+        """adds the nights of the (room type, arrival, num_days) of the
+        reservations to the occupancy table"""
+        connection.executemany(
+            "INSERT INTO occupancy (room_type, night, rooms) VALUES (?, ?, 1) "
+            "ON CONFLICT (room_type, night) DO UPDATE SET rooms = rooms + 1",
+            [(room_type, night) for room_type, arrival, num_days in reservations
+             for night in reservation_nights(arrival, num_days)])
+
+    def availability(self, start, days):
+        """returns the free rooms of each type for the days from start"""
+        occupied = {}
+        if self.db_exists():
+            with self.connect() as connection:
+                occupied = {(room_type, night): rooms for room_type, night, rooms in
+                            connection.execute(
+                                "SELECT room_type, night, rooms FROM occupancy "
+                                "WHERE night BETWEEN ? AND ?",
+                                (start.toordinal(), start.toordinal() + days - 1))}
+        return availability_table(
+            self._inventory,
+            lambda room_type, night: occupied.get((room_type, night), 0),
+            start, days)
+
+    @staticmethod
+    def _exists(connection, column, value):
+        """checks if there is a reservation with the value in the column"""
+        return connection.execute(
+            "SELECT 1 FROM reservations WHERE " + column + " = ?",
+            (value,)).fetchone() is not None
@@ -0,0 +1,118 @@
+"""Versions of the format of the json stores. Version 1 (legacy) saves the
+records with the name mangled attribute names as keys. Version 2 (compact)
+saves a header record with the version and the key map, followed by the
+records with short keys and without indentation"""
+from uc3m_travel.storage.records import RESERVATION_KEYS, STAY_KEYS, CHECKOUT_KEYS
+
+LEGACY_SCHEMA = 1
+COMPACT_SCHEMA = 2
+SCHEMA_VERSIONS = (LEGACY_SCHEMA, COMPACT_SCHEMA)
+HEADER_KEY = "schema_version"
+
+# key of the legacy records -> short key of the compact records (unique for
+# all the stores, so a record never needs to know its store)
+SHORT_KEYS = {
+    RESERVATION_KEYS["localizer"]: "l",
+    RESERVATION_KEYS["id_card"]: "i",
+    RESERVATION_KEYS["credit_card_number"]: "c",
+    RESERVATION_KEYS["arrival"]: "a",
+    RESERVATION_KEYS["reservation_date"]: "d",
+    RESERVATION_KEYS["name_surname"]: "n",
+    RESERVATION_KEYS["phone_number"]: "p",
+    RESERVATION_KEYS["room_type"]: "t",
+    RESERVATION_KEYS["num_days"]: "nd",
+    STAY_KEYS["room_key"]: "k",
+    STAY_KEYS["algorithm"]: "al",
+    STAY_KEYS["room_type"]: "ty",
+    STAY_KEYS["id_card"]: "ic",
+    STAY_KEYS["localizer"]: "lo",
+    STAY_KEYS["arrival"]: "ar",
+    STAY_KEYS["departure"]: "de",
+    CHECKOUT_KEYS["room_key"]: "rk",
+    CHECKOUT_KEYS["checkout_time"]: "ct"}
+LONG_KEYS = {short_key: key for key, short_key in SHORT_KEYS.items()}
+
+
+def compact_header(records=()):
+    """Returns the header record of a compact store with the short keys
+    of the given records"""
+    keys = {key for record in records for key in record}
+    return {HEADER_KEY: COMPACT_SCHEMA,
+            "keys": {short_key: key for short_key, key in LONG_KEYS.items()
+                     if key in keys}}
+
+
+def is_header(item):
+    """True if the item is the header record of a store"""
+    return isinstance(item, dict) and HEADER_KEY in item
+
+
+def encode_record(record):
+    """Returns the compact record of a legacy record. Keys without a short
+    key are kept"""
+    return {SHORT_KEYS.get(key, key): value for key, value in record.items()}
+
+
+def encode_records(records, schema_version=COMPACT_SCHEMA, header=True):
+    """Returns the records as they are saved in a store of the version,
+    starting with the header if it is a compact store"""
+    if schema_version == LEGACY_SCHEMA:
+        return list(records)
+    records = list(records)
+    encoded = [compact_header(records)] if header else []
+    encoded.extend(encode_record(record) for record in records)
+    return encoded
+
+
+def iter_decoded(items):
+    """Yields the legacy records of the items of a store of any version.
+    The key map of a compact store is taken from its header, so stores
+    written with other short keys are read too; keys missing in the header
+    (of records appended later) are the current short keys"""
+    items = iter(items)
+    for first in items:
+        if not is_header(first):
+            yield first
+            yield from items
+            return
+        long_keys = dict(LONG_KEYS, **first.get("keys", {}))
+        for item in items:
+            yield {long_keys.get(key, key): value for key, value in item.items()}
+
+
+def iter_records(items, record_class):
+    """Yields the records of the record class (see records.py) of the items
+    of a store of any version. The items of a compact store are read with
+    their short keys, without making their legacy records first"""
+    items = iter(items)
+    for first in items:
+        if not is_header(first):
+            yield record_class.from_json(first)
+            yield from map(record_class.from_json, items)
+            return
+        header_keys = first.get("keys", {})
+        decode = record_class.decoder(dict(
+            SHORT_KEYS, **{key: short_key for short_key, key in header_keys.items()}))
+        long_keys = dict(LONG_KEYS, **header_keys)
+        for item in items:
+            try:
+                yield decode(item)
+            except KeyError:
+                # the item has other short keys (appended with another key map)
+                yield record_class.from_json(
+                    {long_keys.get(key, key): value for key, value in item.items()})
+
+
+def decode_store(json_data):
+    """Returns the legacy records of the parsed content of a store of any
+    version. Other json data (not a store) is returned as it is"""
+    if isinstance(json_data, list) and json_data and is_header(json_data[0]):
+        return list(iter_decoded(json_data))
+    return json_data
+
+
+def store_version(json_data):
+    """Returns the schema version of the parsed content of a store"""
+    if isinstance(json_data, list) and json_data and is_header(json_data[0]):
+        return json_data[0][HEADER_KEY]
+    return LEGACY_SCHEMA
@@ -0,0 +1,59 @@
+"""Migration of the json stores between the versions of their schema"""
+import argparse
+import os
+from uc3m_travel.hotel_management_config import JSON_FILES_PATH
+from uc3m_travel.storage.json_store import JsonStore, JSONL_EXTENSION
+from uc3m_travel.storage.json_stream import store_lock, store_schema_version
+from uc3m_travel.storage.schema import COMPACT_SCHEMA, SCHEMA_VERSIONS
+
+MIGRATED_STORES = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json"]
+
+
+def migrate_store(file_store, schema_version=COMPACT_SCHEMA):
+    """Rewrites a store (json or jsonl) in the given schema version.
+    Returns the number of records, or None if the store does not exist"""
+    with store_lock(file_store):
+        try:
+            store_list = JsonStore.read_cached(file_store)
+        except FileNotFoundError:
+            return None
+        if store_schema_version(file_store) != schema_version:
+            JsonStore.write_json(file_store, store_list,
+                                 schema_version=schema_version)
+    return len(store_list)
+
+
+def migrate_json_stores(json_files_path=JSON_FILES_PATH,
+                        schema_version=COMPACT_SCHEMA):
+    """Rewrites the reservation, check in and checkout stores of the
+    directory (as json arrays and as json lines) in the given schema
+    version. Returns the number of records of each migrated store"""
+    migrated = {}
+    for file_name in MIGRATED_STORES:
+        json_file = os.path.join(json_files_path, file_name)
+        for file_store in (json_file,
+                           os.path.splitext(json_file)[0] + JSONL_EXTENSION):
+            records = migrate_store(file_store, schema_version)
+            if records is not None:
+                migrated[os.path.basename(file_store)] = records
+    return migrated
+
+
+def main(argv=None):
+    """Command line entry point of the migration"""
+    parser = argparse.ArgumentParser(
+        description="Rewrites the json stores in another schema version")
+    parser.add_argument("--json-path", default=JSON_FILES_PATH,
+                        help="directory of the json stores")
+    parser.add_argument("--schema-version", type=int, default=COMPACT_SCHEMA,
+                        choices=SCHEMA_VERSIONS,
+                        help="schema version of the migrated stores")
+    args = parser.parse_args(argv)
+    migrated = migrate_json_stores(args.json_path, args.schema_version)
+    for file_name, count in migrated.items():
+        print(file_name + ": " + str(count) + " records migrated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Splitting of the reservation and check in json stores in shards"""
+import argparse
+import os
+from uc3m_travel.hotel_management_config import JSON_FILES_PATH
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import store_lock, iter_store_file
+from uc3m_travel.storage.sharding import MonthShardRouter, HashShardRouter
+
+# store file -> method of the router that gives the shard of its items
+SHARDED_STORES = {"store_reservation.json": "reservation_key",
+                  "store_check_in.json": "stay_key"}
+# store file -> field that identifies its items
+STORE_KEYS = {"store_reservation.json": "_HotelReservation__localizer",
+              "store_check_in.json": "_HotelStay__room_key"}
+
+
+def rebalance_store(file_store, router, source_router=None, remove_source=False):
+    """Moves the records of a store file, and of its shards for
+    source_router (the router they were split with), to the shards of the
+    router. Records already in their shard stay there and the ones already
+    in a shard (by localizer or room key) are not added again, so running
+    it twice gives the same shards. The source files are removed if
+    remove_source is set. Returns the number of records of each shard"""
+    store_name = os.path.basename(os.path.splitext(file_store)[0] + ".json")
+    shard_key_of = getattr(router, SHARDED_STORES[store_name])
+    key_field = STORE_KEYS[store_name]
+    source_files = [file_store] if JsonStore.file_stamp(file_store) else []
+    if source_router is not None:
+        source_files.extend(source_router.shard_files(file_store).values())
+
+    with store_lock(file_store):
+        shards = {shard_key: list(iter_store_file(shard_file))
+                  for shard_key, shard_file in router.shard_files(file_store).items()
+                  if shard_file not in source_files}
+        stored = {item[key_field] for records in shards.values() for item in records}
+        for source_file in source_files:
+            for item in iter_store_file(source_file):
+                # un registro que ya se movio no se repite
+                if item[key_field] in stored:
+                    continue
+                stored.add(item[key_field])
+                shards.setdefault(shard_key_of(item), []).append(item)
+
+        shard_files = {router.shard_file(file_store, shard_key): records
+                       for shard_key, records in shards.items()}
+        for shard_file, records in shard_files.items():
+            JsonStore.write_json(shard_file, records)
+        if remove_source:
+            for source_file in source_files:
+                if source_file not in shard_files:
+                    os.remove(source_file)
+    return {shard_key: len(records) for shard_key, records in shards.items()}
+
+
+def rebalance_json_stores(router, json_files_path=JSON_FILES_PATH,
+                          source_router=None, remove_source=False):
+    """Splits the reservation and check in stores of the directory in the
+    shards of the router. Returns the records of each shard of each store"""
+    rebalanced = {}
+    for file_name in SHARDED_STORES:
+        file_store = JsonStore().store_file(os.path.join(json_files_path, file_name))
+        rebalanced[file_name] = rebalance_store(file_store, router, source_router,
+                                                remove_source)
+    return rebalanced
+
+
+def make_router(by, prefix_length=1):
+    """Returns the router that shards by "month" or by "localizer" prefix"""
+    if by == "month":
+        return MonthShardRouter()
+    return HashShardRouter(prefix_length)
+
+
+def main(argv=None):
+    """Command line entry point of the rebalancing"""
+    parser = argparse.ArgumentParser(
+        description="Splits the reservation and check in stores in shards")
+    parser.add_argument("--json-path", default=JSON_FILES_PATH,
+                        help="directory of the json stores")
+    parser.add_argument("--by", choices=("month", "localizer"), default="month",
+                        help="shard by arrival month or by localizer prefix")
+    parser.add_argument("--prefix-length", type=int, default=1,
+                        help="hex digits of the localizer prefix")
+    parser.add_argument("--from-by", choices=("month", "localizer"), default=None,
+                        help="the stores are already sharded this way")
+    parser.add_argument("--from-prefix-length", type=int, default=1,
+                        help="hex digits of the localizer prefix they have")
+    parser.add_argument("--remove-source", action="store_true",
+                        help="remove the single file stores (and old shards)")
+    args = parser.parse_args(argv)
+    source_router = None if args.from_by is None else \
+        make_router(args.from_by, args.from_prefix_length)
+    rebalanced = rebalance_json_stores(make_router(args.by, args.prefix_length),
+                                       args.json_path, source_router,
+                                       args.remove_source)
+    for file_name, shards in rebalanced.items():
+        for shard_key, count in shards.items():
+            print(file_name + " " + shard_key + ": " + str(count) + " records")
+
+
+if __name__ == "__main__":
+    main()
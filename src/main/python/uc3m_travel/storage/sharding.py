@@ -0,0 +1,122 @@
+"""Sharding of the reservation and check in json stores"""
+import os
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uc3m_travel.storage.json_store import JsonStore
+
+
+class ShardRouter(ABC):
+    """Decides the shard of each record of the reservation and check in
+    stores. A shard is a store file named after the store and its shard
+    key: store_reservation.2024-07.json"""
+    KEY_PATTERN = ""
+
+    @abstractmethod
+    def reservation_key(self, reservation):
+        """returns the shard key of a reservation store item"""
+
+    @abstractmethod
+    def stay_key(self, stay):
+        """returns the shard key of a check in store item"""
+
+    @abstractmethod
+    def arrival_key(self, localizer, today):
+        """returns the shard key where the reservation of the localizer
+        arriving today should be, or None if it cannot be known"""
+
+    @abstractmethod
+    def checkout_keys(self, shard_keys, today):
+        """returns the given shard keys of the check in store in the order
+        they are searched for a stay leaving today"""
+
+    @staticmethod
+    def shard_file(file_store, shard_key):
+        """returns the file of a shard of the store"""
+        root, extension = os.path.splitext(file_store)
+        return root + "." + shard_key + extension
+
+    def shard_files(self, file_store):
+        """returns the files of the existing shards of the store, by shard key"""
+        root, extension = os.path.splitext(file_store)
+        directory = os.path.dirname(file_store) or "."
+        shard_name = re.compile(re.escape(os.path.basename(root)) + r"\.(" +
+                                self.KEY_PATTERN + ")" + re.escape(extension) + "$")
+        try:
+            file_names = os.listdir(directory)
+        except FileNotFoundError:
+            return {}
+        shards = {}
+        for file_name in sorted(file_names):
+            match = shard_name.match(file_name)
+            if match:
+                shards[match.group(1)] = os.path.join(directory, file_name)
+        return shards
+
+
+class MonthShardRouter(ShardRouter):
+    """Shards by arrival month. An arrival is always today, so it reads the
+    shard of this month; a checkout searches the shards from this month
+    backwards, since the stay arrived before it leaves"""
+    KEY_PATTERN = r"\d{4}-\d{2}"
+
+    def reservation_key(self, reservation):
+        arrival = datetime.strptime(reservation["_HotelReservation__arrival"],
+                                    "%d/%m/%Y")
+        return arrival.strftime("%Y-%m")
+
+    def stay_key(self, stay):
+        return datetime.fromtimestamp(stay["_HotelStay__arrival"]).strftime("%Y-%m")
+
+    def arrival_key(self, localizer, today):
+        return today.strftime("%Y-%m")
+
+    def checkout_keys(self, shard_keys, today):
+        this_month = today.strftime("%Y-%m")
+        past = sorted((key for key in shard_keys if key <= this_month), reverse=True)
+        return past + sorted(key for key in shard_keys if key > this_month)
+
+
+class HashShardRouter(ShardRouter):
+    """Shards by the first hex digits of the localizer, so the reservations
+    are spread evenly. The room key of a checkout does not tell the
+    localizer, so every shard of the check in store may be searched"""
+    def __init__(self, prefix_length=1):
+        self.prefix_length = prefix_length
+        self.KEY_PATTERN = "[0-9a-f]{" + str(prefix_length) + "}"  # pylint: disable=invalid-name
+
+    def reservation_key(self, reservation):
+        return reservation["_HotelReservation__localizer"][:self.prefix_length]
+
+    def stay_key(self, stay):
+        return stay["_HotelStay__localizer"][:self.prefix_length]
+
+    def arrival_key(self, localizer, today):
+        return localizer[:self.prefix_length].lower()
+
+    def checkout_keys(self, shard_keys, today):
+        return sorted(shard_keys)
+
+
+class ShardedStore(JsonStore):
+    """Store split in shards: each shard is a json store of the class it
+    is sharded from, routed by the router of the sharded stores. It goes
+    before that class in the bases of the sharded store"""
+    router = MonthShardRouter()
+    # the json store class of the shards
+    SHARD_CLASS = JsonStore
+
+    def shard(self, shard_key):
+        """returns the store of a shard"""
+        return self.SHARD_CLASS(clock=self.clock,
+                                file_name=self.router.shard_file(self._file_name,
+                                                                 shard_key))
+
+    def shards(self, first_key=None):
+        """returns the stores of the existing shards, starting with the one
+        of first_key"""
+        shard_keys = list(self.router.shard_files(self.store_file()))
+        if first_key in shard_keys:
+            shard_keys.remove(first_key)
+            shard_keys.insert(0, first_key)
+        return [self.shard(shard_key) for shard_key in shard_keys]
@@ -0,0 +1,55 @@
+"""Migration of the json stores to the SQLite database"""
+import argparse
+import os
+from uc3m_travel.hotel_management_config import JSON_FILES_PATH
+from uc3m_travel.storage.json_store import JsonStore, JSONL_EXTENSION
+from uc3m_travel.storage.reservation_sqlite_store import ReservationStoreSqlite
+from uc3m_travel.storage.sqlite_store import (SqliteStore, RESERVATION_COLUMNS,
+                                              STAY_COLUMNS, CHECKOUT_COLUMNS)
+
+# json store file -> table and columns where its records are imported
+MIGRATED_STORES = [("store_reservation.json", "reservations", RESERVATION_COLUMNS),
+                   ("store_check_in.json", "stays", STAY_COLUMNS),
+                   ("store_check_out.json", "checkouts", CHECKOUT_COLUMNS)]
+
+
+def migrate_json_stores(json_files_path=JSON_FILES_PATH, db_file=None):
+    """Imports the reservation, check in and checkout json stores of the
+    given directory into the database. Records already in the database are
+    skipped. Returns the number of records imported for each table"""
+    sqlite_store = SqliteStore(db_file)
+    imported = {}
+    with sqlite_store.connect() as connection:
+        for file_name, table, columns in MIGRATED_STORES:
+            # the store may be saved as a json array or as json lines
+            json_file = os.path.join(json_files_path, file_name)
+            records = JsonStore.load_json_store(json_file) + \
+                JsonStore.load_json_store(os.path.splitext(json_file)[0] +
+                                          JSONL_EXTENSION)
+            before = connection.total_changes
+            sqlite_store.insert_records(connection, table, columns, records,
+                                        ignore_existing=True)
+            imported[table] = connection.total_changes - before
+        # the nights of the reservations are counted again from the table
+        connection.execute("DELETE FROM occupancy")
+        ReservationStoreSqlite.add_occupancy(connection, connection.execute(
+            "SELECT room_type, arrival, num_days FROM reservations").fetchall())
+    return imported
+
+
+def main(argv=None):
+    """Command line entry point of the migration"""
+    parser = argparse.ArgumentParser(
+        description="Imports the json stores into the SQLite database")
+    parser.add_argument("--json-path", default=JSON_FILES_PATH,
+                        help="directory of the json stores")
+    parser.add_argument("--db-file", default=None,
+                        help="path of the SQLite database")
+    args = parser.parse_args(argv)
+    imported = migrate_json_stores(args.json_path, args.db_file)
+    for table, count in imported.items():
+        print(table + ": " + str(count) + " records imported")
+
+
+if __name__ == "__main__":
+    main()
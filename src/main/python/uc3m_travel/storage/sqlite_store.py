@@ -0,0 +1,110 @@
+"""SqliteStore module"""
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from uc3m_travel.hotel_management_config import JSON_FILES_PATH
+from uc3m_travel.storage.records import RESERVATION_KEYS, STAY_KEYS, CHECKOUT_KEYS
+
+# column of each table -> key of the json stores (the fields of the records)
+RESERVATION_COLUMNS = RESERVATION_KEYS
+STAY_COLUMNS = STAY_KEYS
+CHECKOUT_COLUMNS = CHECKOUT_KEYS
+
+# num_days has no type so that it keeps the type it had in the reservation,
+# the localizer depends on it
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reservations (
+    localizer TEXT PRIMARY KEY,
+    id_card TEXT NOT NULL UNIQUE,
+    credit_card_number TEXT,
+    arrival TEXT,
+    reservation_date REAL,
+    name_surname TEXT,
+    phone_number TEXT,
+    room_type TEXT,
+    num_days);
+CREATE TABLE IF NOT EXISTS stays (
+    room_key TEXT PRIMARY KEY,
+    algorithm TEXT,
+    room_type TEXT,
+    id_card TEXT,
+    localizer TEXT,
+    arrival REAL,
+    departure REAL);
+CREATE INDEX IF NOT EXISTS stays_localizer ON stays (localizer);
+CREATE INDEX IF NOT EXISTS stays_id_card ON stays (id_card);
+CREATE INDEX IF NOT EXISTS stays_departure ON stays (departure);
+CREATE TABLE IF NOT EXISTS checkouts (
+    room_key TEXT PRIMARY KEY,
+    checkout_time REAL);
+CREATE TABLE IF NOT EXISTS occupancy (
+    room_type TEXT,
+    night INTEGER,
+    rooms INTEGER NOT NULL,
+    PRIMARY KEY (room_type, night));
+"""
+
+
+class SqliteStore():
+    """Base class for the stores saved in a SQLite database. It is mixed
+    with the json store classes, which keep the validation and the reading
+    of the input files"""
+    _db_file = JSON_FILES_PATH + "store_hotel.db"
+    # database files whose tables have been created by this process
+    _created = set()
+
+    def __init__(self, db_file=None, **kwargs):
+        # the rest of the arguments (the clock) are the ones of the json store
+        super().__init__(**kwargs)
+        if db_file is not None:
+            self._db_file = db_file
+
+    @property
+    def db_file(self):
+        """Returns the path of the database"""
+        return self._db_file
+
+    def db_exists(self):
+        """True if the database has been created"""
+        return os.path.isfile(self._db_file)
+
+    @contextmanager
+    def connect(self, immediate=False):
+        """Opens a connection to the database in a transaction that is
+        committed when the block ends without errors. If immediate is set
+        the transaction takes the write lock at once, so what is read in it
+        cannot be changed by others before it writes"""
+        # las tablas se crean una vez por fichero (o si lo han borrado)
+        create = self._db_file not in SqliteStore._created or not self.db_exists()
+        with closing(sqlite3.connect(self._db_file)) as connection:
+            if create:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(SCHEMA)
+                SqliteStore._created.add(self._db_file)
+            with connection:
+                if immediate:
+                    connection.execute("BEGIN IMMEDIATE")
+                yield connection
+
+    @staticmethod
+    def insert_records(connection, table, columns, records,
+                       ignore_existing=False):
+        """Inserts json store records in the table. If ignore_existing is
+        set the records whose key is already in the table are skipped"""
+        connection.executemany(
+            ("INSERT OR IGNORE INTO " if ignore_existing else "INSERT INTO ") +
+            table + " (" + ", ".join(columns) +
+            ") VALUES (" + ", ".join("?" * len(columns)) + ")",
+            [tuple(record[key] for key in columns.values())
+             for record in records])
+
+    @staticmethod
+    def select_record(connection, table, columns, key_column, key_value):
+        """Returns the record of the table with the given key as a json
+        store record, or None"""
+        row = connection.execute(
+            "SELECT " + ", ".join(columns) + " FROM " + table +
+            " WHERE " + key_column + " = ?", (key_value,)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(columns.values(), row))
@@ -0,0 +1,151 @@
+"""Archive of the stays already checked out, out of the check in store"""
+import argparse
+import gzip
+import json
+import lzma
+import os
+import re
+from datetime import datetime
+from uc3m_travel.hotel_management_config import JSON_FILES_PATH
+from uc3m_travel.hotel_management_exception import HotelManagementException
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import store_lock, iter_store_file, encode_json_lines
+from uc3m_travel.storage.schema import iter_decoded
+
+# compression -> function that opens its files and their extension
+ARCHIVE_FORMATS = {"lzma": (lzma.open, ".jsonl.xz"),
+                   "gzip": (gzip.open, ".jsonl.gz")}
+ARCHIVE_NAME = ".archive."
+
+
+def archive_file(file_store, month, compression="lzma"):
+    """Returns the archive of the stays of the check in store that left in
+    the month ("2024-07")"""
+    return os.path.splitext(file_store)[0] + ARCHIVE_NAME + month + \
+        ARCHIVE_FORMATS[compression][1]
+
+
+def archive_files(file_store):
+    """Returns the archives of the check in store, sorted by month"""
+    root = os.path.splitext(file_store)[0]
+    directory = os.path.dirname(root) or "."
+    archive_name = re.compile(re.escape(os.path.basename(root) + ARCHIVE_NAME) +
+                              r"(\d{4}-\d{2})(" + "|".join(
+                                  re.escape(extension) for _, extension
+                                  in ARCHIVE_FORMATS.values()) + ")$")
+    archives = []
+    for file_name in sorted(os.listdir(directory)):
+        match = archive_name.match(file_name)
+        if match:
+            archives.append((match.group(1), os.path.join(directory, file_name)))
+    return archives
+
+
+def open_archive(file_name, mode, file_object=None):
+    """Opens an archive (or the file object of the archive) with the
+    compression of its extension"""
+    for open_function, extension in ARCHIVE_FORMATS.values():
+        if file_name.endswith(extension):
+            return open_function(file_name if file_object is None else file_object,
+                                 mode + "t", encoding="utf-8")
+    raise HotelManagementException("Wrong file or file path")
+
+
+def append_archive(file_name, stays):
+    """Appends the stays to an archive and waits until they are on disk,
+    together with the directory entry of a new archive"""
+    new_archive = not os.path.exists(file_name)
+    with open(file_name, "ab") as archive_file_object:
+        # cada escritura anade un nuevo flujo comprimido al archivo, y
+        # al leerlo se leen todos seguidos
+        with open_archive(file_name, "a", archive_file_object) as archive:
+            archive.write(encode_json_lines(stays))
+        archive_file_object.flush()
+        os.fsync(archive_file_object.fileno())
+    if new_archive:
+        directory = os.open(os.path.dirname(file_name) or ".", os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def archive_stays(file_store=None, checkout_file=None, compression="lzma"):
+    """Moves the stays of the check in store whose room key is in the
+    checkout store to compressed archives, one per month of departure. The
+    stays are appended to the archives, that are json lines, and only the
+    open stays are left in the check in store. The stays already archived
+    (by a run that stopped before rewriting the check in store) are not
+    appended again. Returns the number of stays added to the archive of
+    each month"""
+    if file_store is None:
+        file_store = JsonStore().store_file(JSON_FILES_PATH + "store_check_in.json")
+    if checkout_file is None:
+        checkout_file = JsonStore().store_file(JSON_FILES_PATH + "store_check_out.json")
+    # the stays of the checkouts saved later are archived the next time
+    checked_out = {checkout["room_key"]
+                   for checkout in JsonStore.load_json_store(checkout_file)}
+
+    archived = {}
+    with store_lock(file_store):
+        if JsonStore.file_stamp(file_store) is None:
+            return archived
+        open_stays = []
+        closed_stays = {}
+        for stay in iter_store_file(file_store):
+            if stay["_HotelStay__room_key"] not in checked_out:
+                open_stays.append(stay)
+                continue
+            month = datetime.fromtimestamp(
+                stay["_HotelStay__departure"]).strftime("%Y-%m")
+            closed_stays.setdefault(month, []).append(stay)
+        if not closed_stays:
+            return archived
+
+        for month, stays in closed_stays.items():
+            # el archivo se escribe antes que el almacen: si se para entre
+            # los dos, sus estancias ya archivadas no se repiten
+            in_archive = {item["_HotelStay__room_key"]
+                          for item in iter_archived_stays(file_store, [month])}
+            new_stays = [item for item in stays
+                         if item["_HotelStay__room_key"] not in in_archive]
+            if new_stays:
+                append_archive(archive_file(file_store, month, compression), new_stays)
+                archived[month] = len(new_stays)
+        JsonStore.write_json(file_store, open_stays)
+    return archived
+
+
+def iter_archived_stays(file_store=None, months=None):
+    """Yields the archived stays of the check in store (of the given
+    months, by default all), reading one at a time from the archives"""
+    if file_store is None:
+        file_store = JsonStore().store_file(JSON_FILES_PATH + "store_check_in.json")
+    for month, file_name in archive_files(file_store):
+        if months is not None and month not in months:
+            continue
+        with open_archive(file_name, "r") as archive:
+            yield from iter_decoded(json.loads(line) for line in archive
+                                    if line.strip())
+
+
+def main(argv=None):
+    """Command line entry point of the archival"""
+    parser = argparse.ArgumentParser(
+        description="Moves the stays checked out to monthly archives")
+    parser.add_argument("--json-path", default=JSON_FILES_PATH,
+                        help="directory of the json stores")
+    parser.add_argument("--compression", choices=sorted(ARCHIVE_FORMATS),
+                        default="lzma", help="compression of the archives")
+    args = parser.parse_args(argv)
+    json_store = JsonStore()
+    archived = archive_stays(
+        json_store.store_file(os.path.join(args.json_path, "store_check_in.json")),
+        json_store.store_file(os.path.join(args.json_path, "store_check_out.json")),
+        args.compression)
+    for month, count in archived.items():
+        print(month + ": " + str(count) + " stays archived")
+
+
+if __name__ == "__main__":
+    main()
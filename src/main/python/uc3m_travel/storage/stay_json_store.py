@@ -1,55 +1,162 @@
 """This module implements the JSON store for the checkin of a guest with a reservation"""
+import os
 from datetime import datetime
+from uc3m_travel.clock import SYSTEM_CLOCK
 from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.json_stream import store_lock
+from uc3m_travel.storage.binary_index import StayBinaryIndex, DepartureBinaryIndex
 from uc3m_travel.hotel_management_config import JSON_FILES_PATH
 from uc3m_travel.hotel_management_exception import HotelManagementException
 from uc3m_travel.hotel_stay import HotelStay
 from uc3m_travel.hotel_reservation import HotelReservation
+from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
 
 class StayStoreJson(JsonStore):
     """This module implements the JSON store for the checkin of a guest"""
+    _file_name = JSON_FILES_PATH + "store_check_in.json"
+
     def save_checkin(self, checkin_data):
         """manages the arrival of a guest with a reservation"""
         input_list = self.read_json_not_empty(checkin_data, "guest_arrival")
 
-        # comprobar valores del fichero
+        my_checkin = self.create_checkin(input_list, clock=self.clock)
+
+        # Ahora lo guardo en el almacen nuevo de checkin, comprobando que
+        # no he hecho otro ckeckin antes
+        result = self.add_checkins([my_checkin], [None])[0]
+        if isinstance(result, HotelManagementException):
+            raise result
+        return result
+
+    @staticmethod
+    def create_checkin(input_list, reservation_list=None,
+                       reservation_store=None, clock=None):
+        """checks the arrival data against the reservations store (or its
+        already loaded content) and returns the HotelStay of the guest,
+        arrived at the current time of the clock"""
+        clock = SYSTEM_CLOCK if clock is None else clock
+        # comprobar valores del fichero: un objeto json, no una lista
+        if not isinstance(input_list, dict):
+            raise HotelManagementException("JSON Decode Error - Wrong JSON Format")
         try:
             my_localizer = input_list["Localizer"]
             my_id_card = input_list["IdCard"]
         except KeyError as key_error:
             raise HotelManagementException("Error - Invalid Key in "
                                                "JSON") from key_error
+        if not isinstance(my_localizer, str) or not isinstance(my_id_card, str):
+            raise HotelManagementException("JSON Decode Error - Wrong JSON Format")
 
 
-        new_reservation = HotelReservation.create_reservation_from_arrival(my_id_card, my_localizer)
+        new_reservation = HotelReservation.create_reservation_from_arrival(
+            my_id_card, my_localizer, reservation_list, reservation_store)
 
         # compruebo si hoy es la fecha de checkin
         reservation_format = "%d/%m/%Y"
         date_obj = datetime.strptime(new_reservation.arrival,
                                          reservation_format)
-        if date_obj.date() != datetime.date(datetime.utcnow()):
+        if date_obj.date() != clock.today():
             raise HotelManagementException("Error: today is not reservation date")
 
         # genero la room key para ello llamo a Hotel Stay
-        my_checkin = HotelStay(idcard=my_id_card, numdays=int(
+        return HotelStay(idcard=my_id_card, numdays=int(
             new_reservation.num_days),
                                 localizer=my_localizer,
-                                roomtype=new_reservation.room_type)
+                                roomtype=new_reservation.room_type,
+                                clock=clock)
+
+    def save_checkins(self, input_files, max_workers=8):
+        """manages the arrival of many guests: the input files are parsed
+        concurrently, checked against a single load of the reservations
+        store and all the check ins are saved with a single write.
+        Returns, for each file, its room key or the exception raised"""
+        parsed_inputs = self.read_input_files(input_files, max_workers)
+
+        reservation_store = ReservationStoreJson()
+        try:
+            reservation_list = reservation_store.read_json_not_empty(
+                reservation_store.store_file(), "guest_arrival")
+        except HotelManagementException:
+            # each file will raise the error of the missing store
+            reservation_list = None
+
+        results = self.create_checkins(parsed_inputs, reservation_list)
+        checkins = [None if isinstance(result, HotelManagementException) else result
+                    for result in results]
+        return self.add_checkins(checkins, results)
 
-        # Ahora lo guardo en el almacen nuevo de checkin
-        # escribo el fichero Json con todos los datos
-        file_store = JSON_FILES_PATH + "store_check_in.json"
+    def create_checkins(self, parsed_inputs, reservation_list=None,
+                        reservation_store=None):
+        """returns, for each parsed input file (or the exception raised
+        when reading it), its HotelStay or the exception that prevents it"""
+        checkins = []
+        for input_list in parsed_inputs:
+            try:
+                if isinstance(input_list, HotelManagementException):
+                    raise input_list
+                checkins.append(self.create_checkin(input_list, reservation_list,
+                                                    reservation_store, self.clock))
+            except HotelManagementException as exception:
+                checkins.append(exception)
+            except (TypeError, KeyError, ValueError):
+                # a malformed file (or reservation) only fails its own check in
+                checkins.append(HotelManagementException(
+                    "JSON Decode Error - Wrong JSON Format"))
+        return checkins
 
-        room_key_list = self.load_json_store(file_store)
+    def add_checkins(self, checkins, results):
+        """saves the created check ins (None for the ones that failed) with
+        a single write of the store, unless they were already done. Returns
+        the results with the room key of each saved check in"""
+        file_store = self.store_file()
+        # the indexes of the stays are loaded before the store is written
+        # and the new stays are merged into them, so the checkouts do not
+        # have to rebuild them
+        with store_lock(file_store), StayBinaryIndex(file_store) as stays, \
+                DepartureBinaryIndex(file_store) as departures:
+            stays.load()
+            departures.load()
+            room_key_list = None if self.is_append_only() else \
+                self.load_json_store(file_store)
 
-        # comprobar que no he hecho otro ckeckin antes
-        for item in room_key_list:
-            if my_checkin.room_key == item["_HotelStay__room_key"]:
-                raise HotelManagementException ("ckeckin  ya realizado")
+            batch_room_keys = set()
+            new_checkins = []
+            for position, my_checkin in enumerate(checkins):
+                if my_checkin is None:
+                    continue
+                if my_checkin.room_key in batch_room_keys or my_checkin.room_key in stays:
+                    results[position] = HotelManagementException(
+                        "ckeckin  ya realizado")
+                    continue
+                batch_room_keys.add(my_checkin.room_key)
+                new_checkins.append(my_checkin.__dict__)
+                results[position] = my_checkin.room_key
 
-        # añado los datos de mi reserva a la lista , a lo que hubiera
-        room_key_list.append(my_checkin.__dict__)
+            if new_checkins:
+                self.add_records(file_store, new_checkins, room_key_list)
+                stays.add(new_checkins)
+                departures.add(new_checkins)
+        return results
 
-        self.write_json(file_store, room_key_list)
+    def save_checkin_directory(self, directory, results_file=None):
+        """manages the arrival of the guests of every json file in the
+        directory and, if results_file is given, writes the result of each
+        file in it"""
+        input_files = sorted(
+            os.path.join(directory, file_name)
+            for file_name in os.listdir(directory)
+            if file_name.endswith(".json") and (
+                results_file is None or
+                os.path.abspath(os.path.join(directory, file_name)) !=
+                os.path.abspath(results_file)))
+        checkins = self.save_checkins(input_files)
 
-        return my_checkin.room_key
+        results = {}
+        for input_file, result in zip(input_files, checkins):
+            results[os.path.basename(input_file)] = \
+                {"error": result.message} \
+                if isinstance(result, HotelManagementException) \
+                else {"room_key": result}
+        if results_file is not None:
+            self.write_json(results_file, results)
+        return results
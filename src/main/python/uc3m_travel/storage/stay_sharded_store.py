@@ -0,0 +1,43 @@
+"""This module implements the json store for the checkin of a guest sharded by the router"""
+from uc3m_travel.storage.stay_json_store import StayStoreJson
+from uc3m_travel.storage.reservation_sharded_store import ReservationStoreSharded
+from uc3m_travel.storage.sharding import ShardedStore
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+class StayStoreSharded(ShardedStore, StayStoreJson):
+    """This module implements the sharded json store for the checkin of a guest"""
+    SHARD_CLASS = StayStoreJson
+
+    def save_checkin(self, checkin_data):
+        """manages the arrival of a guest with a reservation"""
+        result = self.save_checkins([checkin_data], max_workers=1)[0]
+        if isinstance(result, HotelManagementException):
+            raise result
+        return result
+
+    def save_checkins(self, input_files, max_workers=8):
+        """manages the arrival of many guests: each reservation is read from
+        its shard and each check in is saved in its shard. Returns, for each
+        file, its room key or the exception raised"""
+        parsed_inputs = self.read_input_files(input_files, max_workers)
+        reservation_store = ReservationStoreSharded(clock=self.clock)
+
+        results = []
+        shard_checkins = {}
+        for position, my_checkin in enumerate(self.create_checkins(
+                parsed_inputs, reservation_store=reservation_store)):
+            if isinstance(my_checkin, HotelManagementException):
+                results.append(my_checkin)
+                continue
+            results.append(None)
+            shard_key = self.router.stay_key(my_checkin.__dict__)
+            shard_checkins.setdefault(shard_key, {})[position] = my_checkin
+
+        # the room key depends on the localizer and the arrival, so a check
+        # in can only be repeated in its own shard
+        for shard_key, checkins in shard_checkins.items():
+            saved = self.shard(shard_key).add_checkins(list(checkins.values()),
+                                                       [None] * len(checkins))
+            for position, result in zip(checkins, saved):
+                results[position] = result
+        return results
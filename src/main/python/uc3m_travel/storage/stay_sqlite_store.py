@@ -0,0 +1,60 @@
+"""This module implements the SQLite store for the checkin of a guest with a reservation"""
+import sqlite3
+from uc3m_travel.storage.sqlite_store import SqliteStore, STAY_COLUMNS
+from uc3m_travel.storage.stay_json_store import StayStoreJson
+from uc3m_travel.storage.reservation_sqlite_store import ReservationStoreSqlite
+from uc3m_travel.hotel_management_exception import HotelManagementException
+
+class StayStoreSqlite(SqliteStore, StayStoreJson):
+    """This module implements the SQLite store for the checkin of a guest"""
+    def save_checkin(self, checkin_data):
+        """manages the arrival of a guest with a reservation"""
+        result = self.save_checkins([checkin_data], max_workers=1)[0]
+        if isinstance(result, HotelManagementException):
+            raise result
+        return result
+
+    def save_checkins(self, input_files, max_workers=8):
+        """manages the arrival of many guests, saving all the check ins in a
+        single transaction. Returns, for each file, its room key or the
+        exception raised"""
+        parsed_inputs = self.read_input_files(input_files, max_workers)
+        reservation_store = ReservationStoreSqlite(self._db_file)
+
+        checkins = self.create_checkins(parsed_inputs,
+                                        reservation_store=reservation_store)
+        try:
+            return self._insert_checkins(list(checkins))
+        except sqlite3.IntegrityError:
+            # otro proceso guardo el checkin entre la comprobacion y la
+            # insercion: al repetirlo la comprobacion lo encuentra
+            pass
+        try:
+            return self._insert_checkins(list(checkins))
+        except sqlite3.IntegrityError as integrity_error:
+            raise HotelManagementException("ckeckin  ya realizado") \
+                from integrity_error
+
+    def _insert_checkins(self, results):
+        """saves the check ins of the results that are not exceptions in a
+        write transaction. Returns the results with their room keys"""
+        # comprobar que no he hecho otro ckeckin antes y guardarlos
+        new_checkins = []
+        batch_room_keys = set()
+        with self.connect(immediate=True) as connection:
+            for position, my_checkin in enumerate(results):
+                if isinstance(my_checkin, HotelManagementException):
+                    continue
+                if my_checkin.room_key in batch_room_keys or \
+                        self.select_record(connection, "stays",
+                                           STAY_COLUMNS, "room_key",
+                                           my_checkin.room_key):
+                    results[position] = HotelManagementException(
+                        "ckeckin  ya realizado")
+                    continue
+                batch_room_keys.add(my_checkin.room_key)
+                new_checkins.append(my_checkin.__dict__)
+                results[position] = my_checkin.room_key
+            self.insert_records(connection, "stays", STAY_COLUMNS,
+                                new_checkins)
+        return results
@@ -0,0 +1,373 @@
+"""Seeded generator of synthetic reservation requests, arrival files and
+reservation, check in and checkout stores, that pass the validations of the
+hotel except for a given fraction of records that are invalid on purpose.
+With NumPy the columns of numbers (id cards, credit cards with their luhn
+digit, phones...) are generated with array arithmetic; without it they are
+generated one by one with the random module. Both are deterministic for a
+seed, but do not give the same data"""
+import argparse
+import csv
+import json
+import os
+import random
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from uc3m_travel.attributes.attribute_id_card import IdCard
+from uc3m_travel.hotel_reservation import compute_localizer
+from uc3m_travel.hotel_stay import compute_room_key
+from uc3m_travel.reservation_csv_importer import CSV_COLUMNS
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.records import RESERVATION_KEYS, STAY_KEYS, CHECKOUT_KEYS
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+FIRST_NAMES = ("JOSE", "MARIA", "ANTONIO", "CARMEN", "MANUEL", "LUCIA",
+               "FRANCISCO", "ANA", "DAVID", "ELENA", "JAVIER", "LAURA",
+               "CARLOS", "MARTA", "MIGUEL", "SARA")
+SURNAMES = ("LOPEZ", "GARCIA", "MARTINEZ", "SANCHEZ", "PEREZ", "GOMEZ",
+            "MARTIN", "JIMENEZ", "RUIZ", "HERNANDEZ", "DIAZ", "MORENO",
+            "ALVAREZ", "ROMERO", "NAVARRO", "TORRES")
+ROOM_TYPES = ("SINGLE", "DOUBLE", "SUITE")
+
+# field of the request broken in an invalid request -> error of room_reservation
+INVALID_REQUESTS = {
+    "id_card": "Invalid IdCard letter",
+    "credit_card": "Invalid credit card number (not luhn)",
+    "name_surname": "Invalid name format",
+    "phone_number": "Invalid phone number format",
+    "room_type": "Invalid roomtype value",
+    "arrival_date": "Invalid date format",
+    "num_days": "Numdays should be in the range 1-10"}
+# field of an invalid request -> its broken value. The id card and the credit
+# card keep their format but not their check
+BROKEN_VALUES = {
+    "id_card": lambda value: value[:-1] + IdCard.DNI_LETTERS[
+        (IdCard.DNI_LETTERS.index(value[-1]) + 1) % 23],
+    "credit_card": lambda value: value[:-1] + str((int(value[-1]) + 1) % 10),
+    "name_surname": lambda value: value.split(" ")[0],
+    "phone_number": lambda value: value[1:],
+    "room_type": lambda value: "TRIPLE",
+    "arrival_date": lambda value: datetime.strptime(value, "%d/%m/%Y").strftime("%Y-%m-%d"),
+    "num_days": lambda value: 10 + value}
+# errors of guest_arrival for the invalid arrival files and tampered reservations
+WRONG_ID_CARD = "Error: Localizer is not correct for this IdCard"
+WRONG_LOCALIZER = "Invalid localizer"
+TAMPERED = "Error: reservation has been manipulated"
+
+RESERVATION_ITEM_KEYS = tuple(RESERVATION_KEYS.values())
+STAY_ITEM_KEYS = tuple(STAY_KEYS.values())
+CHECKOUT_ITEM_KEYS = tuple(CHECKOUT_KEYS.values())
+RESERVATION_FIELDS = itemgetter(*RESERVATION_ITEM_KEYS)
+# columns of a request, in the order of the arguments of compute_localizer
+LOCALIZER_COLUMNS = ("id_card", "name_surname", "credit_card", "phone_number",
+                     "arrival_date", "num_days", "room_type")
+
+CARD_LENGTH = 16
+# a phone is + and 9 digits: the prefix and 7 more
+PHONE_PREFIX = "+34"
+PHONE_DIGITS = 7
+
+
+def luhn_digit(digits):
+    """returns the digit that completes the luhn checksum of the digits"""
+    # the last digit of the card is added as it is, so the one before it is
+    # the first one doubled
+    checksum = sum(digits[-2::-2]) + \
+        sum(digit * 2 - 9 * (digit > 4) for digit in digits[-1::-2])
+    return (10 - checksum % 10) % 10
+
+
+class SyntheticData():
+    """Generator of synthetic data. Each kind of data (requests, stores) is
+    drawn from its own random stream of the seed, so it does not depend on
+    what was generated before. The id cards of count records are the
+    numbers first_id_card..first_id_card + count - 1 shuffled, so they are
+    unique in a store. The arrival dates are in the arrival_days days from
+    first_arrival, skipping the 30th and 31st that ArrivalDate rejects"""
+    # pylint: disable=too-many-arguments
+    def __init__(self, seed=0, invalid_fraction=0.0, first_arrival=date(2024, 7, 1),
+                 arrival_days=180, first_id_card=0):
+        if not 0 <= invalid_fraction <= 1:
+            raise ValueError("Invalid fraction of invalid records")
+        self.seed = seed
+        self.invalid_fraction = invalid_fraction
+        self.first_id_card = first_id_card
+        self.arrival_dates = [day for day in (first_arrival + timedelta(days=offset)
+                                              for offset in range(arrival_days))
+                              if day.day < 30]
+
+    def _random(self, stream):
+        """returns the random generator of a stream of the seed"""
+        if np is None:
+            return random.Random(f"{self.seed}:{stream}")
+        return np.random.default_rng([self.seed, stream])
+
+    def _draws(self, stream, count, width):
+        """returns count rows of width random numbers in [0, 1) of a stream"""
+        rng = self._random(stream)
+        if np is None:
+            return [[rng.random() for _ in range(width)] for _ in range(count)]
+        return rng.random((count, width)).tolist()
+
+    def _columns(self, count, stream):
+        """returns the columns of count valid requests, as lists, and the
+        field to break in each of the invalid ones (None if it is valid)"""
+        rng = self._random(stream)
+        if np is None:
+            columns = self._python_columns(rng, count)
+        else:
+            columns = self._numpy_columns(rng, count)
+        invalid = columns.pop("invalid")
+        kinds = columns.pop("kind")
+        fields = list(INVALID_REQUESTS)
+        columns["name_surname"] = [
+            FIRST_NAMES[first] + " " + SURNAMES[surname] + " " + SURNAMES[second]
+            for first, surname, second in zip(columns.pop("first_name"),
+                                              columns.pop("surname"),
+                                              columns.pop("second_surname"))]
+        columns["room_type"] = [ROOM_TYPES[room] for room in columns["room_type"]]
+        arrival_dates = [day.strftime("%d/%m/%Y") for day in self.arrival_dates]
+        columns["arrival_date"] = [arrival_dates[day] for day in columns["arrival_date"]]
+        broken = [fields[kind] if is_invalid else None
+                  for is_invalid, kind in zip(invalid, kinds)]
+        return columns, broken
+
+    def _numpy_columns(self, rng, count):
+        """columns with array arithmetic"""
+        numbers = self.first_id_card + rng.permutation(count)
+        cards = rng.integers(0, 10, (count, CARD_LENGTH), dtype=np.int64)
+        cards[:, 0] = rng.choice([4, 5], count)
+        body = cards[:, :CARD_LENGTH - 1]
+        doubled = body[:, -1::-2]
+        checksum = body[:, -2::-2].sum(axis=1) + (2 * doubled - 9 * (doubled > 4)).sum(axis=1)
+        cards[:, -1] = (10 - checksum % 10) % 10
+        phones = rng.integers(0, 10, (count, PHONE_DIGITS), dtype=np.int64)
+        dni_letters = np.frombuffer(IdCard.DNI_LETTERS.encode("ascii"), dtype=np.uint8)
+        id_digits = (numbers[:, None] // 10 ** np.arange(7, -1, -1)) % 10
+        return {"id_card": _ascii_strings(np.hstack([id_digits + 48,
+                                                     dni_letters[numbers % 23][:, None]])),
+                "credit_card": _ascii_strings(cards + 48),
+                "phone_number": [PHONE_PREFIX + phone
+                                 for phone in _ascii_strings(phones + 48)],
+                "first_name": rng.integers(0, len(FIRST_NAMES), count).tolist(),
+                "surname": rng.integers(0, len(SURNAMES), count).tolist(),
+                "second_surname": rng.integers(0, len(SURNAMES), count).tolist(),
+                "room_type": rng.integers(0, len(ROOM_TYPES), count).tolist(),
+                "arrival_date": rng.integers(0, len(self.arrival_dates), count).tolist(),
+                "num_days": rng.integers(1, 11, count).tolist(),
+                "invalid": (rng.random(count) < self.invalid_fraction).tolist(),
+                "kind": rng.integers(0, len(INVALID_REQUESTS), count).tolist()}
+
+    def _python_columns(self, rng, count):
+        """columns with the random module, one value at a time"""
+        numbers = list(range(self.first_id_card, self.first_id_card + count))
+        rng.shuffle(numbers)
+        cards = []
+        for _ in range(count):
+            digits = [rng.choice((4, 5))] + [rng.randrange(10)
+                                             for _ in range(CARD_LENGTH - 2)]
+            cards.append("".join(map(str, digits + [luhn_digit(digits)])))
+        return {"id_card": [f"{number:08d}" + IdCard.DNI_LETTERS[number % 23]
+                            for number in numbers],
+                "credit_card": cards,
+                "phone_number": [PHONE_PREFIX +
+                                 f"{rng.randrange(10 ** PHONE_DIGITS):0{PHONE_DIGITS}d}"
+                                 for _ in range(count)],
+                "first_name": [rng.randrange(len(FIRST_NAMES)) for _ in range(count)],
+                "surname": [rng.randrange(len(SURNAMES)) for _ in range(count)],
+                "second_surname": [rng.randrange(len(SURNAMES)) for _ in range(count)],
+                "room_type": [rng.randrange(len(ROOM_TYPES)) for _ in range(count)],
+                "arrival_date": [rng.randrange(len(self.arrival_dates))
+                                 for _ in range(count)],
+                "num_days": [rng.randint(1, 10) for _ in range(count)],
+                "invalid": [rng.random() < self.invalid_fraction for _ in range(count)],
+                "kind": [rng.randrange(len(INVALID_REQUESTS)) for _ in range(count)]}
+
+    def reservation_requests(self, count):
+        """returns count requests (the arguments of room_reservation) and,
+        for each one, None or the error room_reservation gives for it"""
+        columns, broken = self._columns(count, 1)
+        requests = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        for request, field in zip(requests, broken):
+            if field is not None:
+                request[field] = BROKEN_VALUES[field](request[field])
+        return requests, [None if field is None else INVALID_REQUESTS[field]
+                          for field in broken]
+
+    def store_records(self, count, reservation_date=None, arrived_fraction=0.5,
+                      checked_out_fraction=0.5):
+        """returns the items of a reservation, a check in and a checkout
+        store of count reservations. A fraction of the guests arrived on
+        their arrival date and a fraction of those already left. The invalid
+        fraction of the reservations are tampered (their room type was
+        changed after the localizer was computed) and their guests never
+        arrived. Returns too the error of the arrival of each reservation
+        (None if it is valid)"""
+        reservations, errors = self._reservation_items(count, reservation_date)
+        stays, checkouts = self._stay_items(reservations, errors, arrived_fraction,
+                                            checked_out_fraction)
+        return reservations, stays, checkouts, errors
+
+    def _reservation_items(self, count, reservation_date):
+        """returns the reservation store items of count reservations and the
+        error of the arrival of each one (the invalid ones are tampered)"""
+        columns, broken = self._columns(count, 2)
+        if reservation_date is None:
+            reservation_date = datetime.combine(self.arrival_dates[0],
+                                                datetime.min.time()) - timedelta(days=30)
+        reservation_timestamp = reservation_date.timestamp()
+        requests = zip(*(columns[column] for column in LOCALIZER_COLUMNS))
+        reservations = [_reservation_item(request, reservation_timestamp + number / 1000,
+                                          field is not None)
+                        for number, (request, field) in enumerate(zip(requests, broken))]
+        return reservations, [None if field is None else TAMPERED for field in broken]
+
+    def _stay_items(self, reservations, errors, arrived_fraction, checked_out_fraction):
+        """returns the check in store items of the guests of the valid
+        reservations that arrived and the checkout store items of those
+        that left"""
+        draws = self._draws(3, len(reservations), 3)
+        # 13:00 of each arrival date, by its "dd/mm/yyyy"
+        arrival_times = {day.strftime("%d/%m/%Y"): datetime.combine(
+            day, datetime.min.time()).timestamp() + 13 * 3600
+                         for day in self.arrival_dates}
+        stays = []
+        checkouts = []
+        for reservation, error, (arrives, leaves, minute) in zip(reservations, errors, draws):
+            if error is not None or arrives >= arrived_fraction:
+                continue
+            stays.append(_stay_item(reservation, arrival_times, minute))
+            if leaves < checked_out_fraction:
+                checkouts.append(dict(zip(CHECKOUT_ITEM_KEYS, (
+                    stays[-1][STAY_KEYS["room_key"]], stays[-1][STAY_KEYS["departure"]]))))
+        return stays, checkouts
+
+    def arrivals(self, reservations, errors=None):
+        """returns the input of guest_arrival of each reservation store item
+        and the error it gives (None if it is valid; errors are the ones of
+        store_records). The invalid fraction of the arrivals have the id
+        card of another guest or a wrong localizer"""
+        draws = self._draws(4, len(reservations), 2)
+        errors = [None] * len(reservations) if errors is None else errors
+        arrivals = []
+        arrival_errors = []
+        for number, (reservation, error) in enumerate(zip(reservations, errors)):
+            arrival = {"Localizer": reservation["_HotelReservation__localizer"],
+                       "IdCard": reservation["_HotelReservation__id_card"]}
+            invalid, kind = draws[number]
+            if invalid < self.invalid_fraction and len(reservations) > 1:
+                if kind < 0.5:
+                    other = reservations[(number + 1) % len(reservations)]
+                    arrival["IdCard"] = other["_HotelReservation__id_card"]
+                    error = WRONG_ID_CARD
+                else:
+                    arrival["Localizer"] = "z" + arrival["Localizer"][1:]
+                    error = WRONG_LOCALIZER
+            arrivals.append(arrival)
+            arrival_errors.append(error)
+        return arrivals, arrival_errors
+
+
+def _ascii_strings(codes):
+    """returns the strings of the rows of an array of ascii codes"""
+    rows, width = codes.shape
+    return np.ascontiguousarray(codes, dtype=np.uint8).view(f"S{width}") \
+        .reshape(rows).astype(f"U{width}").tolist()
+
+
+def _reservation_item(request, booked_at, tampered):
+    """returns the reservation store item of a request (its values of the
+    LOCALIZER_COLUMNS) booked at the timestamp. The room type of a tampered
+    one is not the one of its localizer"""
+    (id_card, name_surname, credit_card, phone_number, arrival_date, num_days,
+     room_type) = request
+    localizer = compute_localizer(id_card=id_card, name_surname=name_surname,
+                                  credit_card=credit_card, phone_number=phone_number,
+                                  reservation_date=booked_at, arrival=arrival_date,
+                                  num_days=num_days, room_type=room_type)
+    if tampered:
+        room_type = ROOM_TYPES[(ROOM_TYPES.index(room_type) + 1) % 3]
+    return dict(zip(RESERVATION_ITEM_KEYS, (
+        localizer, id_card, credit_card, arrival_date, booked_at, name_surname,
+        phone_number, room_type, num_days)))
+
+
+def _stay_item(reservation, arrival_times, minute):
+    """returns the check in store item of the guest of a reservation store
+    item, arrived the given fraction of an hour after the arrival time of
+    its arrival date"""
+    (localizer, id_card, _, arrival_date, _, _, _, room_type,
+     num_days) = RESERVATION_FIELDS(reservation)
+    arrival = arrival_times[arrival_date] + round(minute * 3600, 3)
+    departure = arrival + num_days * 24 * 60 * 60
+    room_key = compute_room_key("SHA-256", room_type, localizer, arrival, departure)
+    return dict(zip(STAY_ITEM_KEYS, (room_key, "SHA-256", room_type, id_card,
+                                     localizer, arrival, departure)))
+
+
+def write_stores(directory, reservations, stays, checkouts):
+    """writes the reservation, check in and checkout stores in the
+    directory, in the storage mode and schema version of the stores"""
+    json_store = JsonStore()
+    for file_name, records in (("store_reservation.json", reservations),
+                               ("store_check_in.json", stays),
+                               ("store_check_out.json", checkouts)):
+        JsonStore.write_json(json_store.store_file(os.path.join(directory, file_name)),
+                             records)
+
+
+def write_arrival_files(directory, arrivals):
+    """writes each arrival in a file of the directory. Returns the files"""
+    files = []
+    for number, arrival in enumerate(arrivals):
+        files.append(os.path.join(directory, f"arrival_{number:07d}.json"))
+        with open(files[-1], "w", encoding="utf-8") as file:
+            json.dump(arrival, file)
+    return files
+
+
+def write_requests_csv(csv_file, requests):
+    """writes the requests as a csv file of the reservation csv importer"""
+    with open(csv_file, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows([request[argument] for argument in CSV_COLUMNS.values()]
+                         for request in requests)
+
+
+def main(argv=None):
+    """Command line entry point of the generator"""
+    parser = argparse.ArgumentParser(
+        description="Generates synthetic reservations, arrivals and stores")
+    parser.add_argument("directory", help="directory of the generated files")
+    parser.add_argument("--records", type=int, default=1000,
+                        help="reservations of the stores")
+    parser.add_argument("--requests", type=int, default=0,
+                        help="reservation requests of requests.csv")
+    parser.add_argument("--arrivals", type=int, default=0,
+                        help="arrival files of the first reservations")
+    parser.add_argument("--invalid-fraction", type=float, default=0.0,
+                        help="fraction of invalid or tampered records")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    generator = SyntheticData(args.seed, args.invalid_fraction)
+    os.makedirs(args.directory, exist_ok=True)
+    reservations, stays, checkouts, errors = generator.store_records(args.records)
+    write_stores(args.directory, reservations, stays, checkouts)
+    print(f"{len(reservations)} reservations, {len(stays)} stays and "
+          f"{len(checkouts)} checkouts saved")
+    if args.arrivals:
+        arrivals, _ = generator.arrivals(reservations[:args.arrivals],
+                                         errors[:args.arrivals])
+        write_arrival_files(args.directory, arrivals)
+        print(f"{len(arrivals)} arrival files written")
+    if args.requests:
+        requests, _ = generator.reservation_requests(args.requests)
+        write_requests_csv(os.path.join(args.directory, "requests.csv"), requests)
+        print(f"{len(requests)} reservation requests written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Mixin of the test cases that change the stores of JSON_FILES_PATH and
+the reservations they make"""
+import os
+import re
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH, JSON_FILES_GUEST_ARRIVAL, HotelManager,
+                         HotelManagementException)
+from uc3m_travel.attributes.attribute_id_card import IdCard
+
+SHARD_FILE = re.compile(r"^store_(reservation|check_in)\.[0-9a-f-]+[._]")
+BACKENDS = ("json", "sqlite", "sharded")
+ROOM_KEY_OK = "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859"
+# the reservation of key_ok.json and the fields of the one of JOSE SANCHO
+KEY_OK_REQUEST = {"credit_card": "5105105105105100",
+                  "name_surname": "JOSE LOPEZ",
+                  "id_card": "12345678Z",
+                  "phone_number": "+341234567",
+                  "room_type": "SINGLE",
+                  "arrival_date": "01/07/2024",
+                  "num_days": 1}
+SANCHO_FIELDS = {"name_surname": "JOSE SANCHO",
+                 "id_card": "05270358T",
+                 "room_type": "DOUBLE",
+                 "num_days": 2}
+
+
+def id_card(number):
+    """ returns a valid id card of the number """
+    return f"{number:08d}{IdCard.DNI_LETTERS[number % 23]}"
+
+
+def reservation_request(**fields):
+    """ returns the arguments of the reservation of key_ok.json with the
+    given fields changed """
+    return dict(KEY_OK_REQUEST, **fields)
+
+
+@freeze_time("2024/03/22 13:00:00")
+def make_reservation(**fields):
+    """ makes the reservation of key_ok.json, with the given fields
+    changed, on the reservation date of the test cases and returns its
+    localizer """
+    return HotelManager().room_reservation(**reservation_request(**fields))
+
+
+class StoreBackupMixin():
+    """Keeps the content of the store files of the test case, removes them
+    (and their shards) before each test and restores them after it. It
+    goes before TestCase in the bases of the test case"""
+    store_files = []
+
+    # pylint: disable=invalid-name
+    def setUp(self):
+        """ the stores are empty, their content is kept to restore it """
+        super().setUp()
+        self.saved_stores = {}
+        for fichero in self.store_files:
+            if os.path.exists(JSON_FILES_PATH + fichero):
+                with open(JSON_FILES_PATH + fichero, "rb") as file:
+                    self.saved_stores[fichero] = file.read()
+        self.remove_stores()
+
+    def tearDown(self):
+        """ restores the stores """
+        self.remove_stores()
+        for fichero, content in self.saved_stores.items():
+            with open(JSON_FILES_PATH + fichero, "wb") as file:
+                file.write(content)
+        super().tearDown()
+
+    def remove_stores(self):
+        """ removes the stores and their shards """
+        for fichero in os.listdir(JSON_FILES_PATH):
+            if fichero in self.store_files or SHARD_FILE.match(fichero):
+                os.remove(JSON_FILES_PATH + fichero)
+
+    def for_each_backend(self, check):
+        """ runs check with the manager in a subtest of each storage
+        backend, removing the stores before it """
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                self.remove_stores()
+                mngr = HotelManager()
+                mngr.set_storage_backend(backend)
+                check(mngr)
+
+    def check_arrival(self, mngr):
+        """ the guest of key_ok.json arrives once """
+        with freeze_time("2024/07/01 13:00:00"):
+            self.assertEqual(mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json"),
+                             ROOM_KEY_OK)
+            with self.assertRaises(HotelManagementException) as c_m:
+                mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        self.assertEqual(c_m.exception.message, "ckeckin  ya realizado")
+
+    def check_checkout(self, mngr):
+        """ the guest of key_ok.json leaves once """
+        with freeze_time("2024-07-02"):
+            self.assertTrue(mngr.guest_checkout(ROOM_KEY_OK))
+            with self.assertRaises(HotelManagementException) as c_m:
+                mngr.guest_checkout(ROOM_KEY_OK)
+        self.assertEqual(c_m.exception.message, "Guest is already out")
@@ -0,0 +1,110 @@
+"""Test cases for the asyncio facade of the hotel manager"""
+import asyncio
+import time
+from unittest import TestCase
+from unittest.mock import patch
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (AsyncHotelManager, HotelManager, HotelManagementException,
+                         JSON_FILES_PATH, JSON_FILES_GUEST_ARRIVAL)
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from store_backup import StoreBackupMixin, id_card, reservation_request
+
+ROOM_KEY_OK = "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859"
+
+
+class TestAsyncHotelManager(StoreBackupMixin, TestCase):
+    """Class for testing AsyncHotelManager"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json"]
+
+    def test_coalesced_reservations(self):
+        """concurrent reservations are saved in a few batches and each
+        caller gets its localizer or its error"""
+        async def make_all():
+            async with AsyncHotelManager(max_batch_size=40) as manager:
+                results = await asyncio.gather(
+                    *[manager.room_reservation(**reservation_request(id_card=id_card(number % 100)))
+                      for number in range(101)], return_exceptions=True)
+            return manager, results
+
+        manager, results = asyncio.run(make_all())
+        self.assertEqual(manager.batches, 3)
+        self.assertEqual(len(JsonStore.load_json_store(
+            JSON_FILES_PATH + "store_reservation.json")), 100)
+        # the batches run at once, so either request of the id card may win
+        errors = [result for result in results
+                  if isinstance(result, HotelManagementException)]
+        self.assertEqual([error.message for error in errors],
+                         ["This ID card has another reservation"])
+        self.assertIn(errors[0], (results[0], results[100]))
+        self.assertEqual(len(set(results) - set(errors)), 100)
+
+    def test_malformed_request(self):
+        """a request that makes the bulk method fail only fails its caller"""
+        async def make_all():
+            async with AsyncHotelManager() as manager:
+                return await asyncio.gather(
+                    manager.guest_checkout(ROOM_KEY_OK),
+                    manager.guest_checkout(None),
+                    return_exceptions=True)
+
+        results = asyncio.run(make_all())
+        self.assertIsInstance(results[0], HotelManagementException)
+        self.assertNotIsInstance(results[1], HotelManagementException)
+        self.assertIsInstance(results[1], Exception)
+
+    def test_async_flow(self):
+        """reservation, arrival and checkout awaited one after the other"""
+        async def flow(manager):
+            with freeze_time("2024/03/22 13:00:00"):
+                localizer = await manager.room_reservation(**reservation_request())
+            with freeze_time("2024/07/01 13:00:00"):
+                room_key = await manager.guest_arrival(
+                    JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+            with freeze_time("2024-07-02"):
+                checked_out = await manager.guest_checkout(room_key)
+                with self.assertRaises(HotelManagementException) as c_m:
+                    await manager.guest_checkout(room_key)
+            return localizer, room_key, checked_out, c_m.exception.message
+
+        async def run_flow():
+            async with AsyncHotelManager() as manager:
+                return await flow(manager)
+
+        self.assertEqual(asyncio.run(run_flow()),
+                         ("450a53be9b39944e62e7164ca5f5aadf", ROOM_KEY_OK, True,
+                          "Guest is already out"))
+
+    def test_close_does_not_block(self):
+        """closing waits for the pending calls in the event loop, that goes
+        on running, and the calls made after it are rejected"""
+        def slow_checkouts(_, room_keys):
+            time.sleep(0.2)
+            return [{"room_key": room_key} for room_key in room_keys]
+
+        async def close_while_running():
+            ticks = []
+
+            async def tick():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0.01)
+
+            manager = AsyncHotelManager()
+            checkout = asyncio.ensure_future(manager.guest_checkout(ROOM_KEY_OK))
+            ticker = asyncio.ensure_future(tick())
+            await asyncio.sleep(0)
+            await manager.aclose()
+            ticker.cancel()
+            with self.assertRaises(HotelManagementException) as c_m:
+                await manager.guest_checkout(ROOM_KEY_OK)
+            return await checkout, len(ticks), c_m.exception.message
+
+        with patch.object(type(HotelManager()), "guest_checkouts", slow_checkouts):
+            checked_out, ticks, message = asyncio.run(close_while_running())
+        self.assertTrue(checked_out)
+        self.assertGreater(ticks, 5)
+        self.assertEqual(message, "Error: the hotel manager is closed")
@@ -0,0 +1,32 @@
+"""Test cases for the class level attribute validators"""
+from unittest import TestCase
+# pylint: disable=import-error
+from uc3m_travel import HotelManagementException
+# pylint: disable=import-error
+from uc3m_travel.attributes.attribute_credit_card import CreditCard
+# pylint: disable=import-error
+from uc3m_travel.attributes.attribute_id_card import IdCard
+
+
+class TestAttributeValidators(TestCase):
+    """Class for testing validate and validate_many"""
+    def test_validate_without_object(self):
+        """the class validates and returns the value"""
+        self.assertEqual(IdCard.validate("12345678Z"), "12345678Z")
+        with self.assertRaises(HotelManagementException) as c_m:
+            IdCard.validate("12345678A")
+        self.assertEqual(c_m.exception.message, "Invalid IdCard letter")
+
+    def test_pattern_is_compiled_once(self):
+        """every object shares the regex compiled for its class"""
+        # pylint: disable=protected-access
+        self.assertIs(IdCard("12345678Z")._regex, IdCard("87654123L")._regex)
+        self.assertIsNot(IdCard._regex, CreditCard._regex)
+
+    def test_validate_many(self):
+        """each value gets None or its error message"""
+        self.assertEqual(CreditCard.validate_many(["5105105105105100",
+                                                   "5105105105105101",
+                                                   "510510510510510"]),
+                         [None, "Invalid credit card number (not luhn)",
+                          "Invalid credit card format"])
@@ -0,0 +1,79 @@
+"""Test cases for the batch guest arrival"""
+import csv
+import json
+import os.path
+import shutil
+import tempfile
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         JSON_FILES_GUEST_ARRIVAL,
+                         HotelManager)
+from store_backup import StoreBackupMixin, make_reservation
+
+
+class TestBatchGuestArrival(StoreBackupMixin, TestCase):
+    """Class for testing guest_arrivals"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json"]
+
+    def setUp(self):
+        """ the store has the reservation of key_ok.json and the arrival
+        files of the test cases are copied in a new directory """
+        super().setUp()
+        make_reservation()
+        self.arrivals_dir = tempfile.mkdtemp()
+        self.expected = {}
+        my_cases = JSON_FILES_PATH + "GE2_TestCasesTemplate_2024_F2.csv"
+        with open(my_cases, newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile, delimiter=';'):
+                shutil.copy(JSON_FILES_GUEST_ARRIVAL + row["FILE"], self.arrivals_dir)
+                key = "room_key" if row["VALID_INVALID"] == "VALID" else "error"
+                self.expected[row["FILE"]] = {key: row["EXPECTED_RESULT"]}
+        # the same arrival twice is only checked in once
+        shutil.copy(JSON_FILES_GUEST_ARRIVAL + "key_ok.json",
+                    os.path.join(self.arrivals_dir, "key_ok_copy.json"))
+        self.expected["key_ok_copy.json"] = {"error": "ckeckin  ya realizado"}
+
+    def tearDown(self):
+        """ removes the arrival files and restores the stores """
+        shutil.rmtree(self.arrivals_dir)
+        super().tearDown()
+
+    @freeze_time("2024/07/01 13:00:00")
+    def test_batch_guest_arrival(self):
+        """every file gets the same result than in guest_arrival"""
+        results_file = os.path.join(self.arrivals_dir, "results.json")
+        results = HotelManager().guest_arrivals(self.arrivals_dir, results_file)
+        self.assertDictEqual(results, self.expected)
+        with open(results_file, "r", encoding="utf-8", newline="") as file:
+            self.assertDictEqual(json.load(file), self.expected)
+        with open(JSON_FILES_PATH + "store_check_in.json", "r", encoding="utf-8",
+                  newline="") as file:
+            checkins = json.load(file)
+        self.assertEqual([item["_HotelStay__room_key"] for item in checkins],
+                         [self.expected["key_ok.json"]["room_key"]])
+
+    @freeze_time("2024/07/02 13:00:00")
+    def test_batch_guest_arrival_no_date(self):
+        """no file is checked in if today is not the arrival date"""
+        results = HotelManager().guest_arrivals(self.arrivals_dir,
+                                                os.path.join(self.arrivals_dir,
+                                                             "results.json"))
+        self.assertEqual(results["key_ok.json"],
+                         {"error": "Error: today is not reservation date"})
+        self.assertFalse(os.path.isfile(JSON_FILES_PATH + "store_check_in.json"))
+
+    @freeze_time("2024/07/01 13:00:00")
+    def test_batch_guest_arrival_fixtures(self):
+        """the files that are not a json object fail on their own and no
+        results file is written if none is given"""
+        results = HotelManager().guest_arrivals(JSON_FILES_GUEST_ARRIVAL)
+        for fichero in ("storeKeys.json", "storeRequest.json",
+                        "store_reservation_manipulated.json"):
+            self.assertEqual(results[fichero],
+                             {"error": "JSON Decode Error - Wrong JSON Format"})
+        self.assertIn("room_key", results["key_ok.json"])
+        self.assertFalse(os.path.exists(JSON_FILES_PATH + "guest_arrival_results.json"))
@@ -0,0 +1,49 @@
+"""Test cases for the column wise validation of credit cards and id cards"""
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+# pylint: disable=import-error
+from uc3m_travel.attributes import batch_validation
+from uc3m_travel.attributes.batch_validation import (validate_credit_cards,
+                                                     validate_id_cards,
+                                                     error_messages,
+                                                     numpy_available,
+                                                     CREDIT_CARD_MESSAGES,
+                                                     ID_CARD_MESSAGES)
+from uc3m_travel.attributes.attribute_credit_card import CreditCard
+from uc3m_travel.attributes.attribute_id_card import IdCard
+
+CREDIT_CARDS = ["5105105105105100", "5105105105105101", "510510510510510",
+                "51051051051051000", "510510510510510A", "", "4111111111111111"]
+ID_CARDS = ["12345678Z", "12345678A", "1234567Z", "123456789Z", "12345678z",
+            "A2345678Z", "00000000T", ""]
+
+
+class TestBatchValidation(TestCase):
+    """Class for testing the batch validation"""
+    def check_same_as_attribute(self):
+        """the messages are the ones of the attribute validation"""
+        for attribute, batch, values, messages in (
+                (CreditCard, validate_credit_cards, CREDIT_CARDS, CREDIT_CARD_MESSAGES),
+                (IdCard, validate_id_cards, ID_CARDS, ID_CARD_MESSAGES)):
+            with self.subTest(attribute=attribute.__name__):
+                mask, error_codes = batch(values)
+                expected = attribute.validate_many(values)
+                self.assertEqual(error_messages(error_codes, messages), expected)
+                self.assertEqual([bool(valid) for valid in mask],
+                                 [message is None for message in expected])
+
+    @skipUnless(numpy_available(), "NumPy is not installed")
+    def test_numpy_validation(self):
+        """the vectorized checks match the attribute validation"""
+        self.check_same_as_attribute()
+
+    def test_validation_without_numpy(self):
+        """without NumPy the values are checked one by one"""
+        with patch.object(batch_validation, "np", None):
+            self.check_same_as_attribute()
+
+    @skipUnless(numpy_available(), "NumPy is not installed")
+    def test_empty_column(self):
+        """an empty column has no errors"""
+        mask, error_codes = validate_id_cards([])
+        self.assertEqual((len(mask), len(error_codes)), (0, 0))
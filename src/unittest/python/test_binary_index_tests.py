@@ -0,0 +1,148 @@
+"""Test cases for the binary indexes of the check in and checkout stores"""
+import hashlib
+import os
+import tempfile
+from datetime import date
+from unittest import TestCase
+from unittest.mock import patch
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.binary_index import (StayBinaryIndex, CheckoutBinaryIndex,
+                                              DepartureBinaryIndex, StayIndexEntry)
+
+
+def stay(number):
+    """a check in store item"""
+    return {"_HotelStay__algorithm": "SHA-256",
+            "_HotelStay__type": ("SINGLE", "DOUBLE", "SUITE")[number % 3],
+            "_HotelStay__idcard": "12345678Z",
+            "_HotelStay__localizer": hashlib.md5(str(number).encode()).hexdigest(),
+            "_HotelStay__arrival": 1719838800.0 + number,
+            "_HotelStay__departure": 1719925200.0 + number,
+            "_HotelStay__room_key": hashlib.sha256(str(number).encode()).hexdigest()}
+
+
+class TestBinaryIndex(TestCase):
+    """Class for testing the memory mapped indexes"""
+    def setUp(self):
+        """a check in store of 100 stays"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store_file = os.path.join(self.directory.name, "store_check_in.json")
+        JsonStore.write_json(self.store_file, [stay(number) for number in range(100)])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_find_stays(self):
+        """every room key is found with its data, others are not"""
+        with StayBinaryIndex(self.store_file) as index:
+            index.load()
+            self.assertEqual(len(index), 100)
+            for number in range(100):
+                item = stay(number)
+                self.assertEqual(index.find(item["_HotelStay__room_key"]),
+                                 StayIndexEntry(item["_HotelStay__room_key"],
+                                                item["_HotelStay__localizer"],
+                                                item["_HotelStay__arrival"],
+                                                item["_HotelStay__departure"],
+                                                item["_HotelStay__type"]))
+            self.assertIsNone(index.find(hashlib.sha256(b"x").hexdigest()))
+        self.assertTrue(os.path.isfile(os.path.join(self.directory.name,
+                                                    "store_check_in.stays.bin")))
+
+    def test_stale_index_is_rebuilt(self):
+        """a change of the store rebuilds the index"""
+        with StayBinaryIndex(self.store_file) as index:
+            index.load()
+        JsonStore.write_json(self.store_file, [stay(number) for number in range(101)])
+        with StayBinaryIndex(self.store_file) as index:
+            self.assertIn(stay(100)["_HotelStay__room_key"], index.load())
+
+    def test_malformed_stays_are_skipped(self):
+        """a stay without localizer, with a room key that is not hex or with
+        a localizer of another size is left out of the indexes, the rest are
+        found"""
+        broken = stay(101)
+        del broken["_HotelStay__localizer"]
+        not_hex = dict(stay(102), _HotelStay__room_key="not a room key")
+        short = dict(stay(103), _HotelStay__localizer="0123456789abcdef")
+        long = dict(stay(104), _HotelStay__localizer=stay(104)["_HotelStay__room_key"])
+        JsonStore.write_json(self.store_file, [stay(number) for number in range(100)] +
+                             [broken, not_hex, short, long, "not a stay"])
+        for index_class in (StayBinaryIndex, DepartureBinaryIndex):
+            with index_class(self.store_file) as index:
+                self.assertEqual(len(index.load()), 100)
+        with StayBinaryIndex(self.store_file) as index:
+            index.load()
+            self.assertIn(stay(5)["_HotelStay__room_key"], index)
+            self.assertNotIn("not a room key", index)
+
+    def test_checkout_index(self):
+        """the checkouts added after writing them are found"""
+        checkout_file = os.path.join(self.directory.name, "store_check_out.json")
+        room_key = stay(1)["_HotelStay__room_key"]
+        with CheckoutBinaryIndex(checkout_file) as index:
+            self.assertNotIn(room_key, index.load())
+            checkout = {"room_key": room_key, "checkout_time": 1719925200.0}
+            JsonStore.write_json(checkout_file, [checkout])
+            index.add([checkout])
+        with CheckoutBinaryIndex(checkout_file) as index:
+            self.assertEqual(index.load().find(room_key).checkout_time, 1719925200.0)
+
+    def test_added_records_are_appended(self):
+        """the records added are appended to the tail of the file and found"""
+        index_file = os.path.join(self.directory.name, "store_check_in.departures.bin")
+        with DepartureBinaryIndex(self.store_file) as index:
+            index.load()
+            size = os.path.getsize(index_file)
+            JsonStore.write_json(self.store_file,
+                                 [stay(number) for number in range(100)] +
+                                 [dict(stay(number), _HotelStay__departure=1720011600.0)
+                                  for number in range(100, 103)])
+            index.add([dict(stay(number), _HotelStay__departure=1720011600.0)
+                       for number in range(100, 103)])
+            self.assertEqual(os.path.getsize(index_file),
+                             size + 3 * DepartureBinaryIndex.RECORD.size)
+        with DepartureBinaryIndex(self.store_file) as index:
+            self.assertEqual(len(index.load()), 103)
+            leaving = list(index.due_on(date.fromtimestamp(1720011600.0)))
+            self.assertEqual([item.room_key for item in leaving],
+                             sorted(stay(number)["_HotelStay__room_key"]
+                                    for number in range(100, 103)))
+
+    def test_added_records_are_merged(self):
+        """once the tail is full the records added are merged in order, as a
+        rebuild sorts them"""
+        with StayBinaryIndex(self.store_file) as index, \
+                patch.object(StayBinaryIndex, "MAX_TAIL", 40):
+            index.load()
+            for first in (100, 130):
+                JsonStore.write_json(self.store_file,
+                                     [stay(number) for number in range(first + 30)])
+                index.add([stay(number) for number in range(first, first + 30)])
+                self.assertEqual(index.find(stay(first + 5)["_HotelStay__room_key"]).localizer,
+                                 stay(first + 5)["_HotelStay__localizer"])
+            self.assertEqual(len(index), 160)
+        index_file = os.path.join(self.directory.name, "store_check_in.stays.bin")
+        with open(index_file, "rb") as file:
+            merged = file.read()
+        with StayBinaryIndex(self.store_file) as index:
+            index.rebuild()
+        with open(index_file, "rb") as file:
+            self.assertEqual(file.read(), merged)
+
+    def test_departure_index(self):
+        """the stays of a departure day are read together"""
+        JsonStore.write_json(self.store_file,
+                             [stay(number) for number in range(100)] +
+                             [dict(stay(number), _HotelStay__departure=1720011600.0)
+                              for number in range(100, 103)])
+        with DepartureBinaryIndex(self.store_file) as index:
+            index.load()
+            leaving = list(index.due_on(date.fromtimestamp(1720011600.0)))
+            self.assertEqual(sorted(item.room_key for item in leaving),
+                             [item.room_key for item in leaving])
+            self.assertEqual(sorted(item.room_key for item in leaving),
+                             sorted(stay(number)["_HotelStay__room_key"]
+                                    for number in range(100, 103)))
+            self.assertEqual(list(index.due_on(date(2024, 1, 1))), [])
@@ -0,0 +1,69 @@
+"""Module for testing guest_checkouts"""
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import HotelManager
+# pylint: disable=import-error
+from uc3m_travel import JSON_FILES_PATH
+# pylint: disable=import-error
+from uc3m_travel import JSON_FILES_GUEST_ARRIVAL
+from store_backup import StoreBackupMixin, SANCHO_FIELDS, reservation_request
+
+ROOM_KEY_OK = "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859"
+
+
+class TestBulkCheckout(StoreBackupMixin, TestCase):
+    """Class for testing guest_checkouts"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json"]
+
+    def setUp(self):
+        """two guests arrive on 01/07/2024, for one and for two days"""
+        super().setUp()
+        arrivals_dir = tempfile.mkdtemp()
+        shutil.copy(JSON_FILES_GUEST_ARRIVAL + "key_ok.json", arrivals_dir)
+        with open(os.path.join(arrivals_dir, "key_sancho.json"), "w",
+                  encoding="utf-8", newline="") as file:
+            json.dump({"Localizer": "74a961610a0f1c048976007358ba7155",
+                       "IdCard": "05270358T"}, file)
+        hotel_mngr = HotelManager()
+        with freeze_time("2024/03/22 13:00:00"):
+            hotel_mngr.room_reservations([reservation_request(),
+                                          reservation_request(**SANCHO_FIELDS)])
+        with freeze_time("2024/07/01 13:00:00"):
+            results = hotel_mngr.guest_arrivals(arrivals_dir,
+                                                os.path.join(arrivals_dir, "results.json"))
+        shutil.rmtree(arrivals_dir)
+        self.room_key_sancho = results["key_sancho.json"]["room_key"]
+
+    @freeze_time("2024-07-02")
+    def test_bulk_checkout(self):
+        """one checkout is saved and the rest get their error"""
+        room_keys = [ROOM_KEY_OK,
+                     self.room_key_sancho,
+                     "a06c7bede3d584e934e2f5bd3861e625cb31937f9f1a5362a51fbbf38486f1c",
+                     "7a8403d8605804cf2534fd7885940f3c3d8ec60ba578bc158b5dc2b9fb68d524",
+                     ROOM_KEY_OK]
+        results = HotelManager().guest_checkouts(room_keys)
+        self.assertEqual(results, [{"room_key": ROOM_KEY_OK},
+                                   {"error": "Error: today is not the departure day"},
+                                   {"error": "Invalid room key format"},
+                                   {"error": "Error: room key not found"},
+                                   {"error": "Guest is already out"}])
+        with open(JSON_FILES_PATH + "store_check_out.json", "r", encoding="utf-8",
+                  newline="") as file:
+            data_list = json.load(file)
+        self.assertEqual([checkout["room_key"] for checkout in data_list], [ROOM_KEY_OK])
+
+    @freeze_time("2024-07-02")
+    def test_bulk_checkout_no_store_check_in(self):
+        """every room key gets the error of the missing check in store"""
+        os.remove(JSON_FILES_PATH + "store_check_in.json")
+        results = HotelManager().guest_checkouts([ROOM_KEY_OK, "0000"])
+        self.assertEqual(results, [{"error": "Error: store checkin not found"},
+                                   {"error": "Invalid room key format"}])
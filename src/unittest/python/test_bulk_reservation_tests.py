@@ -0,0 +1,74 @@
+"""Test cases for the bulk room reservation"""
+import json
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         HotelManager)
+from store_backup import (StoreBackupMixin, SANCHO_FIELDS, make_reservation,
+                          reservation_request)
+
+
+class TestBulkReservation(StoreBackupMixin, TestCase):
+    """Class for testing room_reservations"""
+    store_files = ["store_reservation.json", "store_reservation_index.json"]
+
+    def setUp(self):
+        """ the store has only the reservation of JOSE LOPEZ """
+        super().setUp()
+        make_reservation()
+
+    @staticmethod
+    def read_file():
+        """ this method read the reservations store """
+        my_file = JSON_FILES_PATH + "store_reservation.json"
+        with open(my_file, "r", encoding="utf-8", newline="") as file:
+            return json.load(file)
+
+    @staticmethod
+    def request(id_card, **fields):
+        """ returns a valid reservation request for the given id card """
+        return dict(reservation_request(**SANCHO_FIELDS), id_card=id_card, **fields)
+
+    @freeze_time("2024/03/22 13:00:00")
+    def test_bulk_reservations(self):
+        """valid, invalid and duplicated requests in the same batch"""
+        results = HotelManager().room_reservations([
+            self.request("05270358T"),
+            self.request("12345678Z"),
+            self.request("87654123L", credit_card="5105105105105101"),
+            self.request("05270358T", name_surname="JOSE SANCHO PEREZ"),
+            self.request("87654321X", name_surname="ESMERALDA GUILLERMINA")])
+        self.assertEqual(results, [
+            {"localizer": "74a961610a0f1c048976007358ba7155"},
+            {"error": "This ID card has another reservation"},
+            {"error": "Invalid credit card number (not luhn)"},
+            {"error": "This ID card has another reservation"},
+            {"localizer": results[4]["localizer"]}])
+        my_data = self.read_file()
+        self.assertEqual([item["_HotelReservation__id_card"] for item in my_data],
+                         ["12345678Z", "05270358T", "87654321X"])
+
+    @freeze_time("2024/03/22 13:00:00")
+    def test_bulk_reservation_duplicated(self):
+        """the same request twice in the batch is saved once"""
+        results = HotelManager().room_reservations([self.request("05270358T"),
+                                                    self.request("05270358T")])
+        self.assertEqual(results, [{"localizer": "74a961610a0f1c048976007358ba7155"},
+                                   {"error": "Reservation already exists"}])
+        self.assertEqual(len(self.read_file()), 2)
+
+    @freeze_time("2024/03/22 13:00:00")
+    def test_bulk_reservation_malformed(self):
+        """a malformed request is reported without failing the batch"""
+        missing = self.request("87654321X")
+        del missing["num_days"]
+        results = HotelManager().room_reservations([
+            dict(self.request("11111111H"), id_card=None),
+            missing,
+            dict(self.request("87654321X"), nights=2),
+            self.request("05270358T")])
+        self.assertEqual([set(result) for result in results],
+                         [{"error"}, {"error"}, {"error"}, {"localizer"}])
+        self.assertEqual(len(self.read_file()), 2)
@@ -0,0 +1,48 @@
+"""Test cases for the clocks of the hotel manager"""
+from datetime import datetime
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (HotelManager, HotelManagementException,
+                         JSON_FILES_GUEST_ARRIVAL)
+# pylint: disable=import-error
+from uc3m_travel.clock import FixedClock, AcceleratedClock, SystemClock
+from store_backup import StoreBackupMixin, reservation_request
+
+ROOM_KEY_OK = "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859"
+
+
+class TestClock(StoreBackupMixin, TestCase):
+    """Class for testing the clocks"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json"]
+
+    def tearDown(self):
+        """go back to the system clock"""
+        HotelManager().set_clock()
+        super().tearDown()
+
+    def test_fixed_clock_flow(self):
+        """reservation, arrival and checkout without freezegun"""
+        clock = FixedClock(datetime(2024, 3, 22, 13, 0, 0))
+        mngr = HotelManager()
+        mngr.set_clock(clock)
+        self.assertEqual(mngr.room_reservation(**reservation_request()),
+                         "450a53be9b39944e62e7164ca5f5aadf")
+        with self.assertRaises(HotelManagementException) as c_m:
+            mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        self.assertEqual(c_m.exception.message, "Error: today is not reservation date")
+        clock.set(datetime(2024, 7, 1, 13, 0, 0))
+        self.assertEqual(mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json"),
+                         ROOM_KEY_OK)
+        clock.advance(hours=11)
+        self.assertTrue(mngr.guest_checkout(ROOM_KEY_OK))
+
+    def test_accelerated_clock(self):
+        """an accelerated clock runs faster than the system one"""
+        with freeze_time("2024-07-01 13:00:00") as frozen:
+            clock = AcceleratedClock(speed=3600)
+            frozen.tick(2)
+            self.assertEqual(clock.utcnow(), datetime(2024, 7, 1, 15, 0, 0))
+            self.assertEqual(SystemClock().utcnow(), datetime(2024, 7, 1, 13, 0, 2))
@@ -0,0 +1,114 @@
+"""Test cases for the compact schema of the json stores"""
+import json
+import os
+import tempfile
+from unittest import TestCase
+# pylint: disable=import-error
+from uc3m_travel import JSON_FILES_PATH, HotelManager
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore, JSONL_FORMAT, JSON_FORMAT
+from uc3m_travel.storage.json_stream import iter_json_lines, iter_store_file, store_schema_version
+from uc3m_travel.storage.schema import (LEGACY_SCHEMA, COMPACT_SCHEMA, HEADER_KEY,
+                                        encode_record)
+from uc3m_travel.storage.schema_migration import migrate_store, migrate_json_stores
+from store_backup import StoreBackupMixin, ROOM_KEY_OK, make_reservation
+
+RESERVATION = {"_HotelReservation__localizer": "450a53be9b39944e62e7164ca5f5aadf",
+               "_HotelReservation__id_card": "12345678Z",
+               "_HotelReservation__num_days": 1,
+               "other": "kept"}
+
+
+class TestCompactSchema(StoreBackupMixin, TestCase):
+    """Class for testing the versions of the store format"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation.jsonl",
+                   "store_reservation_index.json"]
+
+    def setUp(self):
+        """ the stores are empty and written in the compact schema """
+        super().setUp()
+        JsonStore.schema_version = COMPACT_SCHEMA
+
+    def tearDown(self):
+        """ go back to the legacy schema """
+        JsonStore.schema_version = LEGACY_SCHEMA
+        JsonStore.storage_mode = JSON_FORMAT
+        super().tearDown()
+
+    @staticmethod
+    def read_raw(fichero):
+        """ returns the json content of a store as it is in the file """
+        with open(JSON_FILES_PATH + fichero, "r", encoding="utf-8", newline="") as file:
+            return json.load(file)
+
+    def test_compact_flow(self):
+        """reservation, arrival and checkout work over compact stores"""
+        mngr = HotelManager()
+        make_reservation()
+        self.check_arrival(mngr)
+        self.check_checkout(mngr)
+        reservations = self.read_raw("store_reservation.json")
+        self.assertEqual(reservations[0][HEADER_KEY], COMPACT_SCHEMA)
+        self.assertEqual(reservations[1]["l"], "450a53be9b39944e62e7164ca5f5aadf")
+        self.assertEqual(self.read_raw("store_check_in.json")[1]["k"], ROOM_KEY_OK)
+        self.assertEqual(self.read_raw("store_check_out.json")[1]["rk"], ROOM_KEY_OK)
+        with open(JSON_FILES_PATH + "store_reservation.json", "r", encoding="utf-8",
+                  newline="") as file:
+            self.assertNotIn("\n", file.read())
+
+    def test_readers_accept_both_versions(self):
+        """the records of a store are the same whatever its version"""
+        my_file = JSON_FILES_PATH + "store_reservation.json"
+        for version in (LEGACY_SCHEMA, COMPACT_SCHEMA):
+            with self.subTest(version=version):
+                JsonStore.write_json(my_file, [RESERVATION], schema_version=version)
+                JsonStore.clear_cache()
+                self.assertEqual(store_schema_version(my_file), version)
+                self.assertEqual(JsonStore.load_json_store(my_file), [RESERVATION])
+                self.assertEqual(list(iter_store_file(my_file)),
+                                 [RESERVATION])
+
+    def test_header_key_map(self):
+        """the short keys are read with the key map of the header"""
+        my_file = JSON_FILES_PATH + "store_reservation.json"
+        with open(my_file, "w", encoding="utf-8", newline="") as file:
+            json.dump([{HEADER_KEY: COMPACT_SCHEMA,
+                        "keys": {"x": "_HotelReservation__localizer"}},
+                       {"x": "450a53be9b39944e62e7164ca5f5aadf"}], file)
+        self.assertEqual(list(iter_store_file(my_file)),
+                         [{"_HotelReservation__localizer":
+                           "450a53be9b39944e62e7164ca5f5aadf"}])
+
+    def test_append_keeps_version_of_the_store(self):
+        """records appended to a jsonl store follow the version of the file"""
+        JsonStore.storage_mode = JSONL_FORMAT
+        my_file = JSON_FILES_PATH + "store_reservation.jsonl"
+        JsonStore.schema_version = LEGACY_SCHEMA
+        JsonStore.append_json(my_file, [RESERVATION])
+        JsonStore.schema_version = COMPACT_SCHEMA
+        JsonStore.append_json(my_file, [RESERVATION])
+        self.assertEqual(list(iter_json_lines(my_file)), [RESERVATION] * 2)
+        os.remove(my_file)
+        JsonStore.append_json(my_file, [RESERVATION])
+        JsonStore.append_json(my_file, [RESERVATION])
+        lines = list(iter_json_lines(my_file))
+        self.assertEqual(lines[1:], [encode_record(RESERVATION)] * 2)
+        self.assertEqual(JsonStore.load_json_store(my_file), [RESERVATION] * 2)
+
+    def test_migration(self):
+        """the migration rewrites the stores in the given version and back"""
+        with tempfile.TemporaryDirectory() as directory:
+            my_file = os.path.join(directory, "store_reservation.json")
+            JsonStore.write_json(my_file, [RESERVATION] * 3,
+                                 schema_version=LEGACY_SCHEMA)
+            legacy_size = os.path.getsize(my_file)
+            self.assertEqual(migrate_json_stores(directory, COMPACT_SCHEMA),
+                             {"store_reservation.json": 3})
+            self.assertEqual(store_schema_version(my_file), COMPACT_SCHEMA)
+            self.assertLess(os.path.getsize(my_file), legacy_size)
+            self.assertEqual(migrate_store(my_file, LEGACY_SCHEMA), 3)
+            self.assertEqual(store_schema_version(my_file), LEGACY_SCHEMA)
+            JsonStore.clear_cache()
+            self.assertEqual(JsonStore.load_json_store(my_file), [RESERVATION] * 3)
+            self.assertIsNone(migrate_store(os.path.join(directory, "missing.json")))
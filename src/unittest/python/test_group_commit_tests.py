@@ -0,0 +1,130 @@
+"""Test cases for the group commit of the store writes"""
+import threading
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (HotelManager, HotelManagementException,
+                         JSON_FILES_PATH, JSON_FILES_GUEST_ARRIVAL)
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from store_backup import StoreBackupMixin, id_card, reservation_request
+
+ROOM_KEY_OK = "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859"
+
+
+# pylint: disable=too-few-public-methods
+class ListStore():
+    """store that keeps the saved items in a list"""
+    def __init__(self, file_name):
+        self._file_name = file_name
+        self.saved = []
+
+    def save_items(self, items):
+        """saves the items, fails with a non int one"""
+        self.saved.extend([int(item) for item in items])
+        return [self._file_name] * len(items)
+
+
+class TestGroupCommit(StoreBackupMixin, TestCase):
+    """Class for testing the group commit writer"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json"]
+
+    def setUp(self):
+        """the stores are empty and the writes are grouped"""
+        super().setUp()
+        self.writer = HotelManager().enable_group_commit(max_batch_size=32,
+                                                         max_wait=0.2)
+
+    def tearDown(self):
+        """one write for each call again"""
+        HotelManager().disable_group_commit()
+        super().tearDown()
+
+    def test_concurrent_reservations(self):
+        """the reservations of many threads are saved together and the
+        duplicate id card is reported to its caller"""
+        requests = [reservation_request(id_card=id_card(number)) for number in range(10)]
+        requests.append(reservation_request(id_card=id_card(3), name_surname="JOSE SANCHO"))
+        results = [None] * len(requests)
+        barrier = threading.Barrier(len(requests))
+
+        def make(position):
+            barrier.wait()
+            try:
+                results[position] = HotelManager().room_reservation(**requests[position])
+            except HotelManagementException as exception:
+                results[position] = exception.message
+
+        threads = [threading.Thread(target=make, args=(position,))
+                   for position in range(len(requests))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        saved = JsonStore.load_json_store(JSON_FILES_PATH + "store_reservation.json")
+        self.assertEqual(len(saved), 10)
+        self.assertEqual(
+            [result for result in results if len(result) != 32],
+            ["This ID card has another reservation"])
+        self.assertLess(self.writer.flushes, len(requests))
+
+    def test_same_semantics(self):
+        """reservation, arrival and checkout return and raise as before"""
+        with freeze_time("2024/03/22 13:00:00"):
+            localizer = HotelManager().room_reservation(**reservation_request())
+            with self.assertRaises(HotelManagementException) as c_m:
+                HotelManager().room_reservation(**reservation_request())
+            self.assertEqual(c_m.exception.message, "Reservation already exists")
+        self.assertEqual(localizer, "450a53be9b39944e62e7164ca5f5aadf")
+        with freeze_time("2024/07/01 13:00:00"):
+            self.assertEqual(HotelManager().guest_arrival(
+                JSON_FILES_GUEST_ARRIVAL + "key_ok.json"), ROOM_KEY_OK)
+            with self.assertRaises(HotelManagementException) as c_m:
+                HotelManager().guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+            self.assertEqual(c_m.exception.message, "ckeckin  ya realizado")
+        with freeze_time("2024-07-02"):
+            self.assertTrue(HotelManager().guest_checkout(ROOM_KEY_OK))
+            with self.assertRaises(HotelManagementException) as c_m:
+                HotelManager().guest_checkout(ROOM_KEY_OK)
+        self.assertEqual(c_m.exception.message, "Guest is already out")
+
+    def test_failed_batch_and_configurations(self):
+        """a malformed item fails only its caller and the items of stores
+        with other files are not saved in the same call"""
+        first, second = ListStore("first"), ListStore("second")
+        submits = [(first, 1), (second, 2), (first, "bad"), (first, 3)]
+        results = [None] * len(submits)
+        barrier = threading.Barrier(len(submits))
+
+        def make(position):
+            barrier.wait()
+            try:
+                store, item = submits[position]
+                results[position] = self.writer.submit(store, "save_items", item)
+            except ValueError as exception:
+                results[position] = exception
+
+        threads = [threading.Thread(target=make, args=(position,))
+                   for position in range(len(submits))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([results[0], results[1], results[3]],
+                         ["first", "second", "first"])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual((sorted(first.saved), second.saved), ([1, 3], [2]))
+
+    def test_submit_after_close(self):
+        """an item submitted while the writer closes is saved on its own
+        instead of waiting forever behind the end of the writer"""
+        store = ListStore("store")
+        self.writer.close()
+        self.assertEqual(self.writer.submit(store, "save_items", 1), "store")
+        self.assertEqual(store.saved, [1])
+        flushes = self.writer.flushes
+        self.writer.close()
+        self.assertEqual(self.writer.flushes, flushes)
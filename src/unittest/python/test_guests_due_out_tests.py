@@ -0,0 +1,46 @@
+"""Test cases for the query of the guests that leave on a day"""
+from datetime import date
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_GUEST_ARRIVAL,
+                         HotelManager,
+                         HotelManagementException)
+from store_backup import StoreBackupMixin, make_reservation
+
+ROOM_KEY_OK = "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859"
+
+
+class TestGuestsDueOut(StoreBackupMixin, TestCase):
+    """Class for testing the guests due out of each storage backend"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json",
+                   "store_hotel.db", "store_hotel.db-wal", "store_hotel.db-shm"]
+
+    def tearDown(self):
+        """ restores the stores and the json backend """
+        HotelManager().set_storage_backend("json")
+        super().tearDown()
+
+    def test_guests_due_out(self):
+        """the guest is due out on the departure day until the checkout"""
+        self.for_each_backend(self.check_guests_due_out)
+
+    def check_guests_due_out(self, mngr):
+        """ the guests due out of the backend of the manager """
+        with self.assertRaises(HotelManagementException) as c_m:
+            mngr.guests_due_out(date(2024, 7, 2))
+        self.assertEqual(c_m.exception.message, "Error: store checkin not found")
+        make_reservation()
+        with freeze_time("2024/07/01 13:00:00"):
+            mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+            self.assertEqual(mngr.guests_due_out(), [])
+        self.assertEqual(mngr.guests_due_out(date(2024, 7, 3)), [])
+        with freeze_time("2024-07-02"):
+            due_out = mngr.guests_due_out()
+            self.assertEqual([stay["room_key"] for stay in due_out], [ROOM_KEY_OK])
+            self.assertEqual(due_out[0]["localizer"], "450a53be9b39944e62e7164ca5f5aadf")
+            self.assertEqual(due_out[0]["room_type"], "SINGLE")
+            mngr.guest_checkout(ROOM_KEY_OK)
+            self.assertEqual(mngr.guests_due_out(), [])
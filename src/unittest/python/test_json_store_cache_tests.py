@@ -0,0 +1,66 @@
+"""Test cases for the cache of parsed stores in JsonStore"""
+import json
+import os
+from unittest import TestCase
+# pylint: disable=import-error
+from uc3m_travel import JSON_FILES_PATH, JSON_FILES_GUEST_ARRIVAL
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.stay_json_store import StayStoreJson
+
+
+class TestJsonStoreCache(TestCase):
+    """Class for testing the JsonStore cache"""
+    my_file = JSON_FILES_PATH + "store_cache_test.json"
+
+    def setUp(self):
+        """ the file has two records and the cache is empty """
+        with open(self.my_file, "w", encoding="utf-8", newline="") as file:
+            json.dump([{"room_key": "a"}, {"room_key": "b"}], file, indent=2)
+        JsonStore.clear_cache()
+
+    def tearDown(self):
+        """ removes the test file """
+        if os.path.exists(self.my_file):
+            os.remove(self.my_file)
+
+    def test_second_load_is_a_hit(self):
+        """the second load does not parse the file"""
+        first = JsonStore.load_json_store(self.my_file)
+        second = JsonStore.load_json_store(self.my_file)
+        self.assertEqual(first, second)
+        self.assertEqual(JsonStore.cache_misses, 1)
+        self.assertEqual(JsonStore.cache_hits, 1)
+
+    def test_loaded_list_is_a_copy(self):
+        """changing the loaded list does not change the cache"""
+        data_list = JsonStore.load_json_store(self.my_file)
+        data_list.append({"room_key": "c"})
+        self.assertEqual(len(JsonStore.load_json_store(self.my_file)), 2)
+
+    def test_write_updates_the_cache(self):
+        """a write through the store is served from the cache"""
+        JsonStore.write_json(self.my_file, [{"room_key": "c"}])
+        self.assertEqual(JsonStore.load_json_store(self.my_file), [{"room_key": "c"}])
+        self.assertEqual(JsonStore.cache_hits, 1)
+        self.assertEqual(JsonStore.cache_misses, 0)
+
+    def test_external_change_is_a_miss(self):
+        """a file changed by somebody else is read again"""
+        JsonStore.load_json_store(self.my_file)
+        with open(self.my_file, "w", encoding="utf-8", newline="") as file:
+            json.dump([{"room_key": "d"}], file, indent=2)
+        self.assertEqual(JsonStore.load_json_store(self.my_file), [{"room_key": "d"}])
+        self.assertEqual(JsonStore.cache_misses, 2)
+
+    def test_removed_file_is_empty(self):
+        """a removed file is not served from the cache"""
+        JsonStore.load_json_store(self.my_file)
+        os.remove(self.my_file)
+        self.assertEqual(JsonStore.load_json_store(self.my_file), [])
+
+    def test_input_files_are_not_cached(self):
+        """the arrival files are read without keeping them in the cache"""
+        input_file = JSON_FILES_GUEST_ARRIVAL + "key_ok.json"
+        StayStoreJson().read_json_not_empty(input_file, "guest_arrival")
+        self.assertNotIn(input_file, JsonStore._cache)  # pylint: disable=protected-access
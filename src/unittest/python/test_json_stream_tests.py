@@ -0,0 +1,61 @@
+"""Test cases for the streaming reader of the json array stores"""
+import json
+import os
+import tempfile
+from unittest import TestCase
+# pylint: disable=import-error
+from uc3m_travel import HotelManagementException
+# pylint: disable=import-error
+from uc3m_travel.storage.json_stream import iter_json_array
+from uc3m_travel.storage.reservation_json_store import ReservationStoreJson
+
+
+class TestJsonStream(TestCase):
+    """Class for testing iter_json_array"""
+    def setUp(self):
+        """a temporary directory for the stores"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store_file = os.path.join(self.directory.name, "store.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, content):
+        """writes the content in the store file"""
+        with open(self.store_file, "w", encoding="utf-8", newline="") as file:
+            file.write(content)
+
+    def test_same_records_as_json_load(self):
+        """every block size gives the records of json.load"""
+        records = [{"localizer": str(number), "name": "JOSÉ, [LÓPEZ]" * number}
+                   for number in range(50)]
+        for content in ("[]", " [\n] ", json.dumps(records), json.dumps(records, indent=2)):
+            self.write(content)
+            for block_size in (1, 5, 64, 65536):
+                with self.subTest(content=content[:10], block_size=block_size):
+                    self.assertEqual(list(iter_json_array(self.store_file,
+                                                                    block_size)),
+                                     json.loads(content))
+
+    def test_wrong_format(self):
+        """a file that is not a json array raises the decode error"""
+        for content in ("", "[", '[{"a": 1}', '[{"a": 1},]', '[{"a": 1}] x',
+                        '[{"a": 1} {"a": 2}]', '{"a": 1}'):
+            self.write(content)
+            with self.subTest(content=content):
+                with self.assertRaises(HotelManagementException) as c_m:
+                    list(iter_json_array(self.store_file, 4))
+                self.assertEqual(c_m.exception.message,
+                                 "JSON Decode Error - Wrong JSON Format")
+
+    def test_lookup_stops_early(self):
+        """the lookup stops at the reservation, the rest is not read"""
+        self.write('[{"_HotelReservation__localizer": "a"},\n'
+                   ' {"_HotelReservation__localizer": "b"},\n' + "x" * 100000)
+        store = ReservationStoreJson()
+        store._file_name = self.store_file  # pylint: disable=protected-access
+        self.assertEqual(store.read_reservation("b"),
+                         {"_HotelReservation__localizer": "b"})
+        with self.assertRaises(HotelManagementException) as c_m:
+            store.read_reservation("c")
+        self.assertEqual(c_m.exception.message, "JSON Decode Error - Wrong JSON Format")
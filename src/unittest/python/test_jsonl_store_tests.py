@@ -0,0 +1,86 @@
+"""Test cases for the append only (jsonl) storage mode"""
+import json
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         JSON_FILES_GUEST_ARRIVAL,
+                         HotelManager,
+                         HotelManagementException)
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore, JSON_FORMAT, JSONL_FORMAT
+from uc3m_travel.storage.json_stream import iter_json_lines
+from store_backup import StoreBackupMixin, SANCHO_FIELDS, make_reservation
+
+
+class TestJsonlStore(StoreBackupMixin, TestCase):
+    """Class for testing the jsonl storage mode"""
+    store_files = ["store_reservation.jsonl", "store_check_in.jsonl",
+                   "store_check_out.jsonl", "store_reservation_index.json",
+                   "store_reservation.json"]
+
+    def setUp(self):
+        """ the stores are empty and in jsonl mode """
+        super().setUp()
+        JsonStore.storage_mode = JSONL_FORMAT
+
+    def tearDown(self):
+        """ go back to the default storage mode """
+        JsonStore.storage_mode = JSON_FORMAT
+        super().tearDown()
+
+    @staticmethod
+    def read_lines(fichero):
+        """ returns the records of a jsonl file """
+        with open(JSON_FILES_PATH + fichero, "r", encoding="utf-8", newline="") as file:
+            return [json.loads(line) for line in file]
+
+    @staticmethod
+    def make_reservations():
+        """ two reservations of the valid test cases """
+        make_reservation()
+        make_reservation(**SANCHO_FIELDS)
+
+    def test_reservations_are_appended(self):
+        """each reservation is a line of the store"""
+        self.make_reservations()
+        data = self.read_lines("store_reservation.jsonl")
+        self.assertEqual([item["_HotelReservation__localizer"] for item in data],
+                         ["450a53be9b39944e62e7164ca5f5aadf",
+                          "74a961610a0f1c048976007358ba7155"])
+        with self.assertRaises(HotelManagementException) as c_m:
+            make_reservation()
+        self.assertEqual(c_m.exception.message, "Reservation already exists")
+        self.assertEqual(len(self.read_lines("store_reservation.jsonl")), 2)
+
+    def test_arrival_and_checkout(self):
+        """the whole flow works over jsonl stores"""
+        self.make_reservations()
+        mngr = HotelManager()
+        with freeze_time("2024/07/01 13:00:00"):
+            room_key = mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        self.assertEqual(room_key,
+                         "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859")
+        with freeze_time("2024-07-02"):
+            self.assertTrue(mngr.guest_checkout(room_key))
+            with self.assertRaises(HotelManagementException) as c_m:
+                mngr.guest_checkout(room_key)
+        self.assertEqual(c_m.exception.message, "Guest is already out")
+        self.assertEqual(len(self.read_lines("store_check_in.jsonl")), 1)
+        self.assertEqual(self.read_lines("store_check_out.jsonl")[0]["room_key"], room_key)
+
+    def test_checkout_without_store(self):
+        """the missing check in store raises the same error as in json mode"""
+        with self.assertRaises(HotelManagementException) as c_m:
+            HotelManager().guest_checkout(
+                "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859")
+        self.assertEqual(c_m.exception.message, "Error: store checkin not found")
+
+    def test_convert_to_jsonl(self):
+        """a json array store is converted line by line"""
+        json_file = JSON_FILES_GUEST_ARRIVAL + "store_reservation_manipulated.json"
+        jsonl_file = JsonStore.convert_to_jsonl(json_file,
+                                                JSON_FILES_PATH + "store_reservation.jsonl")
+        self.assertEqual(list(iter_json_lines(jsonl_file)),
+                         JsonStore.load_json_store(json_file))
@@ -0,0 +1,51 @@
+"""Test cases for the clock free localizer"""
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel.hotel_reservation import HotelReservation, compute_localizer
+
+RESERVATION = {"id_card": "12345678Z",
+               "name_surname": "JOSE LOPEZ",
+               "credit_card": "5105105105105100",
+               "phone_number": "+341234567",
+               "arrival": "01/07/2024",
+               "num_days": 1,
+               "room_type": "SINGLE"}
+
+
+class TestLocalizer(TestCase):
+    """Class for testing compute_localizer"""
+    @freeze_time("2024/03/22 13:00:00")
+    def test_same_localizer_as_reservation(self):
+        """the localizer is the md5 of the string of the reservation"""
+        reservation = HotelReservation(credit_card_number="5105105105105100",
+                                       name_surname="JOSE LOPEZ",
+                                       id_card="12345678Z",
+                                       phone_number="+341234567",
+                                       room_type="SINGLE",
+                                       arrival="01/07/2024",
+                                       num_days=1)
+        localizer = compute_localizer(reservation_date=1711112400.0, **RESERVATION)
+        self.assertEqual(localizer, "450a53be9b39944e62e7164ca5f5aadf")
+        self.assertEqual(localizer, reservation.localizer)
+        self.assertEqual(localizer, hashlib.md5(str(reservation).encode()).hexdigest())
+
+    def test_stored_reservation_date(self):
+        """the timestamp is used as it is stored, without the clock"""
+        reservation_date = 1711112400.1234567
+        reservation = HotelReservation(credit_card_number="5105105105105100",
+                                       name_surname="JOSE LOPEZ",
+                                       id_card="12345678Z",
+                                       phone_number="+341234567",
+                                       room_type="SINGLE",
+                                       arrival="01/07/2024",
+                                       num_days=1,
+                                       reservation_date=reservation_date)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            localizers = set(executor.map(
+                lambda _: compute_localizer(reservation_date=reservation_date,
+                                            **RESERVATION), range(100)))
+        self.assertEqual(localizers, {reservation.localizer})
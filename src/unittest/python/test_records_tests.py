@@ -0,0 +1,89 @@
+"""Test cases for the records of the stores"""
+import os
+import tempfile
+from unittest import TestCase
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.records import ReservationRecord, StayRecord, CheckoutRecord
+from uc3m_travel.storage.schema import COMPACT_SCHEMA, HEADER_KEY, encode_record
+
+RESERVATION = {"_HotelReservation__localizer": "6a2bd6d3f3c6e5e5d3c1b0b4a7c61d5e",
+               "_HotelReservation__id_card": "12345678Z",
+               "_HotelReservation__credit_card_number": "5105105105105100",
+               "_HotelReservation__arrival": "01/07/2024",
+               "_HotelReservation__reservation_date": 1714579200.0,
+               "_HotelReservation__name_surname": "JOSE LOPEZ",
+               "_HotelReservation__phone_number": "+341234567",
+               "_HotelReservation__room_type": "SINGLE",
+               "_HotelReservation__num_days": 1}
+STAY = {"_HotelStay__algorithm": "SHA-256",
+        "_HotelStay__type": "SINGLE",
+        "_HotelStay__idcard": "12345678Z",
+        "_HotelStay__localizer": "6a2bd6d3f3c6e5e5d3c1b0b4a7c61d5e",
+        "_HotelStay__arrival": 1719792000.0,
+        "_HotelStay__departure": 1719878400.0,
+        "_HotelStay__room_key": "a" * 64}
+CHECKOUT = {"room_key": "a" * 64, "checkout_time": 1719878400.0}
+
+
+class TestRecords(TestCase):
+    """Class for testing the immutable records"""
+    def test_records_round_trip(self):
+        """the records are encoded as the items they were decoded from"""
+        for record_class, item in ((ReservationRecord, RESERVATION),
+                                   (StayRecord, STAY),
+                                   (CheckoutRecord, CHECKOUT)):
+            with self.subTest(record_class.__name__):
+                record = record_class.from_json(item)
+                self.assertIsInstance(record, record_class)
+                self.assertEqual(record.to_json(), item)
+
+    def test_record_fields(self):
+        """the fields of the records have the values of their keys"""
+        reservation = ReservationRecord.from_json(RESERVATION)
+        self.assertEqual(reservation.localizer, "6a2bd6d3f3c6e5e5d3c1b0b4a7c61d5e")
+        self.assertEqual(reservation.num_days, 1)
+        stay = StayRecord.from_json(STAY)
+        self.assertEqual(stay.room_type, "SINGLE")
+        self.assertEqual(stay.departure, 1719878400.0)
+
+    def test_records_are_immutable(self):
+        """the records have no __dict__ and their fields cannot be changed"""
+        record = StayRecord.from_json(STAY)
+        self.assertFalse(hasattr(record, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.room_key = "b" * 64
+        with self.assertRaises(AttributeError):
+            record.extra = 1
+
+    def test_record_missing_key(self):
+        """an item without one of the keys is not a record"""
+        item = dict(CHECKOUT)
+        del item["checkout_time"]
+        with self.assertRaises(KeyError):
+            CheckoutRecord.from_json(item)
+
+    def test_load_records(self):
+        """the items of a store are loaded as records"""
+        with tempfile.TemporaryDirectory() as directory:
+            store_file = os.path.join(directory, "store_check_in.json")
+            self.assertEqual(JsonStore.load_records(store_file, StayRecord), [])
+            JsonStore.write_json(store_file, [STAY, STAY])
+            self.assertEqual(JsonStore.load_records(store_file, StayRecord),
+                             [StayRecord.from_json(STAY)] * 2)
+
+    def test_load_compact_records(self):
+        """the items of a compact store are read with their short keys,
+        the ones of its header or the current ones"""
+        with tempfile.TemporaryDirectory() as directory:
+            store_file = os.path.join(directory, "store_check_in.json")
+            JsonStore.write_json(store_file, [STAY, STAY], schema_version=COMPACT_SCHEMA)
+            self.assertEqual(JsonStore.load_records(store_file, StayRecord),
+                             [StayRecord.from_json(STAY)] * 2)
+            renamed = dict(encode_record(STAY))
+            renamed["x"] = renamed.pop("k")
+            JsonStore.write_json(store_file, [
+                {HEADER_KEY: COMPACT_SCHEMA, "keys": {"x": "_HotelStay__room_key"}},
+                renamed, encode_record(STAY)])
+            self.assertEqual(JsonStore.load_records(store_file, StayRecord),
+                             [StayRecord.from_json(STAY)] * 2)
@@ -0,0 +1,95 @@
+"""Test cases for the bulk import of reservations from CSV"""
+import csv
+import json
+import os
+import tempfile
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import JSON_FILES_PATH, HotelManagementException
+# pylint: disable=import-error
+from uc3m_travel.reservation_csv_importer import (iter_csv_import,
+                                                  import_reservations_csv,
+                                                  create_reservations)
+from uc3m_travel.storage.json_store import JsonStore
+from store_backup import StoreBackupMixin, reservation_request
+
+CASES_FILE = JSON_FILES_PATH + "GE2_TestCasesTemplate_2024_F1.csv"
+
+
+class TestReservationCsvImporter(StoreBackupMixin, TestCase):
+    """Class for testing the CSV importer"""
+    store_files = ["store_reservation.json", "store_reservation_index.json"]
+
+    @freeze_time("2024/03/22 13:00:00")
+    def test_import_test_cases(self):
+        """each row gets the result of the test cases file"""
+        with open(CASES_FILE, newline="", encoding="utf-8") as csvfile:
+            expected = {row_number: row["RESULT"] for row_number, row
+                        in enumerate(csv.DictReader(csvfile), start=2)}
+        results = dict(iter_csv_import(CASES_FILE, chunk_size=5, max_workers=2))
+        self.assertEqual(results.keys(), expected.keys())
+        for row_number, result in results.items():
+            with self.subTest(row_number):
+                self.assertEqual(result.get("localizer", result.get("error")),
+                                 expected[row_number])
+        saved = JsonStore.load_json_store(JSON_FILES_PATH + "store_reservation.json")
+        self.assertEqual(sorted(item["_HotelReservation__localizer"] for item in saved),
+                         sorted(result["localizer"] for result in results.values()
+                                if "localizer" in result))
+
+    def test_duplicates_and_errors_file(self):
+        """a row that repeats an id card of an earlier chunk is rejected"""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file = os.path.join(directory, "reservations.csv")
+            with open(csv_file, "w", encoding="utf-8", newline="") as file:
+                file.write("CREDIT_CARD_NUMBER,ID_CARD,NAME_SURNAME,PHONE_NUMBER,"
+                           "ROOM_TYPE,ARRIVAL,NUM_DAYS\n")
+                file.write("5105105105105100,12345678Z,JOSE LOPEZ,+341234567,"
+                           "SINGLE,01/07/2024,1\n")
+                file.write("5105105105105100,05270358T,JOSE SANCHO,+341234567,"
+                           "DOUBLE,01/07/2024,2\n")
+                file.write("5105105105105100,12345678Z,JOSE LOPEZ,+341234567,"
+                           "DOUBLE,01/08/2024,3\n")
+            errors_file = os.path.join(directory, "errors.jsonl")
+            summary = import_reservations_csv(csv_file, chunk_size=1,
+                                              max_workers=2, errors_file=errors_file)
+            with open(errors_file, "r", encoding="utf-8", newline="") as file:
+                errors = [json.loads(line) for line in file]
+        self.assertEqual(summary, {"rows": 3, "imported": 2, "rejected": 1})
+        self.assertEqual(errors, [{"row": 4,
+                                   "error": "This ID card has another reservation"}])
+
+    def test_missing_file(self):
+        """a missing CSV file raises the wrong file error"""
+        with self.assertRaises(HotelManagementException) as c_m:
+            import_reservations_csv(JSON_FILES_PATH + "missing.csv")
+        self.assertEqual(c_m.exception.message, "Wrong file or file path")
+
+    @freeze_time("2024/03/22 13:00:00")
+    def test_rows_with_wrong_fields(self):
+        """short and long rows are rejected without failing their chunk"""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file = os.path.join(directory, "reservations.csv")
+            with open(csv_file, "w", encoding="utf-8", newline="") as file:
+                file.write("CREDIT_CARD_NUMBER,ID_CARD,NAME_SURNAME,PHONE_NUMBER,"
+                           "ROOM_TYPE,ARRIVAL,NUM_DAYS\n")
+                file.write("5105105105105100,12345678Z,JOSE LOPEZ,+341234567,"
+                           "SINGLE,01/07/2024\n")
+                file.write("5105105105105100,05270358T,JOSE SANCHO,+341234567,"
+                           "DOUBLE,01/07/2024,2\n")
+                file.write("5105105105105100,87654321X,JOSE PEREZ,+341234567,"
+                           "DOUBLE,01/07/2024,2,EXTRA\n")
+            results = dict(iter_csv_import(csv_file, chunk_size=3, max_workers=1))
+        self.assertEqual(results[2], {"error": "CSV row with a wrong number of fields"})
+        self.assertIn("localizer", results[3])
+        self.assertEqual(results[4], {"error": "CSV row with a wrong number of fields"})
+
+    def test_chunk_with_none_field(self):
+        """a field that is not text fails only its row of the chunk"""
+        request = reservation_request()
+        results = create_reservations([(2, dict(request, id_card=None)), (3, request)],
+                                      1711112400.0)
+        self.assertIsInstance(results[0][1], str)
+        self.assertEqual(len(results[1][1].localizer), 32)
@@ -0,0 +1,64 @@
+"""Test cases for the reservation store index"""
+import os
+from unittest import TestCase
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         HotelManagementException)
+# pylint: disable=import-error
+from uc3m_travel.storage.reservation_index import ReservationIndex
+from uc3m_travel.storage.json_store import JsonStore
+from store_backup import StoreBackupMixin, SANCHO_FIELDS, make_reservation
+
+
+class TestReservationIndex(StoreBackupMixin, TestCase):
+    """Class for testing the reservation index"""
+    store_file = JSON_FILES_PATH + "store_reservation.json"
+    index_file = JSON_FILES_PATH + "store_reservation_index.json"
+    store_files = ["store_reservation.json", "store_reservation_index.json"]
+
+    def setUp(self):
+        """ the store has only the reservation of JOSE LOPEZ """
+        super().setUp()
+        make_reservation()
+
+    def test_index_is_written_with_the_store(self):
+        """the index has the reservation saved"""
+        index = ReservationIndex(self.store_file).load()
+        self.assertTrue(os.path.isfile(self.index_file))
+        self.assertEqual(index.position_of("450a53be9b39944e62e7164ca5f5aadf"), 0)
+        self.assertEqual(index.localizer_of("12345678Z"),
+                         "450a53be9b39944e62e7164ca5f5aadf")
+
+    def test_missing_index_is_rebuilt(self):
+        """the duplicated id card is detected after deleting the index"""
+        os.remove(self.index_file)
+        with self.assertRaises(HotelManagementException) as c_m:
+            make_reservation(room_type="DOUBLE", arrival_date="01/09/2024", num_days=3)
+        self.assertEqual(c_m.exception.message, "This ID card has another reservation")
+        self.assertTrue(os.path.isfile(self.index_file))
+
+    def test_stale_index_is_rebuilt(self):
+        """the index is rebuilt when the store is replaced"""
+        os.remove(self.store_file)
+        localizer = make_reservation(**SANCHO_FIELDS)
+        index = ReservationIndex(self.store_file).load()
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.position_of(localizer), 0)
+        self.assertIsNone(index.localizer_of("12345678Z"))
+
+    def test_new_reservations_are_logged(self):
+        """a new reservation is appended to the log of the index, the
+        snapshot is not written again"""
+        snapshot_stamp = JsonStore.file_stamp(self.index_file)
+        localizer = make_reservation(**SANCHO_FIELDS)
+        self.assertEqual(JsonStore.file_stamp(self.index_file), snapshot_stamp)
+        self.assertTrue(os.path.isfile(JSON_FILES_PATH + "store_reservation_index.jsonl"))
+        index = ReservationIndex(self.store_file).load()
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.position_of(localizer), 1)
+        self.assertEqual(index.localizer_of("05270358T"), localizer)
+
+    def test_loaded_index_does_not_change_the_cache(self):
+        """adding to a loaded index leaves the cached snapshot as it was"""
+        ReservationIndex(self.store_file).load().add("a" * 32, "05270358T", 1)
+        self.assertEqual(len(JsonStore.read_cached(self.index_file)["localizers"]), 1)
@@ -0,0 +1,109 @@
+"""Test cases for the room inventory and the availability of the rooms"""
+import os
+from datetime import date
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         HotelManager,
+                         HotelManagementException,
+                         RoomInventory)
+from store_backup import StoreBackupMixin, id_card, reservation_request
+
+
+def reservation(number, **fields):
+    """returns the arguments of a valid reservation"""
+    return reservation_request(id_card=id_card(number), **fields)
+
+
+@freeze_time("2024/03/22 13:00:00")
+class TestRoomInventory(StoreBackupMixin, TestCase):
+    """Class for testing the room inventory of each storage backend"""
+    store_files = ["store_reservation.json", "store_reservation_index.json",
+                   "store_reservation_occupancy_index.json",
+                   "store_hotel.db", "store_hotel.db-wal", "store_hotel.db-shm"]
+
+    def tearDown(self):
+        """ restores the stores, the json backend and the unlimited rooms """
+        HotelManager().set_storage_backend("json")
+        HotelManager().set_room_inventory(None)
+        super().tearDown()
+
+    def test_unlimited_by_default(self):
+        """without inventory the rooms are not limited"""
+        mngr = HotelManager()
+        self.assertIsNone(mngr.room_inventory)
+        for number in range(3):
+            mngr.room_reservation(**reservation(number))
+        availability = mngr.room_availability(date(2024, 7, 1), 1)
+        self.assertEqual(availability,
+                         {"2024-07-01": {"SINGLE": None, "DOUBLE": None, "SUITE": None}})
+
+    def test_full_rooms_rejected(self):
+        """a reservation is rejected when its room type is full any night"""
+        self.for_each_backend(self.check_full_rooms_rejected)
+
+    def check_full_rooms_rejected(self, mngr):
+        """ the full rooms of the backend of the manager """
+        mngr.set_room_inventory({"SINGLE": 2, "DOUBLE": 1})
+        mngr.room_reservation(**reservation(1, num_days=3))
+        mngr.room_reservation(**reservation(2, arrival_date="03/07/2024"))
+        with self.assertRaises(HotelManagementException) as c_m:
+            mngr.room_reservation(**reservation(3, arrival_date="02/07/2024", num_days=2))
+        self.assertEqual(c_m.exception.message,
+                         "No rooms available for the reservation dates")
+        # the nights that are not full can be booked
+        mngr.room_reservation(**reservation(4, arrival_date="02/07/2024"))
+        mngr.room_reservation(**reservation(5, arrival_date="04/07/2024"))
+        mngr.room_reservation(**reservation(6, room_type="DOUBLE", arrival_date="03/07/2024"))
+        mngr.room_reservation(**reservation(7, room_type="SUITE", arrival_date="03/07/2024"))
+        availability = mngr.room_availability(date(2024, 7, 1), 4)
+        self.assertEqual([day["SINGLE"] for day in availability.values()], [1, 0, 0, 1])
+        self.assertEqual(availability["2024-07-03"],
+                         {"SINGLE": 0, "DOUBLE": 0, "SUITE": None})
+
+    def test_batch_books_in_order(self):
+        """the reservations of a batch book the rooms one after another"""
+        self.for_each_backend(self.check_batch_books_in_order)
+
+    def check_batch_books_in_order(self, mngr):
+        """ the batch of the backend of the manager """
+        mngr.set_room_inventory(RoomInventory({"SUITE": 1}))
+        results = mngr.room_reservations(
+            [reservation(1, room_type="SUITE"),
+             reservation(2, room_type="SUITE"),
+             reservation(3, room_type="SUITE", arrival_date="02/07/2024")])
+        self.assertIn("localizer", results[0])
+        self.assertEqual(results[1],
+                         {"error": "No rooms available for the reservation dates"})
+        self.assertIn("localizer", results[2])
+
+    def test_occupancy_rebuilt(self):
+        """the occupancy of the reservations saved without inventory is
+        rebuilt from the store"""
+        mngr = HotelManager()
+        mngr.room_reservation(**reservation(1))
+        mngr.set_room_inventory({"SINGLE": 1})
+        with self.assertRaises(HotelManagementException):
+            mngr.room_reservation(**reservation(2))
+        os.remove(JSON_FILES_PATH + "store_reservation_occupancy_index.json")
+        with self.assertRaises(HotelManagementException):
+            mngr.room_reservation(**reservation(3))
+
+    def test_availability_default_days(self):
+        """the availability starts today and covers 90 days"""
+        mngr = HotelManager()
+        mngr.set_room_inventory({"DOUBLE": 5})
+        availability = mngr.room_availability()
+        self.assertEqual(len(availability), 90)
+        self.assertEqual(list(availability)[0], "2024-03-22")
+        self.assertEqual(availability["2024-06-19"]["DOUBLE"], 5)
+
+    def test_invalid_inventory(self):
+        """the room types must exist and their rooms be natural numbers"""
+        for rooms in ({"TRIPLE": 1}, {"SINGLE": -1}, {"SINGLE": "2"}):
+            with self.subTest(rooms=rooms):
+                with self.assertRaises(ValueError) as c_m:
+                    RoomInventory(rooms)
+                self.assertEqual(str(c_m.exception), "Invalid room inventory")
@@ -0,0 +1,140 @@
+"""Test cases for the sharded json stores"""
+import os
+import tempfile
+from unittest import TestCase
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         JSON_FILES_GUEST_ARRIVAL,
+                         HotelManager,
+                         HotelManagementException)
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.sharding import ShardedStore, MonthShardRouter, HashShardRouter
+from uc3m_travel.storage.shard_rebalance import rebalance_store
+from store_backup import (StoreBackupMixin, ROOM_KEY_OK, SANCHO_FIELDS, make_reservation,
+                          reservation_request)
+
+
+def reservation(localizer, id_card, arrival):
+    """a reservation store item"""
+    return {"_HotelReservation__localizer": localizer,
+            "_HotelReservation__id_card": id_card,
+            "_HotelReservation__arrival": arrival}
+
+
+class TestShardedStore(StoreBackupMixin, TestCase):
+    """Class for testing the stores split in shards"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json"]
+
+    def setUp(self):
+        """ there are no stores and the manager uses the shards by month """
+        super().setUp()
+        HotelManager().enable_sharding()
+
+    def tearDown(self):
+        """ go back to the json stores """
+        HotelManager().set_storage_backend("json")
+        ShardedStore.router = MonthShardRouter()
+        super().tearDown()
+
+    def test_sharded_flow(self):
+        """reservation, arrival and checkout only use the shards of july"""
+        self.assertEqual(make_reservation(), "450a53be9b39944e62e7164ca5f5aadf")
+        make_reservation(id_card="05270358T", arrival_date="01/08/2024")
+        self.assertFalse(os.path.exists(JSON_FILES_PATH + "store_reservation.json"))
+        self.assertEqual(len(JsonStore.load_json_store(
+            JSON_FILES_PATH + "store_reservation.2024-07.json")), 1)
+        self.assertEqual(len(JsonStore.load_json_store(
+            JSON_FILES_PATH + "store_reservation.2024-08.json")), 1)
+        self.check_arrival(HotelManager())
+        self.assertEqual(len(JsonStore.load_json_store(
+            JSON_FILES_PATH + "store_check_in.2024-07.json")), 1)
+        self.check_checkout(HotelManager())
+
+    def test_id_card_in_other_shard(self):
+        """an id card with a reservation in another month cannot reserve"""
+        make_reservation()
+        with self.assertRaises(HotelManagementException) as c_m:
+            make_reservation(arrival_date="01/08/2024")
+        self.assertEqual(c_m.exception.message, "This ID card has another reservation")
+        results = HotelManager().room_reservations([
+            reservation_request(arrival_date=arrival_date, **SANCHO_FIELDS)
+            for arrival_date in ("01/09/2024", "01/10/2024")])
+        self.assertIn("localizer", results[0])
+        self.assertEqual(results[1], {"error": "This ID card has another reservation"})
+
+    def test_arrival_other_day(self):
+        """a reservation of another month gives the errors of the json stores"""
+        with freeze_time("2024/07/01 13:00:00"):
+            with self.assertRaises(HotelManagementException) as c_m:
+                HotelManager().guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        self.assertEqual(c_m.exception.message, "Error: store reservation not found")
+        make_reservation()
+        with freeze_time("2024/06/01 13:00:00"):
+            with self.assertRaises(HotelManagementException) as c_m:
+                HotelManager().guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        self.assertEqual(c_m.exception.message, "Error: today is not reservation date")
+
+    def test_checkout_without_stays(self):
+        """the checkout needs the shards of the check in store"""
+        with self.assertRaises(HotelManagementException) as c_m:
+            HotelManager().guest_checkout(ROOM_KEY_OK)
+        self.assertEqual(c_m.exception.message, "Error: store checkin not found")
+        self.assertEqual(HotelManager().guest_checkouts([ROOM_KEY_OK, "bad"]),
+                         [{"error": "Error: store checkin not found"},
+                          {"error": "Invalid room key format"}])
+
+    def test_sharded_by_localizer(self):
+        """the shards by localizer prefix are found from the localizer"""
+        HotelManager().enable_sharding(HashShardRouter(prefix_length=2))
+        make_reservation()
+        self.assertTrue(os.path.exists(JSON_FILES_PATH + "store_reservation.45.json"))
+        mngr = HotelManager()
+        with freeze_time("2024/07/01 13:00:00"):
+            self.assertEqual(mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json"),
+                             ROOM_KEY_OK)
+        self.assertTrue(os.path.exists(JSON_FILES_PATH + "store_check_in.45.json"))
+        with freeze_time("2024-07-02"):
+            self.assertEqual(mngr.guest_checkouts([ROOM_KEY_OK, ROOM_KEY_OK]),
+                             [{"room_key": ROOM_KEY_OK},
+                              {"error": "Guest is already out"}])
+
+    def test_broken_shard_is_reported(self):
+        """a shard that cannot be read raises its error, it is not taken
+        as a shard without the localizer"""
+        make_reservation(arrival_date="01/08/2024")
+        with open(JSON_FILES_PATH + "store_reservation.2024-07.json", "w",
+                  encoding="utf-8") as file:
+            file.write("[{")
+        with freeze_time("2024/07/01 13:00:00"), \
+                self.assertRaises(HotelManagementException) as c_m:
+            HotelManager().guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        self.assertEqual(c_m.exception.message, "JSON Decode Error - Wrong JSON Format")
+
+    def test_rebalance(self):
+        """a single file store is split by month and then by localizer"""
+        with tempfile.TemporaryDirectory() as directory:
+            my_file = os.path.join(directory, "store_reservation.json")
+            JsonStore.write_json(my_file, [reservation("a1", "1", "01/07/2024"),
+                                           reservation("b2", "2", "02/07/2024"),
+                                           reservation("a3", "3", "01/08/2024")])
+            month_router = MonthShardRouter()
+            self.assertEqual(rebalance_store(my_file, month_router), {"2024-07": 2,
+                                                                      "2024-08": 1})
+            # rebalanced again from the kept source nothing is repeated
+            self.assertEqual(rebalance_store(my_file, month_router, remove_source=True),
+                             {"2024-07": 2, "2024-08": 1})
+            self.assertFalse(os.path.exists(my_file))
+            self.assertEqual(
+                [item["_HotelReservation__localizer"] for item in JsonStore.load_json_store(
+                    os.path.join(directory, "store_reservation.2024-07.json"))],
+                ["a1", "b2"])
+            self.assertEqual(rebalance_store(my_file, HashShardRouter(), month_router,
+                                             remove_source=True),
+                             {"a": 2, "b": 1})
+            self.assertEqual(sorted(os.listdir(directory)),
+                             ["store_reservation.a.json", "store_reservation.b.json",
+                              "store_reservation.json.lock"])
@@ -0,0 +1,133 @@
+"""Test cases for the SQLite storage backend"""
+from unittest import TestCase
+from unittest.mock import patch
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         JSON_FILES_GUEST_ARRIVAL,
+                         HotelManager,
+                         HotelManagementException)
+# pylint: disable=import-error
+from uc3m_travel.storage.sqlite_migration import migrate_json_stores
+from uc3m_travel.storage.sqlite_store import SqliteStore
+from uc3m_travel.storage.reservation_sqlite_store import ReservationStoreSqlite
+from store_backup import StoreBackupMixin, ROOM_KEY_OK, make_reservation
+
+
+class TestSqliteStore(StoreBackupMixin, TestCase):
+    """Class for testing the SQLite stores"""
+    db_file = JSON_FILES_PATH + "store_hotel.db"
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json",
+                   "store_hotel.db", "store_hotel.db-wal", "store_hotel.db-shm"]
+
+    def setUp(self):
+        """ the stores and the database do not exist and the manager uses it """
+        super().setUp()
+        HotelManager().set_storage_backend("sqlite")
+
+    def tearDown(self):
+        """ go back to the json stores """
+        HotelManager().set_storage_backend("json")
+        super().tearDown()
+
+    def test_concurrent_duplicate_reservation(self):
+        """a reservation saved by another process after the checks is
+        reported as a duplicate, not as a database error"""
+        make_reservation()
+        checks = []
+
+        def missed_check(connection, column, value):
+            # the first checks do not see the reservation, as if it had
+            # been saved right after them
+            checks.append(column)
+            if len(checks) <= 2:
+                return False
+            return original_exists(connection, column, value)
+
+        # pylint: disable=protected-access
+        original_exists = ReservationStoreSqlite._exists
+        with patch.object(ReservationStoreSqlite, "_exists",
+                          staticmethod(missed_check)), \
+                self.assertRaises(HotelManagementException) as c_m:
+            make_reservation()
+        self.assertEqual(c_m.exception.message, "Reservation already exists")
+
+    @staticmethod
+    def missing_first(table):
+        """ select_record as if the record checked first in the table had
+        been saved right after the check """
+        original_select = SqliteStore.select_record
+        missed = []
+
+        def missed_select(connection, select_table, *args):
+            if select_table == table and not missed:
+                missed.append(select_table)
+                return None
+            return original_select(connection, select_table, *args)
+        return patch.object(SqliteStore, "select_record", staticmethod(missed_select))
+
+    def test_concurrent_duplicate_stay(self):
+        """an arrival or a checkout saved by another process after the
+        checks fails its guest with the duplicate error, not the batch with
+        a database error"""
+        make_reservation()
+        mngr = HotelManager()
+        with freeze_time("2024/07/01 13:00:00"):
+            mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+            with self.missing_first("stays"), \
+                    self.assertRaises(HotelManagementException) as c_m:
+                mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        self.assertEqual(c_m.exception.message, "ckeckin  ya realizado")
+        with freeze_time("2024-07-02"):
+            mngr.guest_checkout(ROOM_KEY_OK)
+            with self.missing_first("checkouts"), \
+                    self.assertRaises(HotelManagementException) as c_m:
+                mngr.guest_checkout(ROOM_KEY_OK)
+        self.assertEqual(c_m.exception.message, "Guest is already out")
+
+    def test_sqlite_flow(self):
+        """reservation, arrival and checkout are saved in the database"""
+        self.assertEqual(make_reservation(), "450a53be9b39944e62e7164ca5f5aadf")
+        with self.assertRaises(HotelManagementException) as c_m:
+            make_reservation()
+        self.assertEqual(c_m.exception.message, "Reservation already exists")
+        self.check_arrival(HotelManager())
+        self.check_checkout(HotelManager())
+
+    def test_sqlite_wrong_id_card(self):
+        """the id card is checked against the stored reservation"""
+        make_reservation()
+        mngr = HotelManager()
+        with freeze_time("2024/07/01 13:00:00"):
+            with self.assertRaises(HotelManagementException) as c_m:
+                mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_nok.json")
+        self.assertEqual(c_m.exception.message,
+                         "Error: Localizer is not correct for this IdCard")
+
+    def test_sqlite_no_store(self):
+        """without database the errors are the ones of the missing stores"""
+        mngr = HotelManager()
+        with self.assertRaises(HotelManagementException) as c_m:
+            mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        self.assertEqual(c_m.exception.message, "Error: store reservation not found")
+        self.remove_stores()
+        with self.assertRaises(HotelManagementException) as c_m:
+            mngr.guest_checkout(ROOM_KEY_OK)
+        self.assertEqual(c_m.exception.message, "Error: store checkin not found")
+
+    def test_migrate_json_stores(self):
+        """the json stores are imported, name mangled keys included"""
+        HotelManager().set_storage_backend("json")
+        make_reservation()
+        with freeze_time("2024/07/01 13:00:00"):
+            HotelManager().guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+
+        self.assertEqual(migrate_json_stores(db_file=self.db_file),
+                         {"reservations": 1, "stays": 1, "checkouts": 0})
+        self.assertEqual(migrate_json_stores(db_file=self.db_file),
+                         {"reservations": 0, "stays": 0, "checkouts": 0})
+        HotelManager().set_storage_backend("sqlite")
+        with freeze_time("2024-07-02"):
+            self.assertTrue(HotelManager().guest_checkout(ROOM_KEY_OK))
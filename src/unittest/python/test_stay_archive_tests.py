@@ -0,0 +1,152 @@
+"""Test cases for the archive of the stays checked out"""
+import hashlib
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         JSON_FILES_GUEST_ARRIVAL,
+                         HotelManager,
+                         HotelManagementException)
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from uc3m_travel.storage.stay_archive import (archive_stays, archive_files,
+                                              iter_archived_stays)
+from store_backup import StoreBackupMixin, make_reservation
+
+ROOM_KEY_OK = "4f57880d4240350db9b276c84edaacc923a63906a408cc8da2b52c49213d3859"
+JULY = 1719878400.0
+AUGUST = 1722556800.0
+
+
+def stay(number, departure):
+    """a check in store item"""
+    return {"_HotelStay__algorithm": "SHA-256",
+            "_HotelStay__type": "SINGLE",
+            "_HotelStay__idcard": "12345678Z",
+            "_HotelStay__localizer": hashlib.md5(str(number).encode()).hexdigest(),
+            "_HotelStay__arrival": departure - 86400,
+            "_HotelStay__departure": departure,
+            "_HotelStay__room_key": hashlib.sha256(str(number).encode()).hexdigest()}
+
+
+def checkout(number):
+    """a checkout store item"""
+    return {"room_key": hashlib.sha256(str(number).encode()).hexdigest(),
+            "checkout_time": JULY}
+
+
+class TestStayArchive(TestCase):
+    """Class for testing the archival of the stays"""
+    def setUp(self):
+        """a check in store with two stays in july and one in august"""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store_file = os.path.join(self.directory.name, "store_check_in.json")
+        self.checkout_file = os.path.join(self.directory.name, "store_check_out.json")
+        self.stays = [stay(0, JULY), stay(1, JULY), stay(2, AUGUST)]
+        JsonStore.write_json(self.store_file, self.stays)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_archive_checked_out_stays(self):
+        """the stays checked out go to the archive of their month"""
+        JsonStore.write_json(self.checkout_file, [checkout(0), checkout(2)])
+        self.assertEqual(archive_stays(self.store_file, self.checkout_file),
+                         {"2024-07": 1, "2024-08": 1})
+        self.assertEqual(JsonStore.load_json_store(self.store_file), [self.stays[1]])
+        self.assertEqual([month for month, _ in archive_files(self.store_file)],
+                         ["2024-07", "2024-08"])
+        self.assertEqual(list(iter_archived_stays(self.store_file)),
+                         [self.stays[0], self.stays[2]])
+        self.assertEqual(list(iter_archived_stays(self.store_file, months=["2024-08"])),
+                         [self.stays[2]])
+        self.assertEqual(archive_stays(self.store_file, self.checkout_file), {})
+
+    def test_interrupted_archival(self):
+        """a run stopped before rewriting the check in store does not
+        archive its stays twice"""
+        JsonStore.write_json(self.checkout_file, [checkout(0), checkout(2)])
+        with patch.object(JsonStore, "write_json", side_effect=OSError), \
+                self.assertRaises(OSError):
+            archive_stays(self.store_file, self.checkout_file)
+        self.assertEqual(len(JsonStore.load_json_store(self.store_file)), 3)
+        self.assertEqual(archive_stays(self.store_file, self.checkout_file), {})
+        self.assertEqual(JsonStore.load_json_store(self.store_file), [self.stays[1]])
+        self.assertEqual(list(iter_archived_stays(self.store_file)),
+                         [self.stays[0], self.stays[2]])
+
+    def test_archive_synced_before_store(self):
+        """the archives are on disk before the check in store is rewritten"""
+        JsonStore.write_json(self.checkout_file, [checkout(0), checkout(2)])
+        synced = []
+        original_fsync = os.fsync
+
+        def record_fsync(file_descriptor):
+            synced.append(os.fstat(file_descriptor).st_ino)
+            original_fsync(file_descriptor)
+
+        def check_archives(*_):
+            for _, my_file in archive_files(self.store_file):
+                self.assertIn(os.stat(my_file).st_ino, synced)
+            self.assertIn(os.stat(self.directory.name).st_ino, synced)
+
+        with patch.object(os, "fsync", side_effect=record_fsync), \
+                patch.object(JsonStore, "write_json", side_effect=check_archives) as write:
+            archive_stays(self.store_file, self.checkout_file)
+        write.assert_called_once()
+
+    def test_archives_are_appended(self):
+        """a later archival adds its stays to the archive of the month"""
+        for compression in ("gzip", "lzma"):
+            with self.subTest(compression=compression):
+                JsonStore.write_json(self.store_file, self.stays)
+                for _, my_file in archive_files(self.store_file):
+                    os.remove(my_file)
+                JsonStore.write_json(self.checkout_file, [checkout(0)])
+                archive_stays(self.store_file, self.checkout_file, compression)
+                JsonStore.write_json(self.checkout_file, [checkout(0), checkout(1)])
+                self.assertEqual(archive_stays(self.store_file, self.checkout_file,
+                                               compression), {"2024-07": 1})
+                self.assertEqual(list(iter_archived_stays(self.store_file)),
+                                 self.stays[:2])
+                self.assertEqual(JsonStore.load_json_store(self.store_file),
+                                 [self.stays[2]])
+
+    def test_archive_without_stores(self):
+        """nothing is archived without check in store"""
+        os.remove(self.store_file)
+        self.assertEqual(archive_stays(self.store_file, self.checkout_file), {})
+        self.assertEqual(list(iter_archived_stays(self.store_file)), [])
+
+
+class TestArchivedCheckout(StoreBackupMixin, TestCase):
+    """Class for testing the checkout of archived stays"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json"]
+
+    def tearDown(self):
+        """ removes the archives and restores the stores """
+        for _, my_file in archive_files(JSON_FILES_PATH + "store_check_in.json"):
+            os.remove(my_file)
+        super().tearDown()
+
+    def test_archived_guest_is_out(self):
+        """a checkout of an archived stay is rejected as already done"""
+        mngr = HotelManager()
+        make_reservation()
+        with freeze_time("2024/07/01 13:00:00"):
+            mngr.guest_arrival(JSON_FILES_GUEST_ARRIVAL + "key_ok.json")
+        with freeze_time("2024-07-02"):
+            mngr.guest_checkout(ROOM_KEY_OK)
+            self.assertEqual(archive_stays(), {"2024-07": 1})
+            self.assertEqual(JsonStore.load_json_store(
+                JSON_FILES_PATH + "store_check_in.json"), [])
+            with self.assertRaises(HotelManagementException) as c_m:
+                mngr.guest_checkout(ROOM_KEY_OK)
+            self.assertEqual(c_m.exception.message, "Guest is already out")
+            self.assertEqual(mngr.guest_checkouts([ROOM_KEY_OK]),
+                             [{"error": "Guest is already out"}])
@@ -0,0 +1,54 @@
+"""Test cases for the concurrent writes of the json stores"""
+import json
+import multiprocessing
+import os
+from unittest import TestCase
+# pylint: disable=import-error
+from uc3m_travel import HotelManager, HotelManagementException, JSON_FILES_PATH
+# pylint: disable=import-error
+from uc3m_travel.storage.json_store import JsonStore
+from store_backup import StoreBackupMixin, id_card, reservation_request
+
+PROCESSES = 4
+RESERVATIONS = 10
+
+
+def make_reservations(worker):
+    """the reservations of a worker process, each one with its own id card"""
+    for number in range(worker * 1000, worker * 1000 + RESERVATIONS):
+        HotelManager().room_reservation(**reservation_request(id_card=id_card(number)))
+
+
+class TestStoreLock(StoreBackupMixin, TestCase):
+    """Class for testing the locked, atomic writes"""
+    store_file = JSON_FILES_PATH + "store_reservation.json"
+    store_files = ["store_reservation.json", "store_reservation_index.json"]
+
+    def test_no_lost_updates(self):
+        """reservations made by several processes at once are all saved"""
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=make_reservations, args=(worker,))
+                   for worker in range(PROCESSES)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+        with open(self.store_file, "r", encoding="utf-8", newline="") as file:
+            self.assertEqual(len(json.load(file)), PROCESSES * RESERVATIONS)
+
+    def test_atomic_replace(self):
+        """the store is replaced, no temporary file is left behind"""
+        JsonStore.write_json(self.store_file, [{"a": 1}])
+        first_inode = os.stat(self.store_file).st_ino
+        JsonStore.write_json(self.store_file, [{"a": 2}])
+        self.assertNotEqual(os.stat(self.store_file).st_ino, first_inode)
+        self.assertEqual(JsonStore.load_json_store(self.store_file), [{"a": 2}])
+        self.assertEqual([name for name in os.listdir(JSON_FILES_PATH)
+                          if name.endswith(".tmp")], [])
+
+    def test_wrong_path(self):
+        """writing in a directory that does not exist fails as before"""
+        with self.assertRaises(HotelManagementException) as c_m:
+            JsonStore.write_json(JSON_FILES_PATH + "missing/store.json", [])
+        self.assertEqual(c_m.exception.message, "Wrong file  or file path")
@@ -0,0 +1,105 @@
+"""Test cases for the synthetic data generator"""
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import patch
+# pylint: disable=import-error
+from freezegun import freeze_time
+# pylint: disable=import-error
+from uc3m_travel import (JSON_FILES_PATH,
+                         HotelManager,
+                         HotelManagementException)
+from uc3m_travel import synthetic_data
+from uc3m_travel.synthetic_data import (SyntheticData, write_stores,
+                                        write_arrival_files, TAMPERED)
+from store_backup import StoreBackupMixin
+
+
+class TestSyntheticData(StoreBackupMixin, TestCase):
+    """Class for testing the synthetic data generator"""
+    store_files = ["store_reservation.json", "store_check_in.json",
+                   "store_check_out.json", "store_reservation_index.json"]
+
+    def check_requests(self, generator, count):
+        """the requests give the error expected for them, or none"""
+        requests, errors = generator.reservation_requests(count)
+        mngr = HotelManager()
+        for request, error in zip(requests, errors):
+            try:
+                mngr.create_reservation(**request)
+            except HotelManagementException as exception:
+                self.assertEqual(exception.message, error, request)
+            else:
+                self.assertIsNone(error, request)
+        return requests, errors
+
+    def test_valid_requests(self):
+        """without invalid fraction every request is valid"""
+        for numpy_module in (synthetic_data.np, None):
+            with self.subTest(numpy=numpy_module is not None):
+                with patch.object(synthetic_data, "np", numpy_module):
+                    requests, errors = self.check_requests(SyntheticData(seed=3), 500)
+                self.assertEqual(errors, [None] * 500)
+                self.assertEqual(len({request["id_card"] for request in requests}), 500)
+
+    def test_invalid_fraction(self):
+        """a fraction of the requests fail with the error of their broken field"""
+        for numpy_module in (synthetic_data.np, None):
+            with self.subTest(numpy=numpy_module is not None):
+                with patch.object(synthetic_data, "np", numpy_module):
+                    _, errors = self.check_requests(
+                        SyntheticData(seed=3, invalid_fraction=0.3), 1000)
+                invalid = sum(error is not None for error in errors)
+                self.assertTrue(200 < invalid < 400, invalid)
+                self.assertEqual(set(errors) - {None},
+                                 set(synthetic_data.INVALID_REQUESTS.values()))
+
+    def test_deterministic(self):
+        """the same seed gives the same data and another seed other data"""
+        first = SyntheticData(seed=7, invalid_fraction=0.1).reservation_requests(100)
+        self.assertEqual(first,
+                         SyntheticData(seed=7, invalid_fraction=0.1).reservation_requests(100))
+        other = SyntheticData(seed=8, invalid_fraction=0.1).reservation_requests(100)
+        self.assertNotEqual(first[0], other[0])
+        with self.assertRaises(ValueError):
+            SyntheticData(invalid_fraction=1.5)
+
+    def test_stores_and_arrivals(self):
+        """the guests of the generated store arrive, except the ones of the
+        tampered reservations and of the invalid arrival files"""
+        generator = SyntheticData(seed=5, invalid_fraction=0.3, arrival_days=1)
+        reservations, stays, checkouts, errors = generator.store_records(
+            60, arrived_fraction=0)
+        self.assertEqual((stays, checkouts), ([], []))
+        self.assertIn(TAMPERED, errors)
+        arrivals, arrival_errors = generator.arrivals(reservations, errors)
+        self.assertEqual(len(set(arrival_errors)), 4)
+        write_stores(JSON_FILES_PATH, reservations, stays, checkouts)
+        mngr = HotelManager()
+        with tempfile.TemporaryDirectory() as directory, \
+                freeze_time("2024-07-01 13:00:00"):
+            for input_file, error in zip(write_arrival_files(directory, arrivals),
+                                         arrival_errors):
+                if error is None:
+                    self.assertEqual(len(mngr.guest_arrival(input_file)), 64)
+                    continue
+                with self.assertRaises(HotelManagementException) as c_m:
+                    mngr.guest_arrival(input_file)
+                self.assertEqual(c_m.exception.message, error)
+
+    def test_stays_check_out(self):
+        """the stays of the generated store that did not leave can check out"""
+        reservations, stays, checkouts, _ = SyntheticData(seed=5).store_records(40)
+        self.assertEqual(len(reservations), 40)
+        left = {checkout["room_key"] for checkout in checkouts}
+        self.assertTrue(left)
+        write_stores(JSON_FILES_PATH, reservations, stays, checkouts)
+        mngr = HotelManager()
+        for stay in stays:
+            departure = datetime.fromtimestamp(stay["_HotelStay__departure"])
+            with freeze_time(departure):
+                if stay["_HotelStay__room_key"] in left:
+                    with self.assertRaises(HotelManagementException):
+                        mngr.guest_checkout(stay["_HotelStay__room_key"])
+                else:
+                    self.assertTrue(mngr.guest_checkout(stay["_HotelStay__room_key"]))